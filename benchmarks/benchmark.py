@@ -0,0 +1,242 @@
+"""
+Benchmark de rendimiento del Analizador Lexile
+Mide por separado cada etapa del análisis (extracción de PDF, spaCy,
+cálculo de métricas y puntaje) sobre un corpus sintético de tamaños
+fijos, y reporta throughput, latencia y memoria en JSON
+
+Uso:
+    python benchmarks/benchmark.py --salida resultados.json
+    python benchmarks/benchmark.py --tamanos parrafo pagina --perfil ligero
+    python benchmarks/benchmark.py --baseline baseline.json --tolerancia 0.15
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(RAIZ, 'src'))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from corpus_sintetico import TAMANOS, generar_corpus, escribir_pdf
+
+
+# Documentos analizados por tamaño
+DOCUMENTOS = {
+    'parrafo': 200,
+    'pagina': 50,
+    'capitulo': 10,
+    'libro': 2,
+}
+
+# Etapas medidas, en orden
+ETAPAS = ['extraccion_pdf', 'nlp', 'metricas', 'puntaje', 'total']
+
+
+def _resumir(tiempos, tokens):
+    """Calcula throughput y latencias de una etapa."""
+    tiempos = np.array(tiempos)
+    total = float(tiempos.sum())
+    return {
+        'docs_por_segundo': round(len(tiempos) / total, 2) if total else None,
+        'tokens_por_segundo': round(tokens / total, 1) if total else None,
+        'p50_ms': round(float(np.percentile(tiempos, 50)) * 1000, 3),
+        'p99_ms': round(float(np.percentile(tiempos, 99)) * 1000, 3),
+    }
+
+
+def medir_tamano(tamano, perfil='completo', semilla=0):
+    """
+    Mide todas las etapas para un tamaño de texto.
+    
+    Args:
+        tamano: Clave de TAMANOS
+        perfil: Perfil de pipeline de spaCy
+        semilla: Semilla del corpus sintético
+        
+    Returns:
+        dict: Métricas por etapa y memoria máxima del proceso
+    """
+    from analizador_lexile import AnalizadorLexileChile, AgregadosTexto
+    from utilidades import _extraer_texto_pdf
+    
+    textos = generar_corpus(tamano, DOCUMENTOS[tamano], semilla)
+    
+    with contextlib.redirect_stdout(sys.stderr):
+        analizador = AnalizadorLexileChile(perfil=perfil)
+        # Calentamiento: carga del modelo y primera llamada
+        analizador.analizar(textos[0][:1000])
+    
+    tiempos = {etapa: [] for etapa in ETAPAS}
+    tokens = 0
+    
+    with tempfile.TemporaryDirectory() as carpeta:
+        for i, texto in enumerate(textos):
+            ruta_pdf = os.path.join(carpeta, f'{i}.pdf')
+            escribir_pdf(texto, ruta_pdf)
+            
+            inicio = time.perf_counter()
+            with contextlib.redirect_stdout(sys.stderr):
+                _extraer_texto_pdf(ruta_pdf)
+            t_pdf = time.perf_counter()
+            
+            doc = analizador.nlp(texto)
+            t_nlp = time.perf_counter()
+            
+            agregados = AgregadosTexto().agregar(analizador._extraer_caracteristicas(doc))
+            t_metricas = time.perf_counter()
+            
+            analizador._resultado_desde_agregados(agregados)
+            t_puntaje = time.perf_counter()
+            
+            tiempos['extraccion_pdf'].append(t_pdf - inicio)
+            tiempos['nlp'].append(t_nlp - t_pdf)
+            tiempos['metricas'].append(t_metricas - t_nlp)
+            tiempos['puntaje'].append(t_puntaje - t_metricas)
+            tiempos['total'].append(t_puntaje - inicio)
+            tokens += len(doc)
+    
+    # ru_maxrss está en KB en Linux y en bytes en macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    rss_mb = rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024
+    
+    return {
+        'documentos': len(textos),
+        'tokens': tokens,
+        'palabras_por_documento': TAMANOS[tamano],
+        'etapas': {etapa: _resumir(tiempos[etapa], tokens) for etapa in ETAPAS},
+        'rss_maximo_mb': round(rss_mb, 1),
+    }
+
+
+def ejecutar(tamanos, perfil):
+    """
+    Mide cada tamaño en un proceso separado, para aislar la memoria.
+    
+    Args:
+        tamanos: Lista de claves de TAMANOS
+        perfil: Perfil de pipeline de spaCy
+        
+    Returns:
+        dict: Resultados por tamaño y datos del entorno
+    """
+    resultados = {}
+    for tamano in tamanos:
+        print(f"⏱️  Midiendo: {tamano}...", file=sys.stderr)
+        proceso = subprocess.run(
+            [sys.executable, os.path.abspath(__file__),
+             '--interno', tamano, '--perfil', perfil],
+            capture_output=True, text=True, check=True
+        )
+        resultados[tamano] = json.loads(proceso.stdout)
+    
+    return {
+        'entorno': {
+            'python': platform.python_version(),
+            'plataforma': platform.platform(),
+            'nucleos': os.cpu_count(),
+            'perfil': perfil,
+            'fecha': time.strftime('%Y-%m-%d %H:%M:%S'),
+        },
+        'tamanos': resultados,
+    }
+
+
+def comparar(actual, baseline, tolerancia):
+    """
+    Compara resultados con un baseline y detecta regresiones.
+    
+    Una etapa tiene regresión si su latencia p50 o p99 supera la del
+    baseline en más de ``tolerancia`` (fracción), o si su throughput
+    baja en la misma proporción. El uso de memoria se compara igual.
+    
+    Args:
+        actual: Resultados de ``ejecutar``
+        baseline: Resultados guardados previamente
+        tolerancia: Variación relativa aceptada (por ejemplo 0.10)
+        
+    Returns:
+        list: Descripción de cada regresión encontrada
+    """
+    regresiones = []
+    
+    for tamano, datos in actual['tamanos'].items():
+        base = baseline.get('tamanos', {}).get(tamano)
+        if base is None:
+            continue
+        
+        for etapa, metricas in datos['etapas'].items():
+            base_etapa = base['etapas'].get(etapa, {})
+            for clave in ('p50_ms', 'p99_ms'):
+                if base_etapa.get(clave) and metricas[clave] > base_etapa[clave] * (1 + tolerancia):
+                    regresiones.append(
+                        f"{tamano}/{etapa}: {clave} {base_etapa[clave]} → {metricas[clave]}"
+                    )
+            clave = 'docs_por_segundo'
+            if base_etapa.get(clave) and metricas[clave] < base_etapa[clave] * (1 - tolerancia):
+                regresiones.append(
+                    f"{tamano}/{etapa}: {clave} {base_etapa[clave]} → {metricas[clave]}"
+                )
+        
+        if datos['rss_maximo_mb'] > base['rss_maximo_mb'] * (1 + tolerancia):
+            regresiones.append(
+                f"{tamano}: rss_maximo_mb {base['rss_maximo_mb']} → {datos['rss_maximo_mb']}"
+            )
+    
+    return regresiones
+
+
+def main():
+    """Ejecuta el benchmark según los argumentos de línea de comandos."""
+    parser = argparse.ArgumentParser(description='Benchmark del Analizador Lexile')
+    parser.add_argument('--tamanos', nargs='+', choices=list(TAMANOS),
+                        default=list(TAMANOS), help='Tamaños a medir')
+    parser.add_argument('--perfil', choices=['completo', 'ligero'],
+                        default='completo', help='Perfil del pipeline de spaCy')
+    parser.add_argument('--salida', type=str,
+                        help='Archivo JSON donde guardar los resultados')
+    parser.add_argument('--baseline', type=str,
+                        help='Resultados JSON previos contra los que comparar')
+    parser.add_argument('--tolerancia', type=float, default=0.10,
+                        help='Variación relativa aceptada (por defecto 0.10)')
+    parser.add_argument('--interno', type=str, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    
+    if args.interno:
+        print(json.dumps(medir_tamano(args.interno, args.perfil)))
+        return
+    
+    resultados = ejecutar(args.tamanos, args.perfil)
+    texto = json.dumps(resultados, indent=2, ensure_ascii=False)
+    
+    if args.salida:
+        with open(args.salida, 'w', encoding='utf-8') as f:
+            f.write(texto + '\n')
+        print(f"✓ Resultados guardados en: {args.salida}", file=sys.stderr)
+    else:
+        print(texto)
+    
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regresiones = comparar(resultados, baseline, args.tolerancia)
+        if regresiones:
+            print(f"\n❌ {len(regresiones)} regresiones respecto a {args.baseline}:",
+                  file=sys.stderr)
+            for regresion in regresiones:
+                print(f"   • {regresion}", file=sys.stderr)
+            sys.exit(1)
+        print(f"\n✓ Sin regresiones respecto a {args.baseline}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
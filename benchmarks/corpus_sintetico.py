@@ -0,0 +1,174 @@
+"""
+Generador de corpus sintético en español para benchmarks
+Produce textos reproducibles (con semilla fija) de tamaños predefinidos,
+y puede escribirlos como PDF simple para medir la extracción
+"""
+
+import random
+
+
+# Tamaños predefinidos, en palabras aproximadas
+TAMANOS = {
+    'parrafo': 100,
+    'pagina': 500,
+    'capitulo': 5000,
+    'libro': 100000,
+}
+
+_DETERMINANTES = ['el', 'la', 'los', 'las', 'un', 'una', 'este', 'esta', 'su', 'cada']
+_SUSTANTIVOS = [
+    'niño', 'escuela', 'profesora', 'libro', 'ciudad', 'montaña', 'río',
+    'estudiante', 'historia', 'planta', 'energía', 'comunidad', 'territorio',
+    'biblioteca', 'cordillera', 'investigación', 'fotosíntesis', 'democracia',
+    'conocimiento', 'ecosistema', 'biodiversidad', 'patrimonio', 'lectura',
+]
+_VERBOS = [
+    'lee', 'observa', 'describe', 'recorre', 'explica', 'construye',
+    'analiza', 'transforma', 'comprende', 'investiga', 'representa',
+    'caracteriza', 'reconoce', 'protege', 'comparte',
+]
+_ADJETIVOS = [
+    'grande', 'pequeño', 'antiguo', 'nuevo', 'importante', 'complejo',
+    'fundamental', 'extraordinario', 'característico', 'sostenible',
+    'claro', 'verde', 'profundo', 'interesante',
+]
+_CONECTORES = [
+    'y', 'pero', 'porque', 'mientras', 'aunque', 'sin embargo', 'además',
+    'por lo tanto', 'cuando', 'donde',
+]
+_PREPOSICIONES = ['en', 'de', 'con', 'para', 'sobre', 'desde', 'hacia', 'entre']
+
+
+def _frase_nominal(azar):
+    frase = f"{azar.choice(_DETERMINANTES)} {azar.choice(_SUSTANTIVOS)}"
+    if azar.random() < 0.4:
+        frase += f" {azar.choice(_ADJETIVOS)}"
+    return frase
+
+
+def _oracion(azar):
+    partes = [_frase_nominal(azar), azar.choice(_VERBOS), _frase_nominal(azar)]
+    while azar.random() < 0.45:
+        if azar.random() < 0.5:
+            partes += [azar.choice(_PREPOSICIONES), _frase_nominal(azar)]
+        else:
+            partes += [azar.choice(_CONECTORES), _frase_nominal(azar),
+                       azar.choice(_VERBOS)]
+    oracion = ' '.join(partes)
+    return oracion[0].upper() + oracion[1:] + '.'
+
+
+def generar_texto(palabras, semilla=0):
+    """
+    Genera un texto sintético en español.
+    
+    Args:
+        palabras: Número aproximado de palabras
+        semilla: Semilla del generador, para resultados reproducibles
+        
+    Returns:
+        str: Texto con párrafos separados por líneas en blanco
+    """
+    azar = random.Random(semilla)
+    parrafos = []
+    total = 0
+    
+    while total < palabras:
+        oraciones = [_oracion(azar) for _ in range(azar.randint(3, 7))]
+        parrafo = ' '.join(oraciones)
+        parrafos.append(parrafo)
+        total += len(parrafo.split())
+    
+    return '\n\n'.join(parrafos)
+
+
+def generar_corpus(tamano, documentos, semilla=0):
+    """
+    Genera una lista de textos de un tamaño predefinido.
+    
+    Args:
+        tamano: Clave de TAMANOS ('parrafo', 'pagina', 'capitulo', 'libro')
+        documentos: Número de textos
+        semilla: Semilla base
+        
+    Returns:
+        list: Textos generados
+    """
+    palabras = TAMANOS[tamano]
+    return [generar_texto(palabras, semilla + i) for i in range(documentos)]
+
+
+def _escapar_pdf(linea):
+    return linea.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def escribir_pdf(texto, ruta, lineas_por_pagina=45, caracteres_por_linea=90):
+    """
+    Escribe un texto como PDF simple (Helvetica, WinAnsiEncoding).
+    
+    Args:
+        texto: Texto a escribir
+        ruta: Ruta del PDF a crear
+        lineas_por_pagina: Líneas de texto por página
+        caracteres_por_linea: Ancho máximo de cada línea
+    """
+    lineas = []
+    for parrafo in texto.split('\n'):
+        actual = ''
+        for palabra in parrafo.split():
+            if actual and len(actual) + len(palabra) + 1 > caracteres_por_linea:
+                lineas.append(actual)
+                actual = palabra
+            else:
+                actual = f"{actual} {palabra}" if actual else palabra
+        lineas.append(actual)
+    
+    paginas = [
+        lineas[i:i + lineas_por_pagina]
+        for i in range(0, len(lineas), lineas_por_pagina)
+    ] or [[]]
+    
+    objetos = [
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        None,
+        b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica'
+        b' /Encoding /WinAnsiEncoding >>',
+    ]
+    hijos = []
+    for pagina in paginas:
+        contenido = 'BT /F1 11 Tf 14 TL 50 760 Td ' + ' '.join(
+            f'({_escapar_pdf(linea)}) Tj T*' for linea in pagina
+        ) + ' ET'
+        contenido = contenido.encode('cp1252', errors='replace')
+        hijos.append(len(objetos) + 1)
+        objetos.append(
+            f'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792]'
+            f' /Contents {len(objetos) + 2} 0 R'
+            f' /Resources << /Font << /F1 3 0 R >> >> >>'.encode()
+        )
+        objetos.append(
+            f'<< /Length {len(contenido)} >>\nstream\n'.encode()
+            + contenido + b'\nendstream'
+        )
+    objetos[1] = (
+        f"<< /Type /Pages /Kids [{' '.join(f'{h} 0 R' for h in hijos)}]"
+        f" /Count {len(hijos)} >>"
+    ).encode()
+    
+    salida = bytearray(b'%PDF-1.4\n')
+    posiciones = []
+    for numero, objeto in enumerate(objetos, start=1):
+        posiciones.append(len(salida))
+        salida += f'{numero} 0 obj\n'.encode() + objeto + b'\nendobj\n'
+    
+    inicio_xref = len(salida)
+    salida += f'xref\n0 {len(objetos) + 1}\n0000000000 65535 f \n'.encode()
+    for posicion in posiciones:
+        salida += f'{posicion:010d} 00000 n \n'.encode()
+    salida += (
+        f'trailer\n<< /Size {len(objetos) + 1} /Root 1 0 R >>\n'
+        f'startxref\n{inicio_xref}\n%%EOF\n'
+    ).encode()
+    
+    with open(ruta, 'wb') as f:
+        f.write(salida)
@@ -0,0 +1,147 @@
+"""
+Benchmark de tiempo de inicio
+Mide el tiempo de importación de cada módulo del analizador y el de
+comandos rápidos de la línea de comandos, usando ``python -X importtime``
+
+Uso:
+    python benchmarks/tiempo_inicio.py
+    python benchmarks/tiempo_inicio.py --repeticiones 10 --json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC = os.path.join(RAIZ, 'src')
+
+# Módulos del analizador a medir
+MODULOS = [
+    'analizador_lexile',
+    'utilidades',
+    'cache',
+    'lexico',
+    'corpus',
+    'servidor',
+    'asincrono',
+]
+
+# Comandos de la línea de comandos a medir
+COMANDOS = {
+    'main.py --version': ['--version'],
+    'main.py --help': ['--help'],
+}
+
+
+def medir_importacion(modulo):
+    """
+    Mide la importación de un módulo en un proceso nuevo.
+    
+    Args:
+        modulo: Nombre del módulo dentro de src/
+        
+    Returns:
+        dict: Tiempo acumulado del módulo y de sus dependencias más
+            costosas, en milisegundos
+    """
+    proceso = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {modulo}'],
+        cwd=SRC, capture_output=True, text=True, check=True
+    )
+    
+    tiempos = {}
+    for linea in proceso.stderr.splitlines():
+        if not linea.startswith('import time:') or '|' not in linea:
+            continue
+        partes = [p.strip() for p in linea[len('import time:'):].split('|')]
+        try:
+            acumulado = int(partes[1])
+        except ValueError:
+            continue
+        nombre = partes[2].strip()
+        # Solo módulos de primer nivel (sin submódulos)
+        if '.' not in nombre:
+            tiempos[nombre] = max(tiempos.get(nombre, 0), acumulado)
+    
+    dependencias = sorted(
+        ((nombre, us) for nombre, us in tiempos.items()
+         if nombre not in (modulo, 'site', 'encodings')),
+        key=lambda x: x[1], reverse=True
+    )[:5]
+    
+    return {
+        'total_ms': round(tiempos.get(modulo, 0) / 1000, 1),
+        'dependencias_ms': {nombre: round(us / 1000, 1) for nombre, us in dependencias}
+    }
+
+
+def medir_comando(argumentos, repeticiones):
+    """
+    Mide el tiempo total de un comando de main.py.
+    
+    Args:
+        argumentos: Argumentos para main.py
+        repeticiones: Número de ejecuciones
+        
+    Returns:
+        dict: Mediana y mínimo en milisegundos
+    """
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        subprocess.run(
+            [sys.executable, os.path.join(RAIZ, 'main.py')] + argumentos,
+            capture_output=True, check=True
+        )
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+    
+    return {
+        'mediana_ms': round(statistics.median(tiempos), 1),
+        'minimo_ms': round(min(tiempos), 1)
+    }
+
+
+def main():
+    """Ejecuta el benchmark y muestra los resultados."""
+    parser = argparse.ArgumentParser(description='Benchmark de tiempo de inicio')
+    parser.add_argument('--repeticiones', type=int, default=5,
+                        help='Ejecuciones por comando (por defecto 5)')
+    parser.add_argument('--json', action='store_true',
+                        help='Mostrar los resultados en formato JSON')
+    args = parser.parse_args()
+    
+    resultados = {
+        'importacion': {modulo: medir_importacion(modulo) for modulo in MODULOS},
+        'comandos': {
+            nombre: medir_comando(argumentos, args.repeticiones)
+            for nombre, argumentos in COMANDOS.items()
+        }
+    }
+    
+    if args.json:
+        print(json.dumps(resultados, indent=2, ensure_ascii=False))
+        return
+    
+    print("=" * 70)
+    print("TIEMPO DE IMPORTACIÓN POR MÓDULO")
+    print("=" * 70)
+    for modulo, datos in resultados['importacion'].items():
+        print(f"{modulo:<25} {datos['total_ms']:>8} ms")
+        for nombre, ms in datos['dependencias_ms'].items():
+            print(f"   • {nombre:<20} {ms:>8} ms")
+    
+    print()
+    print("=" * 70)
+    print("TIEMPO DE COMANDOS")
+    print("=" * 70)
+    for nombre, datos in resultados['comandos'].items():
+        print(f"{nombre:<25} {datos['mediana_ms']:>8} ms (mín. {datos['minimo_ms']} ms)")
+
+
+if __name__ == '__main__':
+    main()
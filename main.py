@@ -6,13 +6,11 @@ Herramienta de línea de comandos para analizar textos en español
 import sys
 import os
 import argparse
+import functools
 
 # Agregar src al path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
-from analizador_lexile import AnalizadorLexileChile
-from utilidades import cargar_documento, analizar_pdf, comparar_textos, guardar_resultado
-
 
 def main():
     """Función principal del programa."""
@@ -28,11 +26,60 @@ Ejemplos de uso:
   # Analizar un PDF
   python main.py --file documento.pdf
   
+  # Extraer un PDF grande usando 8 procesos
+  python main.py --file libro.pdf --procesos-pdf 8
+  
   # Comparar múltiples textos
   python main.py --comparar texto1.txt texto2.pdf texto3.txt
   
+  # Comparar muchos archivos usando todos los núcleos
+  python main.py --comparar corpus/*.pdf --procesos 0
+  
   # Guardar resultado en archivo
   python main.py --file texto.txt --output resultado.txt
+  
+  # Recorrer un directorio (o un patrón glob) completo
+  python main.py --dir biblioteca/ --output resultados.jsonl
+  python main.py --dir "textos/**/*.txt" --tamano-max 20 --output resultados.csv
+  
+  # Exportar los resultados de un corpus (JSONL, CSV o Parquet)
+  python main.py --comparar corpus/*.pdf --output resultados.csv
+  python main.py --comparar corpus/*.pdf --output resultados.parquet --anexar
+  
+  # Trabajo reanudable: si se interrumpe, repetir el mismo comando
+  python main.py --comparar archivo/*.pdf --diario avance.sqlite3 --output resultados.jsonl --anexar
+  
+  # Guardar los documentos tokenizados y reevaluar sin volver a usar spaCy
+  python main.py --dir biblioteca/ --almacen documentos.sqlite3 --output v1.csv
+  python main.py --reevaluar --almacen documentos.sqlite3 --output v2.csv
+  
+  # Resumen del archivo por carpeta (p. ej. editorial/asignatura/curso/)
+  python main.py --dir archivo/ --agrupar 1 --resumen por_curso.json
+  python main.py --dir archivo/ --agrupar 3 --resumen por_editorial.json --output resultados.csv
+  
+  # Calibrar la fórmula con textos etiquetados por curso y usar el resultado
+  python main.py --calibrar etiquetas.csv parametros.json
+  python main.py --file texto.txt --parametros parametros.json
+  
+  # Servicio HTTP/JSON con el modelo precargado
+  python main.py --serve --puerto 8000
+  curl -d '{"texto": "El perro corre."}' http://127.0.0.1:8000/analizar
+  
+  # Usar una lista de frecuencias propia
+  python main.py --convertir-lexico frecuencias.tsv frecuencias.lex
+  python main.py --file texto.txt --lexico frecuencias.lex
+  
+  # Analizar sin usar la caché de resultados
+  python main.py --file texto.txt --sin-cache
+  
+  # Perfilar una ejecución (tiempos por etapa + volcado pstats)
+  python main.py --file libro.pdf --profile perfil.pstats
+  
+  # Perfil de dificultad por ventanas de 10 oraciones
+  python main.py --file libro.pdf --ventanas 10 --paso 5 --ventanas-csv perfil.csv
+  
+  # Usar el pipeline ligero (más rápido)
+  python main.py --file texto.txt --perfil ligero
         """
     )
     
@@ -57,6 +104,27 @@ Ejemplos de uso:
         help='Lista de archivos a comparar'
     )
     
+    parser.add_argument(
+        '--dir',
+        nargs='+',
+        metavar='ORIGEN',
+        help='Directorios o patrones glob a analizar (se recorren a medida que se analiza)'
+    )
+    
+    parser.add_argument(
+        '--extensiones',
+        nargs='+',
+        default=['.pdf', '.txt', '.md'],
+        help='Extensiones aceptadas con --dir (por defecto .pdf .txt .md)'
+    )
+    
+    parser.add_argument(
+        '--tamano-max',
+        type=float,
+        metavar='MB',
+        help='Omitir archivos de más de MB megabytes con --dir'
+    )
+    
     parser.add_argument(
         '--output',
         '-o',
@@ -64,6 +132,182 @@ Ejemplos de uso:
         help='Archivo donde guardar el resultado'
     )
     
+    parser.add_argument(
+        '--parametros',
+        type=str,
+        metavar='ARCHIVO',
+        help='Usar parámetros de puntaje calibrados (archivo creado con --calibrar)'
+    )
+    
+    parser.add_argument(
+        '--calibrar',
+        nargs=2,
+        metavar=('ETIQUETAS', 'SALIDA'),
+        help='Ajustar la fórmula a un CSV de textos etiquetados (ruta,grado) y guardar los parámetros'
+    )
+    
+    parser.add_argument(
+        '--almacen',
+        type=str,
+        metavar='ARCHIVO',
+        help='Guardar los documentos tokenizados para reevaluarlos sin spaCy'
+    )
+    
+    parser.add_argument(
+        '--reevaluar',
+        action='store_true',
+        help='Recalcular el nivel Lexile de todo el --almacen con los parámetros actuales'
+    )
+    
+    parser.add_argument(
+        '--diario',
+        type=str,
+        metavar='ARCHIVO',
+        help='Diario de avance de --comparar: al repetir el comando se saltan los archivos terminados'
+    )
+    
+    parser.add_argument(
+        '--resumen',
+        type=str,
+        metavar='ARCHIVO',
+        help='Resumir el corpus (medias, histograma Lexile, documentos por grado) y guardarlo en JSON'
+    )
+    
+    parser.add_argument(
+        '--agrupar',
+        type=int,
+        metavar='NIVEL',
+        help='Resumir por directorio: 1 = carpeta del archivo, 2 = la de arriba, etc.'
+    )
+    
+    parser.add_argument(
+        '--formato',
+        choices=['txt', 'jsonl', 'csv', 'parquet'],
+        help='Formato de --output (por defecto, según la extensión; txt si no se reconoce)'
+    )
+    
+    parser.add_argument(
+        '--anexar',
+        action='store_true',
+        help='Agregar a un --output existente, saltando los archivos ya exportados '
+             '(Parquet se reescribe completo y no se puede reanudar si se interrumpe)'
+    )
+    
+    parser.add_argument(
+        '--perfil',
+        choices=['completo', 'ligero'],
+        default='completo',
+        help='Perfil del pipeline de spaCy (ligero: sin NER ni parser, más rápido)'
+    )
+    
+    parser.add_argument(
+        '--procesos',
+        '-p',
+        type=int,
+        help='Procesos para el modo comparación (por defecto 1; 0 = uno por núcleo). '
+             '--calibrar usa por defecto uno por núcleo'
+    )
+    
+    parser.add_argument(
+        '--procesos-pdf',
+        type=int,
+        default=1,
+        help='Procesos para extraer en paralelo las páginas de un PDF'
+    )
+    
+    parser.add_argument(
+        '--lexico',
+        type=str,
+        help='Léxico de frecuencias binario (creado con --convertir-lexico)'
+    )
+    
+    parser.add_argument(
+        '--convertir-lexico',
+        nargs=2,
+        metavar=('TSV', 'SALIDA'),
+        help='Convertir una lista de frecuencias TSV al formato binario'
+    )
+    
+    parser.add_argument(
+        '--sin-cache',
+        action='store_true',
+        help='No usar la caché de resultados en disco'
+    )
+    
+    parser.add_argument(
+        '--limpiar-cache',
+        action='store_true',
+        help='Vaciar la caché de resultados antes de analizar'
+    )
+    
+    parser.add_argument(
+        '--cache-dir',
+        type=str,
+        help='Carpeta de la caché (por defecto ~/.cache/analizador_lexile)'
+    )
+    
+    parser.add_argument(
+        '--serve',
+        action='store_true',
+        help='Iniciar un servicio HTTP/JSON con el modelo precargado'
+    )
+    
+    parser.add_argument(
+        '--host',
+        type=str,
+        default='127.0.0.1',
+        help='Dirección del servicio (por defecto 127.0.0.1)'
+    )
+    
+    parser.add_argument(
+        '--puerto',
+        type=int,
+        default=8000,
+        help='Puerto del servicio (por defecto 8000)'
+    )
+    
+    parser.add_argument(
+        '--trabajadores',
+        type=int,
+        default=1,
+        help='Analizadores precargados en el servicio (con más de uno, un proceso por analizador)'
+    )
+    
+    parser.add_argument(
+        '--timeout',
+        type=float,
+        default=10.0,
+        help='Tiempo máximo por solicitud en el servicio (segundos)'
+    )
+    
+    parser.add_argument(
+        '--ventanas',
+        type=int,
+        metavar='N',
+        help='Calcular el perfil de dificultad por ventanas de N oraciones'
+    )
+    
+    parser.add_argument(
+        '--paso',
+        type=int,
+        metavar='S',
+        help='Oraciones entre ventanas consecutivas (por defecto N/2)'
+    )
+    
+    parser.add_argument(
+        '--ventanas-csv',
+        type=str,
+        metavar='ARCHIVO',
+        help='Guardar el perfil por ventanas en un archivo CSV'
+    )
+    
+    parser.add_argument(
+        '--profile',
+        type=str,
+        metavar='ARCHIVO',
+        help='Medir tiempos por etapa y guardar un perfil cProfile/pstats'
+    )
+    
     parser.add_argument(
         '--version',
         action='version',
@@ -72,8 +316,80 @@ Ejemplos de uso:
     
     args = parser.parse_args()
     
+    if not args.profile:
+        _ejecutar(args, parser)
+        return
+    
+    # Modo perfilado: tiempos por etapa y volcado de cProfile
+    import cProfile
+    import instrumentacion
+    
+    instrumentacion.activar()
+    perfilador = cProfile.Profile()
+    perfilador.enable()
+    try:
+        _ejecutar(args, parser)
+    finally:
+        perfilador.disable()
+        perfilador.dump_stats(args.profile)
+        print()
+        instrumentacion.imprimir_resumen()
+        print(f"\n✓ Perfil guardado en: {args.profile}")
+        print(f"   Ver con: python -m pstats {args.profile}")
+
+
+def _ejecutar(args, parser):
+    """Ejecuta el modo seleccionado con los argumentos ya leídos."""
+    
+    # Los módulos del analizador se importan después de leer los argumentos,
+    # para que --help y --version respondan sin cargar dependencias, y los
+    # de cada modo solo cuando se usa ese modo
+    from analizador_lexile import AnalizadorLexileChile
+    from utilidades import cargar_documento, analizar_pdf, guardar_resultado, imprimir_tabla_comparativa
+    from cache import CacheResultados
+    
+    if args.convertir_lexico:
+        from lexico import convertir_tsv
+        total = convertir_tsv(*args.convertir_lexico)
+        print(f"✓ Léxico con {total} lemas guardado en: {args.convertir_lexico[1]}")
+        return
+    
+    hay_entrada = (args.file or args.texto or args.comparar or args.dir
+                   or args.reevaluar)
+    
+    cache = None if args.sin_cache else CacheResultados(args.cache_dir)
+    
+    if args.calibrar:
+        from calibracion import leer_etiquetas, matriz_metricas, calibrar, guardar_parametros
+        ruta_etiquetas, ruta_salida = args.calibrar
+        rutas, etiquetas = leer_etiquetas(ruta_etiquetas)
+        print(f"\n📐 Calibrando con {len(rutas)} textos etiquetados")
+        print("=" * 70)
+        metricas = matriz_metricas(rutas, ruta_cache=ruta_etiquetas + '.metricas.npz',
+                                   procesos=args.procesos or None, perfil=args.perfil,
+                                   cache=cache, lexico=args.lexico, almacen=args.almacen)
+        calibracion = calibrar(metricas, etiquetas, procesos=args.procesos or None)
+        guardar_parametros(calibracion, ruta_salida)
+        return
+    if args.limpiar_cache:
+        CacheResultados(args.cache_dir).limpiar()
+        print("✓ Caché vaciada")
+        if not hay_entrada:
+            return
+    
+    # Modo servicio
+    if args.serve:
+        print("\n🚀 Analizador de Nivel Lexile - Chile (servicio)")
+        print("=" * 70)
+        print()
+        from servidor import servir
+        servir(host=args.host, puerto=args.puerto, trabajadores=args.trabajadores,
+               timeout=args.timeout, perfil=args.perfil, cache=cache,
+               lexico=args.lexico, parametros=args.parametros)
+        return
+    
     # Validar argumentos
-    if not args.file and not args.texto and not args.comparar:
+    if not hay_entrada:
         parser.print_help()
         return
     
@@ -82,37 +398,129 @@ Ejemplos de uso:
     print("=" * 70)
     print()
     
-    try:
-        analizador = AnalizadorLexileChile()
-    except Exception as e:
-        print(f"❌ Error al inicializar: {e}")
-        return
+    # En modo comparación con varios procesos, cada proceso carga su modelo
+    procesos = 1 if args.procesos is None else (args.procesos or None)
+    analizador = None
+    corpus = args.comparar or args.dir or args.reevaluar
+    if not corpus or procesos == 1 or args.reevaluar:
+        try:
+            analizador = AnalizadorLexileChile(perfil=args.perfil, cache=cache,
+                                               lexico=args.lexico,
+                                               almacen=args.almacen,
+                                               parametros=args.parametros)
+        except Exception as e:
+            print(f"❌ Error al inicializar: {e}")
+            return
+    
+    formato = None
+    if args.output:
+        from exportacion import exportar_resultados, formato_desde_ruta, rutas_escritas
+        formato = args.formato or formato_desde_ruta(args.output) or 'txt'
     
-    # Modo comparación
-    if args.comparar:
-        print(f"\n📊 Modo Comparación: {len(args.comparar)} archivos")
+    # Modo comparación o directorio
+    if corpus:
+        from corpus import analizar_corpus, resumir_corpus
+        from trabajos import ejecutar_trabajo
+        from recorrido import recorrer_archivos, en_segundo_plano
+        from almacen import reevaluar
+        from resumen_corpus import ResumenAgrupado, grupo_por_directorio, acumular
+        
+        if args.reevaluar:
+            if not args.almacen:
+                print("❌ --reevaluar requiere --almacen")
+                return
+            print(f"\n♻️  Reevaluando almacén: {args.almacen}")
+            rutas = None
+        elif args.comparar:
+            print(f"\n📊 Modo Comparación: {len(args.comparar)} archivos")
+            rutas = args.comparar
+        else:
+            # Recorrido perezoso en un hilo aparte, con una cola acotada
+            print(f"\n📂 Modo Directorio: {', '.join(args.dir)}")
+            tamano_max = int(args.tamano_max * 1024 * 1024) if args.tamano_max else None
+            rutas = en_segundo_plano(recorrer_archivos(
+                args.dir, extensiones=args.extensiones, tamano_maximo=tamano_max
+            ))
         print("=" * 70)
         
-        documentos = {}
-        for archivo in args.comparar:
+        opciones_corpus = dict(procesos=procesos, perfil=args.perfil,
+                               analizador=analizador, cache=cache,
+                               lexico=args.lexico, almacen=args.almacen,
+                               parametros=args.parametros)
+        if args.reevaluar:
+            items = lambda rutas: reevaluar(args.almacen, analizador)
+        elif args.diario:
+            items = lambda rutas: ejecutar_trabajo(rutas, args.diario, **opciones_corpus)
+        else:
+            items = lambda rutas: analizar_corpus(rutas, **opciones_corpus)
+        
+        # Resumen del corpus: sin otra salida, cada proceso resume sus
+        # bloques y solo se combinan los resúmenes parciales
+        resumen = None
+        if args.resumen or args.agrupar:
+            agrupar = (functools.partial(grupo_por_directorio, nivel=args.agrupar)
+                       if args.agrupar else None)
+            if not (args.output or args.diario or args.reevaluar):
+                resumen = resumir_corpus(rutas, agrupar=agrupar, **opciones_corpus)
+                _mostrar_resumen(resumen, args.resumen)
+                return
+            resumen = ResumenAgrupado()
+            items_corpus = items
+            items = lambda rutas: acumular(items_corpus(rutas), resumen, agrupar)
+        
+        # Exportación masiva: los resultados van directo al archivo
+        if formato and formato != 'txt':
+            ya_escritas = None
+            if args.anexar and rutas is not None:
+                try:
+                    ya_escritas = rutas_escritas(args.output, formato)
+                except Exception as e:
+                    print(f"❌ Error al leer {args.output}: {e}")
+                    return
+                if isinstance(rutas, list):
+                    rutas = [r for r in rutas if r not in ya_escritas]
+                else:
+                    rutas = (r for r in rutas if r not in ya_escritas)
+                print(f"↻ Reanudando: {len(ya_escritas)} archivos ya exportados")
             try:
-                nombre = os.path.basename(archivo)
-                texto = cargar_documento(archivo)
-                documentos[nombre] = texto
+                total = exportar_resultados(items(rutas), args.output, formato,
+                                            anexar=args.anexar, omitir=ya_escritas)
             except Exception as e:
-                print(f"❌ Error al cargar {archivo}: {e}")
+                print(f"❌ Error al exportar: {e}")
+                return
+            print(f"\n✓ {total} resultados guardados en: {args.output} ({formato})")
+            _mostrar_resumen(resumen, args.resumen)
+            return
+        
+        resultados = []
+        for item in items(rutas):
+            if 'error' in item:
+                print(f"❌ Error al cargar {item['ruta']}: {item['error']}")
+                continue
+            resultado = item['resultado']
+            if 'error' not in resultado:
+                resultados.append({
+                    'nombre': item['nombre'],
+                    'lexile': resultado['lexile'],
+                    'grado': resultado['grado'],
+                    'palabras': resultado['estadisticas']['palabras'],
+                    'oraciones': resultado['estadisticas']['oraciones']
+                })
         
-        if documentos:
-            comparar_textos(documentos, analizador)
+        if resultados:
+            print()
+            imprimir_tabla_comparativa(resultados)
+        _mostrar_resumen(resumen, args.resumen)
         return
     
     # Modo análisis individual
     if args.file:
         try:
             if args.file.lower().endswith('.pdf'):
-                resultado = analizar_pdf(args.file, analizador)
+                resultado = analizar_pdf(args.file, analizador,
+                                         procesos=args.procesos_pdf)
             else:
-                texto = cargar_documento(args.file)
+                texto = cargar_documento(args.file, cache=cache)
                 print(f"\n📄 Analizando: {os.path.basename(args.file)}")
                 print("=" * 70)
                 resultado = analizador.analizar(texto)
@@ -127,15 +535,52 @@ Ejemplos de uso:
         resultado = analizador.analizar(args.texto)
         analizador.imprimir_resultado(resultado)
     
+    # Perfil de dificultad por ventanas
+    if args.ventanas:
+        from ventanas import perfil_dificultad, imprimir_perfil, guardar_perfil_csv
+        try:
+            if args.file:
+                texto = cargar_documento(args.file, cache=cache,
+                                         procesos_pdf=args.procesos_pdf)
+            else:
+                texto = args.texto
+            paso = args.paso or max(1, args.ventanas // 2)
+            perfil = perfil_dificultad(analizador, texto, args.ventanas, paso)
+            print(f"\n📈 Perfil de dificultad (ventanas de {args.ventanas} oraciones, paso {paso})")
+            imprimir_perfil(perfil)
+            if args.ventanas_csv:
+                guardar_perfil_csv(perfil, args.ventanas_csv)
+        except Exception as e:
+            print(f"❌ Error en el perfil por ventanas: {e}")
+    
     # Guardar resultado si se especificó
     if args.output and 'resultado' in locals() and resultado:
         try:
-            guardar_resultado(resultado, args.output)
+            if formato == 'txt':
+                guardar_resultado(resultado, args.output)
+            else:
+                nombre = os.path.basename(args.file) if args.file else None
+                exportar_resultados(
+                    [{'nombre': nombre, 'ruta': args.file, 'resultado': resultado}],
+                    args.output, formato, anexar=args.anexar
+                )
+                print(f"\n✓ Resultado guardado en: {args.output}")
         except Exception as e:
             print(f"❌ Error al guardar: {e}")
     
     print("\n✅ Análisis completado\n")
 
 
+def _mostrar_resumen(resumen, ruta):
+    """Imprime el resumen del corpus y lo guarda si se pidió un archivo."""
+    if resumen is None:
+        return
+    from resumen_corpus import guardar_resumen, imprimir_resumen
+    print()
+    imprimir_resumen(resumen)
+    if ruta:
+        guardar_resumen(resumen, ruta)
+
+
 if __name__ == '__main__':
     main()
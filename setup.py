@@ -25,15 +25,14 @@ setup(
         "Topic :: Text Processing :: Linguistic",
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Natural Language :: Spanish",
     ],
-    python_requires=">=3.7",
+    python_requires=">=3.8",
     install_requires=[
-        "spacy>=2.3.0,<4.0.0",
+        "spacy>=3.0.0,<4.0.0",
         "numpy>=1.20.0",
         "PyPDF2>=3.0.0",
         "pdfplumber>=0.9.0",
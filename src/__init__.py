@@ -3,23 +3,79 @@ Analizador de Nivel Lexile para Textos en Español
 Sistema adaptado al contexto educativo chileno
 """
 
-from .analizador_lexile import AnalizadorLexileChile
-from .utilidades import (
-    cargar_documento,
-    analizar_pdf,
-    comparar_textos,
-    cargar_multiples_documentos,
-    guardar_resultado
-)
+import importlib
 
 __version__ = '1.0.0'
 __author__ = 'Claudio Rojas'
 
-__all__ = [
-    'AnalizadorLexileChile',
-    'cargar_documento',
-    'analizar_pdf',
-    'comparar_textos',
-    'cargar_multiples_documentos',
-    'guardar_resultado'
-]
+# Nombre público → módulo que lo define (None para un submódulo). Los
+# módulos se importan recién al usar el nombre, para que importar el
+# paquete sea rápido.
+_EXPORTACIONES = {
+    'AnalizadorLexileChile': 'analizador_lexile',
+    'AgregadosTexto': 'analizador_lexile',
+    'CaracteristicasTexto': 'analizador_lexile',
+    'comparar_perfiles': 'analizador_lexile',
+    'cargar_documento': 'utilidades',
+    'extraer_paginas_pdf': 'utilidades',
+    'analizar_pdf': 'utilidades',
+    'analizar_pdf_por_paginas': 'utilidades',
+    'comparar_textos': 'utilidades',
+    'cargar_multiples_documentos': 'utilidades',
+    'analizar_multiples_documentos': 'utilidades',
+    'guardar_resultado': 'utilidades',
+    'imprimir_tabla_comparativa': 'utilidades',
+    'analizar_corpus': 'corpus',
+    'resumir_corpus': 'corpus',
+    'ResumenCorpus': 'resumen_corpus',
+    'ResumenAgrupado': 'resumen_corpus',
+    'grupo_por_directorio': 'resumen_corpus',
+    'CacheResultados': 'cache',
+    'LexicoFrecuencias': 'lexico',
+    'convertir_tsv': 'lexico',
+    'ServicioAnalisis': 'servidor',
+    'AnalizadorEnProceso': 'servidor',
+    'crear_servidor': 'servidor',
+    'servir': 'servidor',
+    'AnalizadorAsincrono': 'asincrono',
+    'AnalisisIncremental': 'incremental',
+    'EscritorResultados': 'exportacion',
+    'exportar_resultados': 'exportacion',
+    'rutas_escritas': 'exportacion',
+    'cargar_parametros': 'analizador_lexile',
+    'calcular_lexile_lote': 'analizador_lexile',
+    'clasificar_niveles_lote': 'analizador_lexile',
+    'calibrar': 'calibracion',
+    'matriz_metricas': 'calibracion',
+    'guardar_parametros': 'calibracion',
+    'ConjuntoLemas': 'diversidad',
+    'HyperLogLog': 'diversidad',
+    'AlmacenDocumentos': 'almacen',
+    'reevaluar': 'almacen',
+    'recorrer_archivos': 'recorrido',
+    'DiarioTrabajo': 'trabajos',
+    'ejecutar_trabajo': 'trabajos',
+    'perfil_dificultad': 'ventanas',
+    'guardar_perfil_csv': 'ventanas',
+    'instrumentacion': None
+}
+
+__all__ = list(_EXPORTACIONES)
+
+
+def __getattr__(nombre):
+    if nombre not in _EXPORTACIONES:
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+    
+    if _EXPORTACIONES[nombre] is None:
+        # Submódulo exportado directamente
+        valor = importlib.import_module(f".{nombre}", __name__)
+    else:
+        modulo = importlib.import_module(f".{_EXPORTACIONES[nombre]}", __name__)
+        valor = getattr(modulo, nombre)
+    globals()[nombre] = valor
+    return valor
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
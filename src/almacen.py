@@ -0,0 +1,268 @@
+"""
+Almacén de documentos tokenizados
+Guarda las características por palabra que produce spaCy, para volver
+a calcular el nivel Lexile sin tokenizar de nuevo
+"""
+
+import hashlib
+import itertools
+import json
+import os
+import sqlite3
+import threading
+
+import numpy as np
+
+try:
+    from .analizador_lexile import AgregadosTexto, CaracteristicasTexto
+except ImportError:
+    from analizador_lexile import AgregadosTexto, CaracteristicasTexto
+
+
+# Columnas de arreglos por palabra y su tipo de dato
+_ARREGLOS = (
+    ('oracion', np.int32),
+    ('ranking', np.int32),
+    ('rara', np.bool_),
+    ('silabas', np.int16),
+    ('lema', np.uint64),
+)
+
+# Documentos leídos por vez al recorrer el almacén
+TAMANO_LECTURA_ALMACEN = 512
+
+
+class AlmacenDocumentos:
+    """
+    Almacén persistente de CaracteristicasTexto respaldado por SQLite.
+
+    Cada documento se guarda con una clave que depende del contenido del
+    texto, del modelo de spaCy y del léxico de frecuencias, es decir, de
+    todo lo que influye en los arreglos por palabra. Los pesos y umbrales
+    del puntaje no forman parte de la clave: al cambiarlos, ``reevaluar``
+    recalcula el corpus completo desde el almacén.
+
+    Además se registra qué ruta corresponde a cada documento. Cada hilo
+    usa su propia conexión a la base de datos.
+
+    Attributes:
+        ruta: Archivo de la base de datos
+    """
+
+    def __init__(self, ruta):
+        """
+        Abre (o crea) el almacén.
+
+        Args:
+            ruta: Archivo de la base de datos
+        """
+        self.ruta = ruta
+        self._local = threading.local()
+
+    def __getstate__(self):
+        # Las conexiones de SQLite no se pueden copiar entre procesos
+        estado = self.__dict__.copy()
+        del estado['_local']
+        return estado
+
+    def __setstate__(self, estado):
+        self.__dict__.update(estado)
+        self._local = threading.local()
+
+    @property
+    def conexion(self):
+        """Conexión a la base de datos del hilo actual, abierta al primer uso."""
+        conexion = getattr(self._local, 'conexion', None)
+        if conexion is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.ruta)), exist_ok=True)
+            conexion = sqlite3.connect(self.ruta, timeout=30)
+            self._local.conexion = conexion
+            conexion.execute(
+                "CREATE TABLE IF NOT EXISTS documentos ("
+                " clave TEXT PRIMARY KEY,"
+                " num_oraciones INTEGER NOT NULL,"
+                + ", ".join(f" {nombre} BLOB NOT NULL" for nombre, _ in _ARREGLOS)
+                + ")"
+            )
+            conexion.execute(
+                "CREATE TABLE IF NOT EXISTS rutas ("
+                " ruta TEXT PRIMARY KEY,"
+                " clave TEXT NOT NULL,"
+                " error TEXT,"
+                " orden INTEGER)"
+            )
+            # Almacenes creados antes de registrar errores y orden
+            columnas = {fila[1] for fila in conexion.execute("PRAGMA table_info(rutas)")}
+            for columna, tipo in (('error', 'TEXT'), ('orden', 'INTEGER')):
+                if columna not in columnas:
+                    conexion.execute(f"ALTER TABLE rutas ADD COLUMN {columna} {tipo}")
+            conexion.commit()
+        return conexion
+
+    @staticmethod
+    def clave_documento(texto, modelo, version_modelo, firma_lexico):
+        """
+        Construye la clave de un documento tokenizado.
+
+        Args:
+            texto: Texto del documento
+            modelo: Nombre del modelo de spaCy (con el perfil)
+            version_modelo: Versión del modelo de spaCy
+            firma_lexico: Firma del léxico de frecuencias
+
+        Returns:
+            str: Clave del documento
+        """
+        resumen = hashlib.sha256(texto.encode('utf-8')).hexdigest()
+        return f"documento:{modelo}:{version_modelo}:{firma_lexico}:{resumen}"
+
+    def obtener(self, clave):
+        """
+        Busca las características de un documento.
+
+        Args:
+            clave: Clave del documento
+
+        Returns:
+            CaracteristicasTexto: Arreglos por palabra, o None si no existe
+        """
+        fila = self.conexion.execute(
+            "SELECT num_oraciones, " + ", ".join(n for n, _ in _ARREGLOS)
+            + " FROM documentos WHERE clave = ?", (clave,)
+        ).fetchone()
+        return None if fila is None else _desde_fila(fila)
+
+    def guardar(self, clave, caracteristicas):
+        """
+        Guarda las características de un documento.
+
+        Args:
+            clave: Clave del documento
+            caracteristicas: Instancia de CaracteristicasTexto
+        """
+        arreglos = [
+            np.ascontiguousarray(getattr(caracteristicas, nombre), dtype=tipo).tobytes()
+            for nombre, tipo in _ARREGLOS
+        ]
+        self.conexion.execute(
+            "INSERT OR REPLACE INTO documentos VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (clave, caracteristicas.num_oraciones, *arreglos)
+        )
+        self.conexion.commit()
+
+    def asociar(self, ruta, clave=None, error=None):
+        """
+        Registra qué documento (o qué error) corresponde a un archivo.
+
+        La ruta se guarda tal como se entregó, para que ``reevaluar``
+        produzca las mismas rutas que la ejecución original, y con un
+        número de orden creciente, para entregarlas en el mismo orden.
+        Si el archivo apuntaba a otro documento (porque cambió su
+        contenido) y ningún otro archivo lo usa, ese documento se borra.
+
+        Args:
+            ruta: Ruta del archivo
+            clave: Clave del documento (None si el archivo tuvo un error)
+            error: Con ``clave`` None, lo que el análisis entregó en lugar
+                del documento: {'error': mensaje} si el archivo no se pudo
+                cargar o {'resultado': {'error': mensaje}} si el análisis
+                devolvió un error
+        """
+        with self.conexion:
+            fila = self.conexion.execute(
+                "SELECT clave FROM rutas WHERE ruta = ?", (ruta,)
+            ).fetchone()
+            # Los errores se guardan con clave vacía
+            self.conexion.execute(
+                "INSERT OR REPLACE INTO rutas VALUES (?, ?, ?,"
+                " (SELECT COALESCE(MAX(orden), 0) + 1 FROM rutas))",
+                (ruta, clave or '',
+                 None if clave else json.dumps(error, ensure_ascii=False))
+            )
+            if fila is not None and fila[0] and fila[0] != clave:
+                self.conexion.execute(
+                    "DELETE FROM documentos WHERE clave = ?"
+                    " AND NOT EXISTS (SELECT 1 FROM rutas WHERE rutas.clave = ?)",
+                    (fila[0], fila[0])
+                )
+
+    def recorrer(self):
+        """
+        Recorre los archivos registrados, en el orden en que se registraron.
+
+        Los documentos guardados sin ruta (por ejemplo, con ``analizar``
+        sobre un texto suelto) no se recorren.
+
+        Yields:
+            tuple: (ruta, caracteristicas, error); caracteristicas es None
+                si el archivo tuvo un error, y error es lo registrado con
+                ``asociar`` en ese caso
+        """
+        cursor = self.conexion.cursor()
+        cursor.execute(
+            "SELECT r.ruta, r.error, d.num_oraciones, "
+            + ", ".join(f"d.{n}" for n, _ in _ARREGLOS)
+            + " FROM rutas r LEFT JOIN documentos d ON d.clave = r.clave"
+            " WHERE r.error IS NOT NULL OR d.clave IS NOT NULL"
+            " ORDER BY r.orden, r.ruta"
+        )
+        while True:
+            filas = cursor.fetchmany(TAMANO_LECTURA_ALMACEN)
+            if not filas:
+                break
+            for fila in filas:
+                if fila[1] is not None:
+                    yield fila[0], None, json.loads(fila[1])
+                else:
+                    yield fila[0], _desde_fila(fila[2:]), None
+
+    def __len__(self):
+        return self.conexion.execute("SELECT COUNT(*) FROM documentos").fetchone()[0]
+
+
+def _desde_fila(fila):
+    """Reconstruye CaracteristicasTexto desde una fila (num_oraciones, arreglos...)."""
+    arreglos = {
+        nombre: np.frombuffer(datos, dtype=tipo)
+        for (nombre, tipo), datos in zip(_ARREGLOS, fila[1:])
+    }
+    return CaracteristicasTexto(num_oraciones=fila[0], **arreglos)
+
+
+def reevaluar(almacen, analizador):
+    """
+    Recalcula el nivel Lexile de todos los documentos del almacén.
+
+    Entrega las mismas rutas, en el mismo orden, que la ejecución que
+    llenó el almacén, incluidos los archivos que tuvieron un error.
+    No usa spaCy: el puntaje y la clasificación se calculan con los
+    pesos y umbrales actuales de ``analizador`` a partir de los arreglos
+    guardados, con una llamada vectorizada por bloque de
+    TAMANO_LECTURA_ALMACEN documentos.
+
+    Args:
+        almacen: Instancia de AlmacenDocumentos o ruta a su archivo
+        analizador: Instancia de AnalizadorLexileChile
+
+    Yields:
+        dict: Un item por documento, con el formato de ``analizar_corpus``
+            ('nombre', 'ruta' y 'resultado' o 'error')
+    """
+    if not isinstance(almacen, AlmacenDocumentos):
+        almacen = AlmacenDocumentos(almacen)
+
+    documentos = almacen.recorrer()
+    while True:
+        bloque = list(itertools.islice(documentos, TAMANO_LECTURA_ALMACEN))
+        if not bloque:
+            break
+        agregados = [AgregadosTexto().agregar(caracteristicas)
+                     for _, caracteristicas, error in bloque if error is None]
+        resultados = iter(analizador._resultados_desde_agregados(agregados))
+        for ruta, _, error in bloque:
+            item = {'nombre': os.path.basename(ruta), 'ruta': ruta}
+            if error is None:
+                item['resultado'] = next(resultados)
+            else:
+                item.update(error)
+            yield item
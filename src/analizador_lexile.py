@@ -8,9 +8,442 @@ y determinar su nivel de complejidad lectora (Lexile).
 
 import re
 import numpy as np
-from collections import Counter
+from collections import Counter, deque
+import functools
+import hashlib
+import itertools
+import importlib.metadata
+import json
 import math
-import spacy
+
+try:
+    from . import instrumentacion
+    from .diversidad import crear_contador
+    from .lexico import LexicoFrecuencias, hashes_palabras
+except ImportError:
+    import instrumentacion
+    from diversidad import crear_contador
+    from lexico import LexicoFrecuencias, hashes_palabras
+
+
+# Modelo de spaCy usado por el analizador
+MODELO_SPACY = "es_core_news_sm"
+
+# Versión de los parámetros de puntaje (_calcular_lexile y
+# _clasificar_nivel_chile). Debe incrementarse al cambiarlos para
+# invalidar los resultados guardados en caché.
+VERSION_PARAMETROS = '1'
+
+# Versión de la segmentación del texto antes de spaCy. Desde la versión 2
+# cada párrafo pasa por spaCy por separado (ver ``_parrafos``); forma
+# parte de las claves de la caché y del almacén de documentos.
+VERSION_SEGMENTACION = '2'
+
+# Coeficientes de la fórmula de _calcular_lexile. Un archivo de
+# parámetros (ver ``cargar_parametros``) puede reemplazar cualquiera.
+PARAMETROS_LEXILE = {
+    'base': 100,
+    'corte_longitud_1': 5,
+    'corte_longitud_2': 10,
+    'corte_longitud_3': 20,
+    'pendiente_longitud_1': 80,
+    'pendiente_longitud_2': 50,
+    'pendiente_longitud_3': 30,
+    'umbral_frecuencia': 1.5,
+    'factor_frecuencia': 200,
+    'umbral_raras': 8,
+    'factor_raras_largas': 2,
+    'factor_raras_cortas': 0.5,
+    'umbral_silabas': 1.8,
+    'factor_silabas': 150,
+    'factor_complejas': 100,
+    'factor_variabilidad': 8,
+    'lexile_minimo': 50,
+    'lexile_maximo': 1600,
+}
+
+# Identificador de los archivos de parámetros
+FORMATO_PARAMETROS = 'analizador-lexile-parametros'
+
+# Perfiles de pipeline de spaCy. El perfil "ligero" excluye los componentes
+# que ``analizar`` no usa (NER y parser de dependencias) y segmenta las
+# oraciones con el componente ``senter`` del modelo, o con el sentencizer
+# basado en reglas si el modelo no lo incluye.
+PERFILES_PIPELINE = {
+    'completo': {
+        'exclude': [],
+        'senter': False
+    },
+    'ligero': {
+        'exclude': ['ner', 'parser'],
+        'senter': True
+    }
+}
+
+# Diferencia máxima aceptada (en puntos Lexile) entre el perfil ligero
+# y el completo sobre un mismo texto.
+TOLERANCIA_PERFIL_LIGERO = 50
+
+# Ranking asignado a las palabras raras: las que no están en el léxico o
+# están más allá de esta posición. Con listas de frecuencia grandes el
+# ranking se limita a este valor para mantener la escala de la fórmula.
+RANGO_PALABRA_RARA = 2000
+
+# Vocales del español usadas para contar sílabas
+VOCALES = 'aeiouáéíóúü'
+_CODIGOS_VOCALES = np.array([ord(v) for v in VOCALES], dtype=np.uint32)
+
+# Máximo de formas de palabra distintas que se recuerdan al contar sílabas
+TAMANO_MEMO_SILABAS = 2 ** 16
+
+
+@functools.lru_cache(maxsize=TAMANO_MEMO_SILABAS)
+def contar_silabas(palabra):
+    """
+    Cuenta las sílabas de una palabra en español.
+    
+    Cuenta los grupos de vocales consecutivas. El resultado se memoriza
+    por forma de palabra en una tabla de tamaño acotado.
+    
+    Args:
+        palabra: Palabra en minúsculas
+        
+    Returns:
+        int: Número de sílabas (al menos 1)
+    """
+    silabas = 0
+    anterior_vocal = False
+    
+    for char in palabra:
+        es_vocal = char in VOCALES
+        if es_vocal and not anterior_vocal:
+            silabas += 1
+        anterior_vocal = es_vocal
+    
+    return max(1, silabas)
+
+
+def contar_silabas_lote(palabras):
+    """
+    Cuenta las sílabas de muchas palabras a la vez con NumPy.
+    
+    Las palabras se unen en un solo arreglo de códigos Unicode y se
+    cuentan los inicios de grupos de vocales, sin que un grupo cruce
+    el límite entre dos palabras.
+    
+    Args:
+        palabras: Lista de palabras
+        
+    Returns:
+        np.ndarray: Número de sílabas de cada palabra (al menos 1)
+    """
+    if not palabras:
+        return np.zeros(0, dtype=np.int64)
+    
+    palabras = [p.lower() for p in palabras]
+    longitudes = np.fromiter(map(len, palabras), dtype=np.int64,
+                             count=len(palabras))
+    codigos = np.frombuffer(''.join(palabras).encode('utf-32-le'),
+                            dtype=np.uint32)
+    
+    es_vocal = np.isin(codigos, _CODIGOS_VOCALES)
+    fines = np.cumsum(longitudes)
+    inicios = fines - longitudes
+    
+    # Vocal anterior, reiniciada al comienzo de cada palabra
+    anterior_vocal = np.zeros_like(es_vocal)
+    anterior_vocal[1:] = es_vocal[:-1]
+    anterior_vocal[inicios[longitudes > 0]] = False
+    
+    inicios_grupo = np.zeros(len(codigos) + 1, dtype=np.int64)
+    np.cumsum(es_vocal & ~anterior_vocal, out=inicios_grupo[1:])
+    silabas = inicios_grupo[fines] - inicios_grupo[inicios]
+    
+    return np.maximum(silabas, 1)
+
+
+# Límites inferiores de cada nivel educativo chileno (en puntos Lexile),
+# desde el segundo nivel en adelante; el primero parte en 0
+LIMITES_NIVELES_CHILE = np.array([300, 500, 700, 900, 1050, 1200], dtype=np.float64)
+
+# Niveles educativos chilenos, en el orden de LIMITES_NIVELES_CHILE
+NIVELES_CHILE = (
+    {'grado': '1º-2º Básico', 'nivel': 'Inicial', 'edad': '6-7 años'},
+    {'grado': '3º-4º Básico', 'nivel': 'Elemental', 'edad': '8-9 años'},
+    {'grado': '5º-6º Básico', 'nivel': 'Intermedio', 'edad': '10-11 años'},
+    {'grado': '7º-8º Básico', 'nivel': 'Avanzado Básico', 'edad': '12-13 años'},
+    {'grado': '1º-2º Medio', 'nivel': 'Media Inicial', 'edad': '14-15 años'},
+    {'grado': '3º-4º Medio', 'nivel': 'Media Avanzada', 'edad': '16-17 años'},
+    {'grado': 'Universidad/Profesional', 'nivel': 'Superior', 'edad': '18+ años'},
+)
+
+
+def calcular_lexile_lote(long_prom, long_desv, freq_prom,
+                         sil_prom, ratio_complejas, pct_raras, parametros=None):
+    """
+    Calcula el nivel Lexile de muchos textos a la vez con NumPy.
+    
+    Aplica la misma fórmula y en el mismo orden de operaciones que
+    ``AnalizadorLexileChile._calcular_lexile``, por lo que el resultado
+    es idéntico bit a bit al del cálculo de un texto.
+    
+    Args:
+        long_prom: Longitud promedio de oración
+        long_desv: Desviación estándar de la longitud de oración
+        freq_prom: Ranking de frecuencia promedio
+        sil_prom: Sílabas promedio por palabra
+        ratio_complejas: Proporción de palabras de 3 o más sílabas
+        pct_raras: Porcentaje de palabras raras
+        parametros: Coeficientes de la fórmula (por defecto, PARAMETROS_LEXILE)
+        
+    Returns:
+        np.ndarray: Nivel Lexile de cada texto (float64), entre
+            'lexile_minimo' y 'lexile_maximo'
+    """
+    p = PARAMETROS_LEXILE if parametros is None else parametros
+    
+    long_prom = np.asarray(long_prom, dtype=np.float64)
+    long_desv = np.asarray(long_desv, dtype=np.float64)
+    freq_prom = np.asarray(freq_prom, dtype=np.float64)
+    sil_prom = np.asarray(sil_prom, dtype=np.float64)
+    ratio_complejas = np.asarray(ratio_complejas, dtype=np.float64)
+    pct_raras = np.asarray(pct_raras, dtype=np.float64)
+    
+    base = p['base']
+    
+    # Componente de longitud de oración, por tramos continuos
+    corte_1, corte_2, corte_3 = p['corte_longitud_1'], p['corte_longitud_2'], p['corte_longitud_3']
+    pendiente_1, pendiente_2, pendiente_3 = (p['pendiente_longitud_1'],
+                                             p['pendiente_longitud_2'],
+                                             p['pendiente_longitud_3'])
+    inicio_2 = (corte_2 - corte_1) * pendiente_1
+    inicio_3 = inicio_2 + (corte_3 - corte_2) * pendiente_2
+    comp_longitud = np.piecewise(
+        long_prom,
+        [long_prom <= corte_1,
+         (long_prom > corte_1) & (long_prom <= corte_2),
+         (long_prom > corte_2) & (long_prom <= corte_3),
+         long_prom > corte_3],
+        [0,
+         lambda l: (l - corte_1) * pendiente_1,
+         lambda l: inicio_2 + (l - corte_2) * pendiente_2,
+         lambda l: inicio_3 + (l - corte_3) * pendiente_3]
+    )
+    
+    # Componente de frecuencia
+    comp_frecuencia = np.maximum(0, (freq_prom - p['umbral_frecuencia']) * p['factor_frecuencia'])
+    
+    # Componente de palabras raras
+    comp_raras = np.select([long_prom > p['umbral_raras']],
+                           [pct_raras * p['factor_raras_largas']],
+                           pct_raras * p['factor_raras_cortas'])
+    
+    # Componente de sílabas
+    comp_silabas = np.maximum(0, (sil_prom - p['umbral_silabas']) * p['factor_silabas'])
+    
+    # Componente de palabras complejas
+    comp_complejas = ratio_complejas * p['factor_complejas']
+    
+    # Componente de variabilidad
+    comp_variabilidad = long_desv * p['factor_variabilidad']
+    
+    lexile = (base + comp_longitud + comp_frecuencia + comp_raras + 
+             comp_silabas + comp_complejas + comp_variabilidad)
+    
+    return np.clip(lexile, p['lexile_minimo'], p['lexile_maximo'])
+
+
+def clasificar_niveles_lote(lexile, limites=LIMITES_NIVELES_CHILE):
+    """
+    Clasifica muchos niveles Lexile a la vez en niveles educativos.
+    
+    Args:
+        lexile: Niveles Lexile calculados
+        limites: Límites inferiores de los niveles, desde el segundo
+            (por defecto, LIMITES_NIVELES_CHILE)
+        
+    Returns:
+        np.ndarray: Índice en NIVELES_CHILE de cada nivel (int64)
+    """
+    return np.searchsorted(limites, lexile, side='right')
+
+
+def cargar_parametros(ruta):
+    """
+    Carga un archivo de parámetros de puntaje (por ejemplo, de ``calibrar``).
+    
+    Los coeficientes que el archivo no incluye toman su valor por defecto.
+    
+    Args:
+        ruta: Ruta al archivo JSON de parámetros
+        
+    Returns:
+        dict: Parámetros con las claves 'version', 'coeficientes' y
+            'limites_niveles'
+        
+    Raises:
+        ValueError: Si el archivo no es un archivo de parámetros válido
+    """
+    with open(ruta, 'r', encoding='utf-8') as f:
+        datos = json.load(f)
+    
+    if datos.get('formato') != FORMATO_PARAMETROS:
+        raise ValueError(f"No es un archivo de parámetros: {ruta}")
+    
+    desconocidos = set(datos.get('coeficientes', {})) - set(PARAMETROS_LEXILE)
+    if desconocidos:
+        raise ValueError(f"Coeficientes desconocidos: {', '.join(sorted(desconocidos))}")
+    
+    limites = datos.get('limites_niveles', LIMITES_NIVELES_CHILE.tolist())
+    if len(limites) != len(NIVELES_CHILE) - 1 or sorted(limites) != list(limites):
+        raise ValueError(
+            f"'limites_niveles' debe tener {len(NIVELES_CHILE) - 1} valores crecientes"
+        )
+    
+    return {
+        'version': str(datos.get('version', '')),
+        'coeficientes': {**PARAMETROS_LEXILE, **datos.get('coeficientes', {})},
+        'limites_niveles': limites,
+    }
+
+
+class AgregadosTexto:
+    """
+    Sumas parciales de las métricas de un texto.
+    
+    Permiten calcular el nivel Lexile de un texto procesado por partes:
+    los agregados de cada parte se combinan y el resultado es el mismo
+    que si el texto se hubiera analizado completo.
+    
+    Attributes:
+        oraciones: Número de oraciones
+        suma_longitudes: Suma de las longitudes de oración (en palabras)
+        suma_cuadrados_longitudes: Suma de los cuadrados de esas longitudes
+        palabras: Número de palabras
+        suma_rankings: Suma de los rankings de frecuencia de las palabras
+        palabras_raras: Palabras fuera del diccionario de frecuencias
+        silabas: Total de sílabas
+        palabras_complejas: Palabras de 3 o más sílabas
+        lemas: Lemas distintos (ConjuntoLemas, o HyperLogLog en modo
+            'aproximada'; ver diversidad.MODOS_DIVERSIDAD)
+    """
+    
+    # Atributos que se combinan sumándolos (todos menos ``lemas``)
+    SUMAS = ('oraciones', 'suma_longitudes', 'suma_cuadrados_longitudes',
+             'palabras', 'suma_rankings', 'palabras_raras', 'silabas',
+             'palabras_complejas')
+    
+    def __init__(self, diversidad='exacta'):
+        """
+        Args:
+            diversidad: Conteo de lemas distintos: 'exacta' o 'aproximada'
+                (memoria constante, error estándar de 0,81 %)
+        """
+        self.oraciones = 0
+        self.suma_longitudes = 0
+        self.suma_cuadrados_longitudes = 0
+        self.palabras = 0
+        self.suma_rankings = 0
+        self.palabras_raras = 0
+        self.silabas = 0
+        self.palabras_complejas = 0
+        self.lemas = crear_contador(diversidad)
+    
+    def combinar(self, otro):
+        """
+        Suma los agregados de otro texto a estos.
+        
+        Args:
+            otro: Instancia de AgregadosTexto
+            
+        Returns:
+            AgregadosTexto: Esta misma instancia, ya combinada
+        """
+        for campo in self.SUMAS:
+            setattr(self, campo, getattr(self, campo) + getattr(otro, campo))
+        self.lemas.combinar(otro.lemas)
+        return self
+    
+    def agregar(self, caracteristicas):
+        """
+        Suma las métricas de un texto ya tokenizado.
+        
+        Args:
+            caracteristicas: Instancia de CaracteristicasTexto
+            
+        Returns:
+            AgregadosTexto: Esta misma instancia, ya actualizada
+        """
+        longitudes = caracteristicas.longitudes_oraciones()
+        
+        self.oraciones += caracteristicas.num_oraciones
+        self.suma_longitudes += int(longitudes.sum())
+        self.suma_cuadrados_longitudes += int(np.dot(longitudes, longitudes))
+        self.palabras += len(caracteristicas)
+        self.suma_rankings += int(caracteristicas.ranking.sum(dtype=np.int64))
+        self.palabras_raras += int(np.count_nonzero(caracteristicas.rara))
+        self.silabas += int(caracteristicas.silabas.sum(dtype=np.int64))
+        self.palabras_complejas += int(np.count_nonzero(caracteristicas.silabas >= 3))
+        self.lemas.agregar(caracteristicas.lema)
+        return self
+
+
+class CaracteristicasTexto:
+    """
+    Características por palabra de un texto tokenizado, en arreglos compactos.
+    
+    Contiene todo lo que el cálculo del nivel Lexile necesita de spaCy,
+    de modo que las métricas se pueden recalcular sin volver a tokenizar.
+    Cada arreglo tiene un elemento por palabra (sin puntuación ni espacios).
+    
+    Attributes:
+        oracion: Índice de la oración de cada palabra (int32)
+        ranking: Ranking de frecuencia, limitado a RANGO_PALABRA_RARA (int32)
+        rara: Si la palabra es rara (bool)
+        silabas: Número de sílabas (int16)
+        lema: Identificador del lema en minúsculas (uint64, ver hash_palabra)
+        num_oraciones: Número de oraciones, incluidas las sin palabras
+    """
+    
+    def __init__(self, oracion, ranking, rara, silabas, lema, num_oraciones):
+        self.oracion = oracion
+        self.ranking = ranking
+        self.rara = rara
+        self.silabas = silabas
+        self.lema = lema
+        self.num_oraciones = num_oraciones
+    
+    def __len__(self):
+        return len(self.oracion)
+    
+    def longitudes_oraciones(self):
+        """Retorna el número de palabras de cada oración (int64)."""
+        return np.bincount(self.oracion, minlength=self.num_oraciones)
+    
+    @classmethod
+    def concatenar(cls, partes):
+        """
+        Une las características de partes consecutivas de un texto.
+        
+        Args:
+            partes: Lista de CaracteristicasTexto, en el orden del texto
+            
+        Returns:
+            CaracteristicasTexto: Características del texto completo, con
+                los índices de oración desplazados en cada parte
+        """
+        if len(partes) == 1:
+            return partes[0]
+        desplazamientos = np.cumsum([0] + [p.num_oraciones for p in partes[:-1]])
+        return cls(
+            oracion=np.concatenate([p.oracion + np.int32(d)
+                                    for p, d in zip(partes, desplazamientos)]).astype(np.int32),
+            ranking=np.concatenate([p.ranking for p in partes]).astype(np.int32),
+            rara=np.concatenate([p.rara for p in partes]).astype(bool),
+            silabas=np.concatenate([p.silabas for p in partes]).astype(np.int16),
+            lema=np.concatenate([p.lema for p in partes]).astype(np.uint64),
+            num_oraciones=int(sum(p.num_oraciones for p in partes))
+        )
 
 
 class AnalizadorLexileChile:
@@ -22,30 +455,128 @@ class AnalizadorLexileChile:
     
     Attributes:
         nlp: Modelo de procesamiento de lenguaje natural de spaCy
-        frecuencias: Diccionario de frecuencias de palabras comunes
+        frecuencias: Léxico de frecuencias (LexicoFrecuencias)
     """
     
-    def __init__(self):
-        """Inicializa el analizador cargando el modelo de spaCy."""
-        print("Inicializando analizador para sistema educativo chileno...")
-        try:
-            self.nlp = spacy.load("es_core_news_sm")
-            print("✓ Modelo cargado correctamente\n")
-        except:
-            print("❌ Error: Modelo de spaCy no encontrado")
-            print("Ejecuta: python -m spacy download es_core_news_sm")
-            raise
+    def __init__(self, perfil='completo', cache=None, lexico=None, almacen=None,
+                 parametros=None, verbose=True):
+        """
+        Inicializa el analizador.
+        
+        El modelo de spaCy se carga recién en el primer análisis (o al
+        acceder a ``nlp``), de modo que crear el analizador es rápido.
+        
+        Args:
+            perfil: Perfil de pipeline a usar ('completo' o 'ligero').
+                El perfil 'ligero' desactiva NER y el parser, que
+                ``analizar`` no necesita, y es bastante más rápido.
+            cache: Instancia opcional de CacheResultados para reutilizar
+                resultados de textos ya analizados
+            lexico: Léxico de frecuencias a usar: instancia de
+                LexicoFrecuencias o ruta a un archivo creado con
+                ``convertir_tsv``. Por defecto, el diccionario incluido
+                de palabras comunes.
+            almacen: Almacén de documentos tokenizados: instancia de
+                AlmacenDocumentos o ruta a su archivo. ``analizar`` guarda
+                ahí las características por palabra y las reutiliza en
+                vez de volver a pasar el texto por spaCy.
+            parametros: Parámetros de puntaje: ruta a un archivo creado
+                con ``calibrar`` o dict de ``cargar_parametros``. Por
+                defecto, PARAMETROS_LEXILE y LIMITES_NIVELES_CHILE.
+            verbose: Mostrar los mensajes de carga. Con False el
+                analizador no escribe nada al inicializarse ni al cargar
+                el modelo, sin tocar ``sys.stdout`` (útil en hilos y
+                procesos trabajadores).
+        """
+        if perfil not in PERFILES_PIPELINE:
+            raise ValueError(
+                f"Perfil desconocido: {perfil}. "
+                f"Opciones: {', '.join(PERFILES_PIPELINE)}"
+            )
+        self.perfil = perfil
+        self.cache = cache
+        self.verbose = verbose
+        self._nlp = None
+        self._version = None
+        
+        if isinstance(almacen, str):
+            try:
+                from .almacen import AlmacenDocumentos
+            except ImportError:
+                from almacen import AlmacenDocumentos
+            almacen = AlmacenDocumentos(almacen)
+        self.almacen = almacen
+        
+        if isinstance(parametros, str):
+            parametros = cargar_parametros(parametros)
+        if parametros is None:
+            self.coeficientes = PARAMETROS_LEXILE
+            self.limites_niveles = LIMITES_NIVELES_CHILE
+            self.version_parametros = VERSION_PARAMETROS
+        else:
+            self.coeficientes = parametros['coeficientes']
+            self.limites_niveles = np.asarray(parametros['limites_niveles'], dtype=np.float64)
+            # La versión incluye un resumen de los valores, para que la
+            # caché distinga archivos distintos con la misma versión
+            resumen = hashlib.sha256(json.dumps(
+                [self.coeficientes, self.limites_niveles.tolist()], sort_keys=True
+            ).encode('utf-8')).hexdigest()[:16]
+            self.version_parametros = f"{parametros['version']}+{resumen}"
+        
+        self._mensaje("Inicializando analizador para sistema educativo chileno...")
+        
+        if lexico is None:
+            self.frecuencias = _lexico_comun()
+        elif isinstance(lexico, str):
+            self.frecuencias = LexicoFrecuencias.cargar(lexico)
+        else:
+            self.frecuencias = lexico
+        self._mensaje(f"✓ Diccionario con {len(self.frecuencias)} palabras comunes")
+        self._mensaje("✓ Sistema educativo: Chile 🇨🇱\n")
+    
+    def _mensaje(self, texto):
+        """Muestra un mensaje de carga si el analizador es verbose."""
+        if self.verbose:
+            print(texto)
+    
+    @property
+    def nlp(self):
+        """Modelo de spaCy, cargado la primera vez que se usa."""
+        if self._nlp is None:
+            try:
+                self._nlp = self._cargar_modelo(self.perfil)
+                self._mensaje(f"✓ Modelo cargado correctamente (perfil {self.perfil})\n")
+            except:
+                self._mensaje("❌ Error: Modelo de spaCy no encontrado")
+                self._mensaje("Ejecuta: python -m spacy download es_core_news_sm")
+                raise
+        return self._nlp
+    
+    @staticmethod
+    def _cargar_modelo(perfil):
+        """Carga el modelo de spaCy según el perfil de pipeline."""
+        import spacy
         
-        self.frecuencias = self._cargar_frecuencias_expandidas()
-        print(f"✓ Diccionario con {len(self.frecuencias)} palabras comunes")
-        print("✓ Sistema educativo: Chile 🇨🇱\n")
+        config = PERFILES_PIPELINE[perfil]
+        nlp = spacy.load(MODELO_SPACY, exclude=config['exclude'])
+        
+        if config['senter']:
+            if 'senter' in nlp.disabled:
+                nlp.enable_pipe('senter')
+            elif not {'senter', 'sentencizer'} & set(nlp.pipe_names):
+                nlp.add_pipe('sentencizer')
+        
+        return nlp
     
-    def analizar(self, texto: str) -> dict:
+    def analizar(self, texto: str, incluir_caracteristicas=False) -> dict:
         """
         Analiza un texto y retorna su nivel Lexile.
         
         Args:
             texto: Texto a analizar (string)
+            incluir_caracteristicas: Si es True, agrega al resultado la
+                clave 'caracteristicas' con los arreglos por palabra
+                (CaracteristicasTexto). Este modo no usa la caché.
             
         Returns:
             dict: Diccionario con los resultados del análisis:
@@ -56,72 +587,325 @@ class AnalizadorLexileChile:
                 - edad: Rango de edad recomendado
                 - confianza: Nivel de confianza del análisis
                 - estadisticas: Métricas detalladas del texto
+                - tiempos: Milisegundos por etapa (solo con la
+                  instrumentación activa, ver ``instrumentacion.activar``)
         """
         texto = texto.strip()
         if not texto:
             return {'error': 'Texto vacío'}
         
-        doc = self.nlp(texto)
-        oraciones = list(doc.sents)
+        crono = instrumentacion.cronometro('analizar')
+        # Con almacén, los resultados se recalculan desde las características
+        # guardadas, así cada documento analizado queda en el almacén
+        usar_cache = (self.cache is not None and self.almacen is None
+                      and not incluir_caracteristicas)
         
-        if not oraciones:
-            return {'error': 'No se detectaron oraciones'}
+        if usar_cache:
+            clave = self._clave_cache(texto)
+            resultado = self.cache.obtener(clave)
+            crono.marcar('cache')
+            if resultado is not None:
+                return crono.anotar(resultado)
         
-        palabras = [t for t in doc if not t.is_punct and not t.is_space]
-        num_palabras = len(palabras)
+        caracteristicas = self._caracteristicas_texto(texto, crono)
+        agregados = AgregadosTexto().agregar(caracteristicas)
+        crono.marcar('metricas')
         
-        if num_palabras == 0:
-            return {'error': 'No se detectaron palabras'}
+        resultado = self._resultado_desde_agregados(agregados)
+        crono.marcar('puntaje')
         
-        # Calcular métricas
-        longitudes_oraciones = []
-        for sent in oraciones:
-            palabras_sent = [t for t in sent if not t.is_punct and not t.is_space]
-            longitudes_oraciones.append(len(palabras_sent))
+        if usar_cache:
+            self.cache.guardar(clave, resultado)
+        elif incluir_caracteristicas and 'error' not in resultado:
+            resultado['caracteristicas'] = caracteristicas
         
-        long_promedio = np.mean(longitudes_oraciones)
-        long_desv = np.std(longitudes_oraciones)
+        return crono.anotar(resultado)
+    
+    def _caracteristicas_texto(self, texto, crono=None):
+        """
+        Obtiene las características por palabra de un texto ya limpio.
         
-        # Frecuencia de palabras
-        palabras_raras = 0
-        rankings = []
-        
-        for palabra in palabras:
-            lemma = palabra.lemma_.lower()
-            if lemma in self.frecuencias:
-                rankings.append(self.frecuencias[lemma])
-            elif palabra.text.lower() in self.frecuencias:
-                rankings.append(self.frecuencias[palabra.text.lower()])
-            else:
-                rankings.append(2000)
-                palabras_raras += 1
+        Usa el almacén de documentos si está configurado y, si el texto
+        no está ahí, lo pasa por spaCy y lo guarda.
+        """
+        crono = crono or instrumentacion.cronometro('analizar')
+        caracteristicas = None
+        if self.almacen is not None:
+            clave_documento = self._clave_almacen(texto)
+            caracteristicas = self.almacen.obtener(clave_documento)
+            crono.marcar('almacen')
         
-        freq_promedio = np.mean(rankings) if rankings else 1000
-        percentil_raras = (palabras_raras / num_palabras) * 100
+        if caracteristicas is None:
+            caracteristicas = self._caracteristicas_nlp(texto)
+            crono.marcar('nlp')
+            if self.almacen is not None:
+                self.almacen.guardar(clave_documento, caracteristicas)
         
-        # Análisis de sílabas
-        total_silabas = sum(self._contar_silabas(p.text) for p in palabras)
-        silabas_promedio = total_silabas / num_palabras if num_palabras > 0 else 0
+        return caracteristicas
+    
+    def _caracteristicas_nlp(self, texto):
+        """
+        Pasa un texto ya limpio por spaCy, párrafo a párrafo.
         
-        # Palabras complejas
-        palabras_complejas = sum(1 for p in palabras if self._es_compleja(p.text))
-        ratio_complejas = palabras_complejas / num_palabras if num_palabras > 0 else 0
+        Cada párrafo es un Doc independiente, de modo que las oraciones
+        nunca cruzan un salto de párrafo y el resultado de un texto es
+        la suma exacta de los de sus párrafos (ver AnalisisIncremental).
+        """
+        docs = self.nlp.pipe(_parrafos(texto))
+        return CaracteristicasTexto.concatenar(
+            [self._extraer_caracteristicas(doc) for doc in docs]
+        )
+    
+    def analizar_lote(self, textos, batch_size=64, n_process=1):
+        """
+        Analiza múltiples textos usando el procesamiento por lotes de spaCy.
         
-        # Diversidad léxica
-        palabras_unicas = len(set(p.lemma_.lower() for p in palabras))
-        diversidad = palabras_unicas / num_palabras if num_palabras > 0 else 0
+        Los párrafos de todos los textos se envían a ``self.nlp.pipe``,
+        lo que evita el costo por llamada de ``analizar`` y permite usar
+        varios procesos.
+        
+        Args:
+            textos: Iterable de textos a analizar
+            batch_size: Cantidad de párrafos por lote enviado a spaCy
+            n_process: Número de procesos que usa spaCy
+            
+        Yields:
+            dict: Resultado de cada texto, en el mismo orden de entrada
+                y con el mismo formato que ``analizar``
+        """
+        # Resultados ya conocidos (textos vacíos o en caché) en orden de
+        # entrada; una tupla (clave, párrafos) marca un texto cuyos
+        # párrafos están pasando por spaCy
+        pendientes = deque()
+        
+        def entradas():
+            for texto in textos:
+                texto = texto.strip()
+                if not texto:
+                    pendientes.append({'error': 'Texto vacío'})
+                    continue
+                
+                clave = None
+                if self.cache is not None:
+                    clave = self._clave_cache(texto)
+                    resultado = self.cache.obtener(clave)
+                    if resultado is not None:
+                        pendientes.append(resultado)
+                        continue
+                
+                parrafos = _parrafos(texto)
+                pendientes.append((clave, len(parrafos)))
+                yield from parrafos
+        
+        docs = iter(self.nlp.pipe(
+            entradas(), batch_size=batch_size, n_process=n_process
+        ))
         
-        # Calcular Lexile
-        lexile = self._calcular_lexile(
-            long_promedio, long_desv, freq_promedio,
-            silabas_promedio, ratio_complejas, percentil_raras
+        for primero in docs:
+            while isinstance(pendientes[0], dict):
+                yield pendientes.popleft()
+            clave, num_parrafos = pendientes.popleft()
+            
+            agregados = AgregadosTexto()
+            resto = itertools.islice(docs, num_parrafos - 1)
+            for doc in itertools.chain([primero], resto):
+                self._agregar_doc(doc, agregados)
+            resultado = self._resultado_desde_agregados(agregados)
+            if clave is not None:
+                self.cache.guardar(clave, resultado)
+            yield resultado
+        
+        yield from pendientes
+    
+    def _clave_cache(self, texto):
+        """Construye la clave de caché de un texto para este analizador."""
+        return self.cache.clave_texto(
+            texto,
+            self._nombre_pipeline(),
+            self._version_modelo(),
+            f"{self.version_parametros}:{self.frecuencias.firma}"
         )
+    
+    def _clave_almacen(self, texto):
+        """Construye la clave del almacén de documentos de un texto."""
+        return self.almacen.clave_documento(
+            texto,
+            self._nombre_pipeline(),
+            self._version_modelo(),
+            self.frecuencias.firma
+        )
+    
+    def _firma_configuracion(self):
+        """
+        Todo lo que determina el resultado de un texto, como en la caché:
+        modelo, perfil, segmentación, versión del modelo, parámetros de
+        puntaje y léxico.
+        """
+        return (f"{self._nombre_pipeline()}:{self._version_modelo()}:"
+                f"{self.version_parametros}:{self.frecuencias.firma}")
+    
+    def _nombre_pipeline(self):
+        """Modelo, perfil y segmentación, tal como se usan en las claves."""
+        return f"{MODELO_SPACY}/{self.perfil}/{VERSION_SEGMENTACION}"
+    
+    def _version_modelo(self):
+        """
+        Versión del modelo de spaCy.
         
-        # Clasificar según sistema educativo chileno
-        clasificacion = self._clasificar_nivel_chile(lexile)
+        Se lee de los metadatos del paquete instalado para no cargar el
+        modelo cuando el resultado ya está en caché, una sola vez por
+        analizador (la lectura es lenta comparada con la consulta).
+        """
+        if self._version is None:
+            try:
+                self._version = importlib.metadata.version(MODELO_SPACY)
+            except Exception:
+                self._version = self.nlp.meta.get('version', '')
+        return self._version
+    
+    def analizar_streaming(self, texto, tamano_bloque=100000, batch_size=8,
+                           diversidad='exacta'):
+        """
+        Analiza un texto muy largo por párrafos, con memoria acotada.
+        
+        Cada párrafo pasa por spaCy como en ``analizar`` y solo se
+        conservan las sumas parciales de las métricas, de modo que la
+        memoria depende del largo de los párrafos y no del libro. Los
+        párrafos de más de ``tamano_bloque`` caracteres se parten en
+        oraciones (o en trozos, si una oración es más larga).
+        
+        El resultado tiene el mismo formato que ``analizar`` y, en modo
+        de diversidad 'exacta', es idéntico a él salvo en los párrafos
+        que hubo que partir.
+        
+        Args:
+            texto: Texto a analizar, o iterable de fragmentos de texto
+                (por ejemplo, páginas) que se concatenan tal cual
+            tamano_bloque: Tamaño máximo de cada párrafo en caracteres
+            batch_size: Cantidad de párrafos por lote enviado a spaCy
+            diversidad: Conteo de lemas distintos: 'exacta' o 'aproximada'
+                (HyperLogLog, memoria constante, ver diversidad.MODOS_DIVERSIDAD)
+            
+        Returns:
+            dict: Resultado del análisis, igual que ``analizar``
+        """
+        agregados = AgregadosTexto(diversidad)
+        parrafos = _dividir_en_parrafos(texto, tamano_bloque)
+        
+        for doc in self.nlp.pipe(parrafos, batch_size=batch_size):
+            self._agregar_doc(doc, agregados)
+        
+        if agregados.oraciones == 0 and agregados.palabras == 0:
+            return {'error': 'Texto vacío'}
+        
+        return self._resultado_desde_agregados(agregados)
+    
+    def _agregar_doc(self, doc, agregados):
+        """Suma las métricas de un Doc de spaCy a los agregados."""
+        agregados.agregar(self._extraer_caracteristicas(doc))
+    
+    def _extraer_caracteristicas(self, doc):
+        """
+        Extrae las características por palabra de un Doc en una sola pasada.
+        
+        Args:
+            doc: Doc de spaCy
+            
+        Returns:
+            CaracteristicasTexto: Arreglos por palabra del texto
+        """
+        oraciones = []
+        lemas = []
+        formas = []
+        num_oraciones = 0
+        
+        for num_oraciones, sent in enumerate(doc.sents, start=1):
+            for token in sent:
+                if token.is_punct or token.is_space:
+                    continue
+                oraciones.append(num_oraciones - 1)
+                lemas.append(token.lemma_.lower())
+                formas.append(token.text.lower())
+        
+        # Frecuencia de palabras: se busca el lema y, si no está, la forma
+        lema = hashes_palabras(lemas)
+        ranking = self.frecuencias.buscar_hashes(lema)
+        ranking = np.where(ranking > 0, ranking, self.frecuencias.buscar(formas))
+        rara = (ranking == 0) | (ranking > RANGO_PALABRA_RARA)
+        ranking = np.where(rara, RANGO_PALABRA_RARA, ranking)
+        
+        instrumentacion.contar('tokens', len(doc))
+        instrumentacion.contar('oraciones', num_oraciones)
+        
+        return CaracteristicasTexto(
+            oracion=np.array(oraciones, dtype=np.int32),
+            ranking=ranking.astype(np.int32),
+            rara=rara,
+            silabas=contar_silabas_lote(formas).astype(np.int16),
+            lema=lema,
+            num_oraciones=num_oraciones
+        )
+    
+    def _resultado_desde_agregados(self, agregados):
+        """Calcula el nivel Lexile a partir de las métricas agregadas."""
+        return self._resultados_desde_agregados([agregados])[0]
+    
+    def _resultados_desde_agregados(self, lista_agregados):
+        """
+        Calcula el nivel Lexile de muchos textos a partir de sus agregados.
+        
+        El puntaje y la clasificación de todos los textos se calculan en
+        una sola llamada a ``calcular_lexile_lote`` y
+        ``clasificar_niveles_lote``.
+        
+        Args:
+            lista_agregados: Lista de AgregadosTexto
+            
+        Returns:
+            list: Un resultado por texto, como ``analizar``
+        """
+        resultados = [None] * len(lista_agregados)
+        validos = []
+        for i, agregados in enumerate(lista_agregados):
+            if agregados.oraciones == 0:
+                resultados[i] = {'error': 'No se detectaron oraciones'}
+            elif agregados.palabras == 0:
+                resultados[i] = {'error': 'No se detectaron palabras'}
+            else:
+                validos.append(i)
+        
+        if not validos:
+            return resultados
+        
+        metricas = np.array([self._metricas_desde_agregados(lista_agregados[i])
+                             for i in validos], dtype=np.float64)
+        lexiles = calcular_lexile_lote(*metricas.T, self.coeficientes)
+        niveles = clasificar_niveles_lote(lexiles, self.limites_niveles)
+        
+        for i, fila, lexile, nivel in zip(validos, metricas, lexiles, niveles):
+            resultados[i] = self._armar_resultado(
+                lista_agregados[i], fila, float(lexile), NIVELES_CHILE[nivel]
+            )
+        return resultados
+    
+    def _armar_resultado(self, agregados, metricas, lexile, clasificacion):
+        """Arma el diccionario de resultado de un texto."""
+        num_palabras = agregados.palabras
+        num_oraciones = agregados.oraciones
+        
+        (long_promedio, long_desv, freq_promedio, silabas_promedio,
+         ratio_complejas, percentil_raras) = (float(m) for m in metricas)
+        
+        # Diversidad léxica
+        diversidad = len(agregados.lemas) / num_palabras
         
         # Calcular confianza
-        confianza = self._calcular_confianza(num_palabras, len(oraciones))
+        confianza = self._calcular_confianza(num_palabras, num_oraciones)
+        
+        # Se redondea con NumPy, como el promedio np.mean original:
+        # round() de Python da otro resultado en los casos límite
+        # (por ejemplo 16.15 → 16.1 en vez de 16.2)
+        palabras_por_oracion = float(round(np.float64(long_promedio), 1))
         
         return {
             'lexile': round(lexile),
@@ -132,8 +916,8 @@ class AnalizadorLexileChile:
             'confianza': confianza,
             'estadisticas': {
                 'palabras': num_palabras,
-                'oraciones': len(oraciones),
-                'palabras_por_oracion': round(long_promedio, 1),
+                'oraciones': num_oraciones,
+                'palabras_por_oracion': palabras_por_oracion,
                 'silabas_por_palabra': round(silabas_promedio, 2),
                 'palabras_raras_pct': round(percentil_raras, 1),
                 'palabras_complejas_pct': round(ratio_complejas * 100, 1),
@@ -141,43 +925,46 @@ class AnalizadorLexileChile:
             }
         }
     
-    def _calcular_lexile(self, long_prom, long_desv, freq_prom, 
-                        sil_prom, ratio_complejas, pct_raras):
-        """Calcula el nivel Lexile basado en múltiples métricas."""
-        base = 100
-        
-        # Componente de longitud de oración
-        if long_prom <= 5:
-            comp_longitud = 0
-        elif long_prom <= 10:
-            comp_longitud = (long_prom - 5) * 80
-        elif long_prom <= 20:
-            comp_longitud = 400 + (long_prom - 10) * 50
-        else:
-            comp_longitud = 900 + (long_prom - 20) * 30
-        
-        # Componente de frecuencia
-        comp_frecuencia = max(0, (freq_prom - 1.5) * 200)
+    @staticmethod
+    def _metricas_desde_agregados(agregados):
+        """
+        Calcula las seis métricas que usa la fórmula Lexile.
         
-        # Componente de palabras raras
-        if long_prom > 8:
-            comp_raras = pct_raras * 2
-        else:
-            comp_raras = pct_raras * 0.5
+        Args:
+            agregados: AgregadosTexto con al menos una oración y una palabra
+            
+        Returns:
+            tuple: (long_prom, long_desv, freq_prom, sil_prom,
+                ratio_complejas, pct_raras), en el orden de ``_calcular_lexile``
+        """
+        num_palabras = agregados.palabras
+        num_oraciones = agregados.oraciones
         
-        # Componente de sílabas
-        comp_silabas = max(0, (sil_prom - 1.8) * 150)
+        # Longitud de oraciones (promedio y desviación estándar)
+        long_promedio = agregados.suma_longitudes / num_oraciones
+        varianza = agregados.suma_cuadrados_longitudes / num_oraciones - long_promedio ** 2
+        long_desv = math.sqrt(max(0.0, varianza))
         
-        # Componente de palabras complejas
-        comp_complejas = ratio_complejas * 100
+        # Frecuencia de palabras
+        freq_promedio = agregados.suma_rankings / num_palabras
+        percentil_raras = (agregados.palabras_raras / num_palabras) * 100
         
-        # Componente de variabilidad
-        comp_variabilidad = long_desv * 8
+        # Análisis de sílabas
+        silabas_promedio = agregados.silabas / num_palabras
         
-        lexile = (base + comp_longitud + comp_frecuencia + comp_raras + 
-                 comp_silabas + comp_complejas + comp_variabilidad)
+        # Palabras complejas
+        ratio_complejas = agregados.palabras_complejas / num_palabras
         
-        return max(50, min(1600, lexile))
+        return (long_promedio, long_desv, freq_promedio,
+                silabas_promedio, ratio_complejas, percentil_raras)
+    
+    def _calcular_lexile(self, long_prom, long_desv, freq_prom, 
+                        sil_prom, ratio_complejas, pct_raras):
+        """Calcula el nivel Lexile basado en múltiples métricas."""
+        return float(calcular_lexile_lote(
+            long_prom, long_desv, freq_prom,
+            sil_prom, ratio_complejas, pct_raras, self.coeficientes
+        ))
     
     def _clasificar_nivel_chile(self, lexile):
         """
@@ -189,48 +976,7 @@ class AnalizadorLexileChile:
         Returns:
             dict: Información de la clasificación
         """
-        if lexile < 300:
-            return {
-                'grado': '1º-2º Básico',
-                'nivel': 'Inicial',
-                'edad': '6-7 años'
-            }
-        elif lexile < 500:
-            return {
-                'grado': '3º-4º Básico',
-                'nivel': 'Elemental',
-                'edad': '8-9 años'
-            }
-        elif lexile < 700:
-            return {
-                'grado': '5º-6º Básico',
-                'nivel': 'Intermedio',
-                'edad': '10-11 años'
-            }
-        elif lexile < 900:
-            return {
-                'grado': '7º-8º Básico',
-                'nivel': 'Avanzado Básico',
-                'edad': '12-13 años'
-            }
-        elif lexile < 1050:
-            return {
-                'grado': '1º-2º Medio',
-                'nivel': 'Media Inicial',
-                'edad': '14-15 años'
-            }
-        elif lexile < 1200:
-            return {
-                'grado': '3º-4º Medio',
-                'nivel': 'Media Avanzada',
-                'edad': '16-17 años'
-            }
-        else:
-            return {
-                'grado': 'Universidad/Profesional',
-                'nivel': 'Superior',
-                'edad': '18+ años'
-            }
+        return dict(NIVELES_CHILE[int(clasificar_niveles_lote(lexile, self.limites_niveles))])
     
     def _calcular_confianza(self, num_palabras, num_oraciones):
         """Calcula el nivel de confianza del análisis."""
@@ -243,24 +989,14 @@ class AnalizadorLexileChile:
     
     def _contar_silabas(self, palabra):
         """Cuenta las sílabas de una palabra en español."""
-        palabra = palabra.lower()
-        vocales = 'aeiouáéíóúü'
-        silabas = 0
-        anterior_vocal = False
-        
-        for char in palabra:
-            es_vocal = char in vocales
-            if es_vocal and not anterior_vocal:
-                silabas += 1
-            anterior_vocal = es_vocal
-        
-        return max(1, silabas)
+        return contar_silabas(palabra.lower())
     
     def _es_compleja(self, palabra):
         """Determina si una palabra es compleja (3+ sílabas)."""
         return self._contar_silabas(palabra) >= 3
     
-    def _cargar_frecuencias_expandidas(self):
+    @staticmethod
+    def _cargar_frecuencias_expandidas():
         """Carga diccionario expandido de frecuencias de palabras comunes."""
         # Diccionario básico de palabras más frecuentes en español
         palabras_base = {
@@ -318,4 +1054,162 @@ class AnalizadorLexileChile:
         print(f"   • Palabras complejas: {resultado['estadisticas']['palabras_complejas_pct']}%")
         print(f"   • Diversidad léxica: {resultado['estadisticas']['diversidad_lexica']}")
         print()
+        if 'tiempos' in resultado:
+            print("⏱️  Tiempos (ms):")
+            for etapa, ms in resultado['tiempos'].items():
+                print(f"   • {etapa}: {ms}")
+            print()
         print("=" * 70)
+
+
+@functools.lru_cache(maxsize=None)
+def _lexico_comun():
+    """Léxico incluido de palabras comunes, construido una sola vez."""
+    return LexicoFrecuencias.desde_diccionario(
+        AnalizadorLexileChile._cargar_frecuencias_expandidas()
+    )
+
+
+# Separadores usados para dividir los textos en párrafos y los párrafos
+# demasiado largos en oraciones
+_FIN_PARRAFO = re.compile(r'\n\s*\n')
+_FIN_ORACION = re.compile(r'(?<=[.!?…])\s+')
+_ESPACIOS = ' \t\n\r\f\v\xa0'
+
+
+def _cortar(texto, separador):
+    """Divide un texto en partes que conservan su separador final."""
+    inicio = 0
+    for coincidencia in separador.finditer(texto):
+        yield texto[inicio:coincidencia.end()]
+        inicio = coincidencia.end()
+    if inicio < len(texto):
+        yield texto[inicio:]
+
+
+def _partir_parrafo(parrafo, tamano_bloque):
+    """
+    Divide un párrafo demasiado largo en grupos de oraciones consecutivas
+    de hasta ``tamano_bloque`` caracteres, o en trozos si una oración es
+    más larga (ver ``_partir_oracion``).
+    """
+    if len(parrafo) <= tamano_bloque:
+        yield parrafo
+        return
+    
+    grupo = []
+    largo = 0
+    for oracion in _cortar(parrafo, _FIN_ORACION):
+        if grupo and largo + len(oracion) > tamano_bloque:
+            yield ''.join(grupo)
+            grupo = []
+            largo = 0
+        if len(oracion) > tamano_bloque:
+            yield from _partir_oracion(oracion, tamano_bloque)
+        else:
+            grupo.append(oracion)
+            largo += len(oracion)
+    
+    if grupo:
+        yield ''.join(grupo)
+
+
+def _partir_oracion(oracion, tamano_bloque):
+    """
+    Divide una oración demasiado larga en trozos de hasta ``tamano_bloque``.
+    
+    Cada trozo termina en el último espacio dentro del límite, para no
+    partir palabras; solo se corta en el límite mismo si no hay ninguno.
+    """
+    inicio = 0
+    while len(oracion) - inicio > tamano_bloque:
+        limite = inicio + tamano_bloque
+        espacio = max(oracion.rfind(caracter, inicio, limite)
+                      for caracter in _ESPACIOS)
+        fin = espacio + 1 if espacio >= 0 else limite
+        yield oracion[inicio:fin]
+        inicio = fin
+    yield oracion[inicio:]
+
+
+def _parrafos(texto):
+    """Párrafos no vacíos de un texto, sin espacios al inicio ni al final."""
+    return [parrafo for parrafo in map(str.strip, _FIN_PARRAFO.split(texto))
+            if parrafo]
+
+
+def _dividir_en_parrafos(texto, tamano_bloque):
+    """
+    Entrega los párrafos de ``_parrafos`` sin tener el texto completo.
+    
+    Un párrafo repartido entre dos fragmentos se une antes de entregarlo.
+    Los de más de ``tamano_bloque`` caracteres se parten con
+    ``_partir_parrafo``.
+    
+    Args:
+        texto: Texto, o iterable de fragmentos de texto
+        tamano_bloque: Tamaño máximo de cada párrafo en caracteres
+        
+    Yields:
+        str: Párrafos sin espacios al inicio ni al final
+    """
+    fragmentos = [texto] if isinstance(texto, str) else texto
+    pendiente = ''
+    
+    def partes(parrafo):
+        for parte in _partir_parrafo(parrafo.strip(), tamano_bloque):
+            parte = parte.strip()
+            if parte:
+                yield parte
+    
+    for fragmento in fragmentos:
+        texto = pendiente + fragmento
+        inicio = 0
+        for fin_parrafo in _FIN_PARRAFO.finditer(texto):
+            yield from partes(texto[inicio:fin_parrafo.start()])
+            inicio = fin_parrafo.end()
+        # El último párrafo puede seguir en el fragmento siguiente
+        pendiente = texto[inicio:]
+        if len(pendiente) > tamano_bloque:
+            yield from partes(pendiente)
+            pendiente = ''
+    
+    yield from partes(pendiente)
+
+
+def comparar_perfiles(textos, tolerancia=TOLERANCIA_PERFIL_LIGERO):
+    """
+    Verifica que el perfil ligero entregue el mismo Lexile que el completo.
+    
+    Analiza los textos con ambos perfiles y compara los niveles Lexile
+    obtenidos.
+    
+    Args:
+        textos: Lista de textos de referencia
+        tolerancia: Diferencia máxima aceptada en puntos Lexile
+        
+    Returns:
+        dict: Resultado de la verificación:
+            - diferencias: Diferencia absoluta de Lexile por texto
+            - diferencia_maxima: Mayor diferencia observada
+            - dentro_tolerancia: True si todas las diferencias son
+              menores o iguales a la tolerancia
+    """
+    textos = list(textos)
+    completo = AnalizadorLexileChile(perfil='completo')
+    ligero = AnalizadorLexileChile(perfil='ligero')
+    
+    diferencias = []
+    for r_completo, r_ligero in zip(completo.analizar_lote(textos),
+                                    ligero.analizar_lote(textos)):
+        if 'error' in r_completo or 'error' in r_ligero:
+            continue
+        diferencias.append(abs(r_completo['lexile'] - r_ligero['lexile']))
+    
+    diferencia_maxima = max(diferencias) if diferencias else 0
+    
+    return {
+        'diferencias': diferencias,
+        'diferencia_maxima': diferencia_maxima,
+        'dentro_tolerancia': diferencia_maxima <= tolerancia
+    }
@@ -0,0 +1,178 @@
+"""
+Interfaz asíncrona (asyncio) del Analizador Lexile
+Envía el análisis a un pool de ejecutores administrado, limitando los
+documentos en curso para no saturar el proceso
+"""
+
+import asyncio
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+try:
+    from .analizador_lexile import AnalizadorLexileChile
+    from .utilidades import cargar_documento
+except ImportError:
+    from analizador_lexile import AnalizadorLexileChile
+    from utilidades import cargar_documento
+
+
+# Analizador del proceso o hilo trabajador, cargado una sola vez
+_analizador_proceso = None
+_local = threading.local()
+
+
+class AnalizadorAsincrono:
+    """
+    Fachada asyncio sobre AnalizadorLexileChile.
+    
+    El trabajo de CPU se ejecuta en un pool de hilos o de procesos, cada
+    uno con su propio analizador. Un semáforo limita los documentos en
+    curso: cuando se alcanza el máximo, ``analizar_async`` espera antes
+    de encolar más trabajo, lo que aplica contrapresión a quien llama.
+    
+    Ejemplo:
+        async with AnalizadorAsincrono(max_en_curso=8) as analizador:
+            resultado = await analizador.analizar_async(texto)
+            async for r in analizador.analizar_stream(textos):
+                ...
+    
+    Attributes:
+        max_en_curso: Máximo de documentos enviados al pool a la vez
+        trabajadores: Número de hilos o procesos del pool
+    """
+    
+    def __init__(self, max_en_curso=8, trabajadores=1, procesos=False,
+                 **opciones_analizador):
+        """
+        Inicializa la fachada y su pool de ejecutores.
+        
+        Args:
+            max_en_curso: Máximo de documentos en curso
+            trabajadores: Número de hilos o procesos del pool
+            procesos: Si es True usa procesos en vez de hilos
+            **opciones_analizador: Argumentos para AnalizadorLexileChile
+        """
+        self.max_en_curso = max_en_curso
+        self.trabajadores = trabajadores
+        self._opciones = opciones_analizador
+        self._semaforo = None
+        
+        if procesos:
+            self._executor = ProcessPoolExecutor(
+                max_workers=trabajadores,
+                initializer=_iniciar_proceso,
+                initargs=(opciones_analizador,)
+            )
+            self._funcion = _analizar_en_proceso
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=trabajadores)
+            self._funcion = self._analizar_en_hilo
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *excepcion):
+        await self.cerrar()
+    
+    @property
+    def semaforo(self):
+        """Semáforo de documentos en curso, creado dentro del event loop."""
+        if self._semaforo is None:
+            self._semaforo = asyncio.Semaphore(self.max_en_curso)
+        return self._semaforo
+    
+    async def analizar_async(self, texto):
+        """
+        Analiza un texto sin bloquear el event loop.
+        
+        Args:
+            texto: Texto a analizar
+            
+        Returns:
+            dict: Resultado de ``analizar``
+        """
+        async with self.semaforo:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, self._funcion, texto)
+    
+    async def analizar_stream(self, textos):
+        """
+        Analiza un flujo de textos, entregando los resultados en orden.
+        
+        Solo se toma un nuevo texto del iterable cuando hay espacio entre
+        los documentos en curso, de modo que un productor rápido no
+        acumula trabajo sin límite.
+        
+        Args:
+            textos: Iterable asíncrono (o normal) de textos
+            
+        Yields:
+            dict: Resultado de cada texto, en el mismo orden de entrada
+        """
+        en_curso = deque()
+        
+        async for texto in _como_asincrono(textos):
+            if len(en_curso) >= self.max_en_curso:
+                yield await en_curso.popleft()
+            en_curso.append(asyncio.ensure_future(self.analizar_async(texto)))
+        
+        while en_curso:
+            yield await en_curso.popleft()
+    
+    async def cargar_documento_async(self, ruta, **opciones):
+        """
+        Carga un documento sin bloquear el event loop.
+        
+        La lectura (y la extracción de PDF) se hace en el pool de hilos
+        por defecto del event loop, separado del pool de análisis.
+        
+        Args:
+            ruta: Ruta al archivo (PDF, TXT, MD, etc.)
+            **opciones: Argumentos adicionales para ``cargar_documento``
+            
+        Returns:
+            str: Texto extraído del documento
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, lambda: cargar_documento(ruta, **opciones)
+        )
+    
+    async def cerrar(self):
+        """Detiene el pool de ejecutores, esperando el trabajo en curso."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._executor.shutdown)
+    
+    def _analizar_en_hilo(self, texto):
+        """Analiza un texto con el analizador propio del hilo actual."""
+        analizador = getattr(_local, 'analizador', None)
+        if analizador is None:
+            # Sin mensajes: redirigir sys.stdout desde un hilo afectaría
+            # a todo el proceso
+            analizador = AnalizadorLexileChile(**self._opciones, verbose=False)
+            analizador.nlp
+            _local.analizador = analizador
+        return analizador.analizar(texto)
+
+
+async def _como_asincrono(textos):
+    """Recorre un iterable normal o asíncrono como asíncrono."""
+    if hasattr(textos, '__aiter__'):
+        async for texto in textos:
+            yield texto
+    else:
+        for texto in textos:
+            yield texto
+
+
+def _iniciar_proceso(opciones_analizador):
+    """Carga el analizador en el proceso trabajador, sin mensajes."""
+    global _analizador_proceso
+    _analizador_proceso = AnalizadorLexileChile(**opciones_analizador, verbose=False)
+    _analizador_proceso.nlp
+
+
+def _analizar_en_proceso(texto):
+    """Analiza un texto con el analizador del proceso trabajador."""
+    return _analizador_proceso.analizar(texto)
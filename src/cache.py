@@ -0,0 +1,249 @@
+"""
+Caché en disco para el Analizador Lexile
+Evita repetir el análisis de spaCy y la extracción de PDF en textos
+y archivos que no han cambiado
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+try:
+    from . import instrumentacion
+except ImportError:
+    import instrumentacion
+
+
+# Directorio por defecto de la caché
+DIRECTORIO_CACHE = os.path.join(
+    os.path.expanduser('~'), '.cache', 'analizador_lexile'
+)
+
+# Tamaño máximo por defecto de la caché (en bytes)
+TAMANO_MAXIMO_CACHE = 512 * 1024 * 1024
+
+# Segundos mínimos entre dos actualizaciones del último acceso de una
+# entrada: un acierto dentro de ese plazo es solo una lectura
+INTERVALO_ACCESO = 60.0
+
+
+class CacheResultados:
+    """
+    Caché persistente con expulsión LRU respaldada por SQLite.
+    
+    Guarda dos tipos de entradas: resultados de ``analizar``, con clave
+    en el contenido del texto, y textos extraídos de PDF, con clave en
+    la ruta, fecha de modificación y tamaño del archivo. Cuando el
+    tamaño total supera el máximo se eliminan las entradas usadas hace
+    más tiempo. Cada hilo usa su propia conexión a la base de datos.
+    
+    El tamaño total se mantiene en una fila de metadatos (actualizada
+    por triggers), la base usa el modo WAL para que los procesos lean
+    sin bloquearse y el último acceso de una entrada se actualiza a lo
+    más una vez cada INTERVALO_ACCESO segundos, de modo que un acierto
+    normalmente no escribe en la base.
+    
+    Attributes:
+        directorio: Carpeta donde se guarda la base de datos
+        tamano_maximo: Tamaño máximo de la caché en bytes
+        aciertos: Número de consultas encontradas en la caché
+        fallos: Número de consultas no encontradas
+    """
+    
+    def __init__(self, directorio=None, tamano_maximo=TAMANO_MAXIMO_CACHE):
+        """
+        Inicializa la caché.
+        
+        Args:
+            directorio: Carpeta de la caché (por defecto ~/.cache/analizador_lexile)
+            tamano_maximo: Tamaño máximo en bytes antes de expulsar entradas
+        """
+        self.directorio = directorio or DIRECTORIO_CACHE
+        self.tamano_maximo = tamano_maximo
+        self.aciertos = 0
+        self.fallos = 0
+        self._local = threading.local()
+    
+    def __getstate__(self):
+        # Las conexiones de SQLite no se pueden copiar entre procesos
+        estado = self.__dict__.copy()
+        del estado['_local']
+        return estado
+    
+    def __setstate__(self, estado):
+        self.__dict__.update(estado)
+        self._local = threading.local()
+    
+    @property
+    def conexion(self):
+        """Conexión a la base de datos del hilo actual, abierta al primer uso."""
+        conexion = getattr(self._local, 'conexion', None)
+        if conexion is None:
+            os.makedirs(self.directorio, exist_ok=True)
+            ruta = os.path.join(self.directorio, 'cache.sqlite3')
+            conexion = sqlite3.connect(ruta, timeout=30)
+            conexion.execute("PRAGMA journal_mode=WAL")
+            conexion.execute("PRAGMA synchronous=NORMAL")
+            self._local.conexion = conexion
+            with conexion:
+                conexion.execute(
+                    "CREATE TABLE IF NOT EXISTS entradas ("
+                    " clave TEXT PRIMARY KEY,"
+                    " valor TEXT NOT NULL,"
+                    " tamano INTEGER NOT NULL,"
+                    " ultimo_acceso REAL NOT NULL)"
+                )
+                conexion.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_acceso"
+                    " ON entradas (ultimo_acceso)"
+                )
+                # Tamaño total, mantenido por triggers; en una base creada
+                # antes de existir la tabla se calcula una sola vez
+                conexion.execute(
+                    "CREATE TABLE IF NOT EXISTS metadatos ("
+                    " nombre TEXT PRIMARY KEY,"
+                    " valor INTEGER NOT NULL)"
+                )
+                conexion.execute(
+                    "INSERT OR IGNORE INTO metadatos"
+                    " SELECT 'tamano_total', COALESCE(SUM(tamano), 0) FROM entradas"
+                )
+                conexion.execute(
+                    "CREATE TRIGGER IF NOT EXISTS tamano_insertar"
+                    " AFTER INSERT ON entradas BEGIN"
+                    " UPDATE metadatos SET valor = valor + NEW.tamano"
+                    " WHERE nombre = 'tamano_total'; END"
+                )
+                conexion.execute(
+                    "CREATE TRIGGER IF NOT EXISTS tamano_borrar"
+                    " AFTER DELETE ON entradas BEGIN"
+                    " UPDATE metadatos SET valor = valor - OLD.tamano"
+                    " WHERE nombre = 'tamano_total'; END"
+                )
+                conexion.execute(
+                    "CREATE TRIGGER IF NOT EXISTS tamano_actualizar"
+                    " AFTER UPDATE OF tamano ON entradas BEGIN"
+                    " UPDATE metadatos SET valor = valor + NEW.tamano - OLD.tamano"
+                    " WHERE nombre = 'tamano_total'; END"
+                )
+        return conexion
+    
+    @staticmethod
+    def clave_texto(texto, modelo, version_modelo, version_parametros):
+        """
+        Construye la clave de un resultado de análisis.
+        
+        Args:
+            texto: Texto analizado
+            modelo: Nombre del modelo de spaCy
+            version_modelo: Versión del modelo de spaCy
+            version_parametros: Versión de los parámetros de puntaje
+            
+        Returns:
+            str: Clave de la entrada
+        """
+        resumen = hashlib.sha256(texto.encode('utf-8')).hexdigest()
+        return f"analisis:{modelo}:{version_modelo}:{version_parametros}:{resumen}"
+    
+    @staticmethod
+    def clave_archivo(ruta, version_extractor=''):
+        """
+        Construye la clave del texto extraído de un archivo.
+        
+        Args:
+            ruta: Ruta al archivo
+            version_extractor: Versión del código y las bibliotecas que
+                extraen el texto (ver ``utilidades.version_extractor``)
+            
+        Returns:
+            str: Clave de la entrada
+        """
+        info = os.stat(ruta)
+        ruta = os.path.abspath(ruta)
+        return f"archivo:{version_extractor}:{ruta}:{info.st_mtime_ns}:{info.st_size}"
+    
+    def obtener(self, clave):
+        """
+        Busca una entrada en la caché.
+        
+        Args:
+            clave: Clave de la entrada
+            
+        Returns:
+            El valor guardado, o None si no existe
+        """
+        fila = self.conexion.execute(
+            "SELECT valor, ultimo_acceso FROM entradas WHERE clave = ?", (clave,)
+        ).fetchone()
+        
+        if fila is None:
+            self.fallos += 1
+            instrumentacion.contar('cache.fallos')
+            return None
+        
+        self.aciertos += 1
+        instrumentacion.contar('cache.aciertos')
+        ahora = time.time()
+        if ahora - fila[1] >= INTERVALO_ACCESO:
+            self.conexion.execute(
+                "UPDATE entradas SET ultimo_acceso = ? WHERE clave = ?",
+                (ahora, clave)
+            )
+            self.conexion.commit()
+        return json.loads(fila[0])
+    
+    def guardar(self, clave, valor):
+        """
+        Guarda una entrada y expulsa las más antiguas si se supera el máximo.
+        
+        Args:
+            clave: Clave de la entrada
+            valor: Valor serializable en JSON
+        """
+        datos = json.dumps(valor, ensure_ascii=False)
+        # UPSERT en vez de INSERT OR REPLACE, para que el reemplazo active
+        # el trigger de actualización del tamaño total
+        self.conexion.execute(
+            "INSERT INTO entradas VALUES (?, ?, ?, ?)"
+            " ON CONFLICT(clave) DO UPDATE SET valor = excluded.valor,"
+            " tamano = excluded.tamano, ultimo_acceso = excluded.ultimo_acceso",
+            (clave, datos, len(datos.encode('utf-8')), time.time())
+        )
+        self._expulsar()
+        self.conexion.commit()
+    
+    def limpiar(self):
+        """Elimina todas las entradas de la caché."""
+        self.conexion.execute("DELETE FROM entradas")
+        self.conexion.commit()
+        self.conexion.execute("VACUUM")
+    
+    def tamano(self):
+        """Retorna el tamaño total de las entradas en bytes."""
+        fila = self.conexion.execute(
+            "SELECT valor FROM metadatos WHERE nombre = 'tamano_total'"
+        ).fetchone()
+        return fila[0]
+    
+    def _expulsar(self):
+        """Elimina las entradas menos usadas hasta respetar el tamaño máximo."""
+        exceso = self.tamano() - self.tamano_maximo
+        if exceso <= 0:
+            return
+        
+        cursor = self.conexion.execute(
+            "SELECT clave, tamano FROM entradas ORDER BY ultimo_acceso"
+        )
+        expulsadas = []
+        for clave, tamano in cursor:
+            if exceso <= 0:
+                break
+            expulsadas.append((clave,))
+            exceso -= tamano
+        
+        self.conexion.executemany(
+            "DELETE FROM entradas WHERE clave = ?", expulsadas
+        )
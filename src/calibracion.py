@@ -0,0 +1,506 @@
+"""
+Calibración de la fórmula Lexile
+Ajusta los coeficientes de la fórmula y los límites de los niveles
+educativos a un conjunto de textos con nivel conocido (por ejemplo,
+lecturas etiquetadas por curso según MINEDUC)
+"""
+
+import csv
+import datetime
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+try:
+    from .analizador_lexile import (
+        AgregadosTexto, AnalizadorLexileChile, FORMATO_PARAMETROS,
+        LIMITES_NIVELES_CHILE, NIVELES_CHILE, PARAMETROS_LEXILE,
+        VERSION_PARAMETROS, calcular_lexile_lote, clasificar_niveles_lote
+    )
+    from .cache import CacheResultados
+    from .utilidades import cargar_documento, version_extractor
+except ImportError:
+    from analizador_lexile import (
+        AgregadosTexto, AnalizadorLexileChile, FORMATO_PARAMETROS,
+        LIMITES_NIVELES_CHILE, NIVELES_CHILE, PARAMETROS_LEXILE,
+        VERSION_PARAMETROS, calcular_lexile_lote, clasificar_niveles_lote
+    )
+    from cache import CacheResultados
+    from utilidades import cargar_documento, version_extractor
+
+
+# Métricas por documento, en el orden de los argumentos de calcular_lexile_lote
+COLUMNAS_METRICAS = ('long_prom', 'long_desv', 'freq_prom',
+                     'sil_prom', 'ratio_complejas', 'pct_raras')
+
+# Coeficientes lineales de la fórmula que ajusta ``calibrar`` por mínimos
+# cuadrados, en el orden de las columnas de _matriz_diseno
+COEFICIENTES_LINEALES = (
+    'base',
+    'pendiente_longitud_1', 'pendiente_longitud_2', 'pendiente_longitud_3',
+    'factor_frecuencia', 'factor_raras_largas', 'factor_raras_cortas',
+    'factor_silabas', 'factor_complejas', 'factor_variabilidad',
+)
+
+# Umbrales de la fórmula que ``calibrar`` busca en una grilla, con la
+# columna de la matriz de métricas de la que se toman los candidatos
+UMBRALES_BUSQUEDA = {
+    'umbral_frecuencia': COLUMNAS_METRICAS.index('freq_prom'),
+    'umbral_raras': COLUMNAS_METRICAS.index('long_prom'),
+    'umbral_silabas': COLUMNAS_METRICAS.index('sil_prom'),
+}
+
+# Candidatos por umbral: percentiles de la métrica correspondiente
+PERCENTILES_BUSQUEDA = np.linspace(0, 90, 10)
+
+# Coeficientes que la fórmula aplica dentro de max(0, ...): solo son
+# lineales si no son negativos, así que el ajuste los restringe a >= 0
+COEFICIENTES_NO_NEGATIVOS = ('factor_frecuencia', 'factor_silabas')
+
+# Analizador de cada proceso trabajador de ``matriz_metricas``
+_analizador = None
+
+# Datos de la calibración en cada proceso trabajador
+_metricas = None
+_etiquetas = None
+_base = None
+
+
+def leer_etiquetas(ruta_csv):
+    """
+    Lee un archivo CSV de textos etiquetados.
+    
+    El archivo tiene las columnas 'ruta' y 'grado'. El grado puede ser
+    el nombre de un nivel de NIVELES_CHILE ('5º-6º Básico') o su índice
+    (0 a 6). Las rutas relativas se resuelven desde la carpeta del CSV.
+    
+    Args:
+        ruta_csv: Ruta al archivo CSV
+    
+    Returns:
+        tuple: (rutas, etiquetas), con las etiquetas como np.ndarray de
+            índices de nivel
+    
+    Raises:
+        ValueError: Si un grado no corresponde a ningún nivel
+    """
+    indices = {nivel['grado']: i for i, nivel in enumerate(NIVELES_CHILE)}
+    carpeta = os.path.dirname(os.path.abspath(ruta_csv))
+    rutas = []
+    etiquetas = []
+    
+    with open(ruta_csv, 'r', encoding='utf-8', newline='') as f:
+        for fila in csv.DictReader(f):
+            grado = fila['grado'].strip()
+            if grado in indices:
+                etiqueta = indices[grado]
+            elif grado.isdigit() and int(grado) < len(NIVELES_CHILE):
+                etiqueta = int(grado)
+            else:
+                raise ValueError(f"Grado desconocido: {grado}")
+            rutas.append(os.path.join(carpeta, fila['ruta']))
+            etiquetas.append(etiqueta)
+    
+    return rutas, np.array(etiquetas, dtype=np.int64)
+
+
+def _iniciar_metricas(perfil, cache, lexico, almacen):
+    """Carga el analizador en el proceso trabajador, sin mensajes."""
+    global _analizador
+    _analizador = AnalizadorLexileChile(perfil=perfil, cache=cache, lexico=lexico,
+                                        almacen=almacen, verbose=False)
+    _analizador.nlp
+
+
+def _metricas_ruta(ruta, analizador=None):
+    """
+    Calcula las seis métricas de un archivo.
+    
+    Args:
+        ruta: Ruta del archivo
+        analizador: Analizador a usar (por defecto, el del proceso trabajador)
+    
+    Returns:
+        tuple: (metricas, error); metricas es None si el archivo no se
+            pudo cargar o analizar, y error explica el motivo
+    """
+    analizador = analizador or _analizador
+    try:
+        texto = cargar_documento(ruta, cache=analizador.cache).strip()
+        if not texto:
+            return None, 'texto vacío'
+        agregados = AgregadosTexto().agregar(analizador._caracteristicas_texto(texto))
+    except Exception as e:
+        return None, str(e) or type(e).__name__
+    
+    if agregados.oraciones == 0:
+        return None, 'no se detectaron oraciones'
+    if agregados.palabras == 0:
+        return None, 'no se detectaron palabras'
+    return analizador._metricas_desde_agregados(agregados), None
+
+
+def matriz_metricas(rutas, ruta_cache=None, procesos=None, perfil='completo',
+                    cache=None, lexico=None, almacen=None):
+    """
+    Calcula la matriz de métricas de un conjunto de documentos.
+    
+    Es el único paso que usa spaCy. Con ``ruta_cache`` la matriz se
+    guarda en un archivo .npz y, en la siguiente llamada, solo se
+    calculan los documentos nuevos o modificados (o todos, si cambia el
+    modelo de spaCy, su versión o el léxico). Los documentos que no se
+    pueden cargar o analizar se informan con su ruta y el motivo.
+    
+    Args:
+        rutas: Rutas a los documentos
+        ruta_cache: Archivo .npz donde guardar la matriz (opcional)
+        procesos (int): Número de procesos (por defecto, uno por núcleo)
+        perfil (str): Perfil del pipeline de spaCy
+        cache: Instancia opcional de CacheResultados (texto de los PDF)
+        lexico: Ruta a un léxico de frecuencias binario
+        almacen: Instancia opcional de AlmacenDocumentos
+    
+    Returns:
+        np.ndarray: Matriz de forma (documentos, 6) con las columnas de
+            COLUMNAS_METRICAS; NaN en los documentos que no se pudieron
+            analizar
+    """
+    analizador = AnalizadorLexileChile(perfil=perfil, cache=cache,
+                                       lexico=lexico, almacen=almacen)
+    
+    # La firma de cada fila cambia si cambia el archivo, el extractor de
+    # texto, el modelo o el léxico
+    prefijo = (f"{analizador._nombre_pipeline()}:{analizador._version_modelo()}:"
+               f"{analizador.frecuencias.firma}")
+    extractor = version_extractor()
+    firmas = []
+    for ruta in rutas:
+        try:
+            firmas.append(f"{prefijo}:{CacheResultados.clave_archivo(ruta, extractor)}")
+        except OSError:
+            firmas.append(f"{prefijo}:{os.path.abspath(ruta)}")
+    
+    guardadas = {}
+    if ruta_cache and os.path.exists(ruta_cache):
+        with np.load(ruta_cache) as datos:
+            guardadas = dict(zip(datos['firmas'].tolist(), datos['metricas']))
+    
+    matriz = np.full((len(rutas), len(COLUMNAS_METRICAS)), np.nan)
+    faltantes = []
+    for i, firma in enumerate(firmas):
+        if firma in guardadas:
+            matriz[i] = guardadas[firma]
+        else:
+            faltantes.append(i)
+    
+    if faltantes:
+        print(f"📐 Calculando métricas de {len(faltantes)} documentos "
+              f"({len(rutas) - len(faltantes)} en caché)")
+        pendientes = [rutas[i] for i in faltantes]
+        
+        if procesos is None:
+            procesos = os.cpu_count() or 1
+        procesos = max(1, min(procesos, len(pendientes)))
+        
+        fallidos = []
+        if procesos == 1:
+            calculadas = (_metricas_ruta(ruta, analizador) for ruta in pendientes)
+            for i, (metricas, error) in zip(faltantes, calculadas):
+                if metricas is None:
+                    fallidos.append((rutas[i], error))
+                else:
+                    matriz[i] = metricas
+        else:
+            with ProcessPoolExecutor(max_workers=procesos,
+                                     initializer=_iniciar_metricas,
+                                     initargs=(perfil, cache, lexico, almacen)) as executor:
+                calculadas = executor.map(_metricas_ruta, pendientes, chunksize=4)
+                for i, (metricas, error) in zip(faltantes, calculadas):
+                    if metricas is None:
+                        fallidos.append((rutas[i], error))
+                    else:
+                        matriz[i] = metricas
+        
+        if fallidos:
+            print(f"⚠️  {len(fallidos)} documentos sin métricas (no se usan en el ajuste):")
+            for ruta, error in fallidos:
+                print(f"   • {ruta}: {error}")
+        
+        if ruta_cache:
+            # Los documentos que fallaron se vuelven a intentar la próxima vez
+            guardadas.update((firma, fila) for firma, fila in zip(firmas, matriz)
+                             if not np.isnan(fila).any())
+            np.savez(ruta_cache, firmas=np.array(list(guardadas)),
+                     metricas=np.array(list(guardadas.values())))
+    
+    return matriz
+
+
+def ajustar_limites(lexile, etiquetas):
+    """
+    Calcula los límites de los niveles que mejor separan los textos.
+    
+    Cada límite queda en el punto medio entre las medianas Lexile de
+    dos niveles consecutivos. Las medianas se fuerzan crecientes y los
+    niveles sin textos se interpolan desde los vecinos.
+    
+    Args:
+        lexile: Nivel Lexile de cada texto
+        etiquetas: Índice de nivel de cada texto
+    
+    Returns:
+        np.ndarray: Límites inferiores de los niveles, desde el segundo
+    """
+    presentes = np.unique(etiquetas)
+    medianas = np.array([np.median(lexile[etiquetas == k]) for k in presentes])
+    medianas = np.maximum.accumulate(medianas)
+    todas = np.interp(np.arange(len(NIVELES_CHILE)), presentes, medianas)
+    return (todas[:-1] + todas[1:]) / 2
+
+
+def evaluar(coeficientes, metricas, etiquetas, limites=None):
+    """
+    Mide qué tan bien clasifican unos coeficientes los textos etiquetados.
+    
+    Args:
+        coeficientes: Coeficientes de la fórmula (como PARAMETROS_LEXILE)
+        metricas: Matriz de ``matriz_metricas`` (sin filas NaN)
+        etiquetas: Índice de nivel de cada texto
+        limites: Límites de los niveles; por defecto se ajustan con
+            ``ajustar_limites``
+    
+    Returns:
+        tuple: (error_medio, exactitud, limites). El error medio es la
+            distancia promedio, en niveles, entre el nivel asignado y el
+            etiquetado; la exactitud, la proporción de aciertos exactos.
+    """
+    lexile = calcular_lexile_lote(*metricas.T, parametros=coeficientes)
+    if limites is None:
+        limites = ajustar_limites(lexile, etiquetas)
+    asignados = clasificar_niveles_lote(lexile, limites)
+    error_medio = float(np.mean(np.abs(asignados - etiquetas)))
+    exactitud = float(np.mean(asignados == etiquetas))
+    return error_medio, exactitud, limites
+
+
+def centros_niveles(limites=LIMITES_NIVELES_CHILE, coeficientes=PARAMETROS_LEXILE):
+    """
+    Nivel Lexile al centro de cada nivel educativo.
+    
+    Es el valor objetivo de los textos de cada nivel al calibrar.
+    
+    Args:
+        limites: Límites inferiores de los niveles, desde el segundo
+        coeficientes: Coeficientes con 'lexile_minimo' y 'lexile_maximo'
+        
+    Returns:
+        np.ndarray: Centro de cada nivel de NIVELES_CHILE
+    """
+    bordes = np.concatenate([[coeficientes['lexile_minimo']], limites,
+                             [coeficientes['lexile_maximo']]])
+    return (bordes[:-1] + bordes[1:]) / 2
+
+
+def _matriz_diseno(metricas, coeficientes):
+    """
+    Términos de la fórmula que multiplican a cada coeficiente lineal.
+    
+    Con los cortes y umbrales de ``coeficientes`` fijos, la fórmula es
+    lineal en COEFICIENTES_LINEALES: Lexile = matriz @ coeficientes,
+    siempre que los de COEFICIENTES_NO_NEGATIVOS no sean negativos (la
+    fórmula calcula max(0, (x - umbral) * factor)).
+    """
+    long_prom, long_desv, freq_prom, sil_prom, ratio_complejas, pct_raras = metricas.T
+    corte_1 = coeficientes['corte_longitud_1']
+    corte_2 = coeficientes['corte_longitud_2']
+    corte_3 = coeficientes['corte_longitud_3']
+    largas = long_prom > coeficientes['umbral_raras']
+    
+    return np.column_stack([
+        np.ones(len(metricas)),
+        np.clip(long_prom - corte_1, 0, corte_2 - corte_1),
+        np.clip(long_prom - corte_2, 0, corte_3 - corte_2),
+        np.maximum(0, long_prom - corte_3),
+        np.maximum(0, freq_prom - coeficientes['umbral_frecuencia']),
+        np.where(largas, pct_raras, 0),
+        np.where(largas, 0, pct_raras),
+        np.maximum(0, sil_prom - coeficientes['umbral_silabas']),
+        ratio_complejas,
+        long_desv,
+    ])
+
+
+def _minimos_cuadrados(matriz, objetivo):
+    """
+    Mínimos cuadrados con COEFICIENTES_NO_NEGATIVOS restringidos a >= 0.
+    
+    Si la solución libre los respeta, es la óptima. Si no, el óptimo
+    restringido anula alguno de ellos: se prueban todas las formas de
+    anularlos (son pocos) y gana la factible de menor residuo.
+    """
+    solucion, *_ = np.linalg.lstsq(matriz, objetivo, rcond=None)
+    restringidos = [COEFICIENTES_LINEALES.index(nombre)
+                    for nombre in COEFICIENTES_NO_NEGATIVOS]
+    if (solucion[restringidos] >= 0).all():
+        return solucion
+    
+    mejor, mejor_residuo = None, np.inf
+    for cantidad in range(1, len(restringidos) + 1):
+        for anulados in itertools.combinations(restringidos, cantidad):
+            libres = [i for i in range(matriz.shape[1]) if i not in anulados]
+            parcial, *_ = np.linalg.lstsq(matriz[:, libres], objetivo, rcond=None)
+            candidata = np.zeros(matriz.shape[1])
+            candidata[libres] = parcial
+            if (candidata[restringidos] < 0).any():
+                continue
+            residuo = float(np.sum((matriz @ candidata - objetivo) ** 2))
+            if residuo < mejor_residuo:
+                mejor, mejor_residuo = candidata, residuo
+    return mejor
+
+
+def _ajustar_candidato(umbrales):
+    """
+    Ajusta los coeficientes lineales para unos umbrales dados.
+    
+    Resuelve por mínimos cuadrados (con COEFICIENTES_NO_NEGATIVOS >= 0)
+    la distancia entre el Lexile de cada texto y el centro de su nivel,
+    y luego mide la clasificación.
+    Se ejecuta en el proceso trabajador.
+    
+    Returns:
+        tuple: (puntaje, coeficientes); menor puntaje es mejor
+    """
+    coeficientes = {**_base, **umbrales}
+    matriz = _matriz_diseno(_metricas, coeficientes)
+    objetivo = centros_niveles(coeficientes=coeficientes)[_etiquetas]
+    solucion = _minimos_cuadrados(matriz, objetivo)
+    coeficientes.update(zip(COEFICIENTES_LINEALES, solucion.tolist()))
+    
+    error_medio, exactitud, _ = evaluar(coeficientes, _metricas, _etiquetas)
+    residuo = float(np.sqrt(np.mean((matriz @ solucion - objetivo) ** 2)))
+    return (error_medio, -exactitud, residuo), coeficientes
+
+
+def _iniciar_calibracion(metricas, etiquetas, base):
+    """Recibe la matriz de métricas en el proceso trabajador."""
+    global _metricas, _etiquetas, _base
+    _metricas = metricas
+    _etiquetas = etiquetas
+    _base = base
+
+
+def calibrar(metricas, etiquetas, coeficientes=None, procesos=None):
+    """
+    Ajusta los coeficientes y los límites de nivel a textos etiquetados.
+    
+    Los umbrales de la fórmula (UMBRALES_BUSQUEDA) se buscan en una
+    grilla formada por percentiles de cada métrica; la grilla completa
+    se reparte entre los procesos. Para cada combinación, los
+    coeficientes lineales (COEFICIENTES_LINEALES) se ajustan por
+    mínimos cuadrados, sin factores negativos donde la fórmula los
+    recorta, para acercar el Lexile de cada texto al centro
+    de su nivel, y los límites de nivel con ``ajustar_limites``. Gana
+    la combinación con menor error medio en niveles, luego mayor
+    exactitud y luego menor residuo.
+    
+    Args:
+        metricas: Matriz de ``matriz_metricas``; las filas NaN se omiten
+        etiquetas: Índice de nivel de cada texto
+        coeficientes: Coeficientes de partida, de los que se conservan
+            los cortes de longitud y el rango Lexile (por defecto,
+            PARAMETROS_LEXILE)
+        procesos (int): Número de procesos (por defecto, uno por núcleo)
+        
+    Returns:
+        dict: 'coeficientes', 'limites_niveles', 'error_medio', 'exactitud'
+            y 'documentos' (textos usados)
+    """
+    validas = ~np.isnan(metricas).any(axis=1)
+    metricas = np.ascontiguousarray(metricas[validas])
+    etiquetas = np.asarray(etiquetas)[validas]
+    if len(metricas) == 0:
+        raise ValueError("No hay documentos con métricas válidas para calibrar")
+    
+    base = dict(coeficientes or PARAMETROS_LEXILE)
+    
+    # Grilla de umbrales: el valor actual y percentiles de cada métrica
+    valores = [
+        np.unique(np.append(np.percentile(metricas[:, columna], PERCENTILES_BUSQUEDA),
+                            base[nombre]))
+        for nombre, columna in UMBRALES_BUSQUEDA.items()
+    ]
+    candidatos = [dict(zip(UMBRALES_BUSQUEDA, map(float, combinacion)))
+                  for combinacion in itertools.product(*valores)]
+    
+    if procesos is None:
+        procesos = os.cpu_count() or 1
+    procesos = max(1, min(procesos, len(candidatos)))
+    
+    print(f"📐 Probando {len(candidatos)} combinaciones de umbrales "
+          f"con {len(metricas)} textos ({procesos} procesos)")
+    
+    inicial = evaluar(base, metricas, etiquetas)
+    print(f"📐 Parámetros actuales: error medio {inicial[0]:.3f} niveles, "
+          f"exactitud {inicial[1]:.1%}")
+    
+    if procesos == 1:
+        _iniciar_calibracion(metricas, etiquetas, base)
+        resultados = map(_ajustar_candidato, candidatos)
+        puntaje, mejores = min(resultados, key=lambda r: r[0])
+    else:
+        with ProcessPoolExecutor(max_workers=procesos,
+                                 initializer=_iniciar_calibracion,
+                                 initargs=(metricas, etiquetas, base)) as executor:
+            resultados = executor.map(
+                _ajustar_candidato, candidatos,
+                chunksize=max(1, len(candidatos) // (4 * procesos))
+            )
+            puntaje, mejores = min(resultados, key=lambda r: r[0])
+    
+    error_medio, exactitud, limites = evaluar(mejores, metricas, etiquetas)
+    print(f"📐 Calibrado: error medio {error_medio:.3f} niveles, "
+          f"exactitud {exactitud:.1%}")
+    
+    return {
+        'coeficientes': mejores,
+        'limites_niveles': limites.tolist(),
+        'error_medio': error_medio,
+        'exactitud': exactitud,
+        'documentos': int(len(metricas)),
+    }
+
+
+def guardar_parametros(calibracion, ruta_salida, version=None):
+    """
+    Guarda el resultado de ``calibrar`` como archivo de parámetros.
+    
+    El archivo se carga con ``AnalizadorLexileChile(parametros=ruta)``.
+    Su versión forma parte de la clave de caché de los resultados.
+    
+    Args:
+        calibracion (dict): Resultado de ``calibrar``
+        ruta_salida (str): Ruta del archivo JSON
+        version (str): Versión de los parámetros (por defecto, la fecha)
+    """
+    version = version or f"calibrado-{datetime.date.today().isoformat()}"
+    datos = {
+        'formato': FORMATO_PARAMETROS,
+        'version': version,
+        'coeficientes': calibracion['coeficientes'],
+        'limites_niveles': calibracion['limites_niveles'],
+        'calibracion': {
+            'documentos': calibracion['documentos'],
+            'error_medio': calibracion['error_medio'],
+            'exactitud': calibracion['exactitud'],
+            'version_base': VERSION_PARAMETROS,
+            'limites_base': LIMITES_NIVELES_CHILE.tolist(),
+        },
+    }
+    with open(ruta_salida, 'w', encoding='utf-8') as f:
+        json.dump(datos, f, ensure_ascii=False, indent=2)
+    
+    print(f"\n✓ Parámetros guardados en: {ruta_salida} (versión {version})")
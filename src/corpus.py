@@ -0,0 +1,242 @@
+"""
+Análisis de corpus en paralelo
+Distribuye la carga y el análisis de muchos documentos entre procesos
+"""
+
+import itertools
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+try:
+    from .analizador_lexile import AnalizadorLexileChile
+    from .resumen_corpus import ResumenAgrupado
+    from .utilidades import cargar_documento
+except ImportError:
+    from analizador_lexile import AnalizadorLexileChile
+    from resumen_corpus import ResumenAgrupado
+    from utilidades import cargar_documento
+
+
+# Analizador del proceso trabajador, cargado una sola vez por proceso
+_analizador = None
+
+
+def analizar_corpus(rutas, procesos=None, tamano_bloque=4,
+                    perfil='completo', analizador=None, cache=None,
+                    lexico=None, bloques_en_curso=None, almacen=None,
+                    parametros=None):
+    """
+    Carga y analiza una lista de documentos usando varios procesos.
+    
+    Cada proceso trabajador carga el modelo de spaCy una sola vez y
+    recibe los archivos en bloques de ``tamano_bloque``. Los errores
+    de un archivo se reportan en su resultado sin detener el resto.
+    
+    Las rutas se consumen de forma perezosa: con un generador (por
+    ejemplo, ``recorrer_archivos``) los resultados empiezan a salir
+    antes de terminar el recorrido, y solo ``bloques_en_curso`` bloques
+    esperan en el pool a la vez.
+    
+    Args:
+        rutas: Rutas a los archivos (PDF, TXT, MD, etc.); lista o iterable
+        procesos (int): Número de procesos (por defecto, uno por núcleo).
+            Con 1 se analiza en el proceso actual, sin pool.
+        tamano_bloque (int): Archivos entregados a cada proceso por vez
+        perfil (str): Perfil del pipeline de spaCy ('completo' o 'ligero')
+        analizador: Instancia de AnalizadorLexileChile a reutilizar
+            cuando ``procesos`` es 1
+        cache: Instancia opcional de CacheResultados, compartida por
+            todos los procesos
+        lexico: Ruta a un léxico de frecuencias binario; cada proceso
+            lo abre con memmap y comparten la misma memoria
+        bloques_en_curso (int): Bloques enviados al pool sin entregar
+            (por defecto, dos por proceso)
+        almacen: Instancia opcional de AlmacenDocumentos donde guardar
+            las características por palabra de cada archivo, para
+            reevaluar el corpus sin spaCy
+        parametros: Parámetros de puntaje (ruta o dict de ``cargar_parametros``)
+        
+    Yields:
+        dict: Un resultado por archivo, en el mismo orden de entrada:
+            - nombre: Nombre del archivo
+            - ruta: Ruta del archivo
+            - resultado: Resultado de ``analizar`` (si no hubo error)
+            - error: Mensaje de error (si la carga o el análisis falló)
+    """
+    if procesos is None:
+        procesos = os.cpu_count() or 1
+    if isinstance(rutas, (list, tuple)):
+        procesos = min(procesos, len(rutas))
+    procesos = max(1, procesos)
+    
+    if procesos == 1:
+        analizador = analizador or AnalizadorLexileChile(
+            perfil=perfil, cache=cache, lexico=lexico, almacen=almacen,
+            parametros=parametros
+        )
+        for ruta in rutas:
+            item, clave = _procesar_ruta(ruta, analizador)
+            _registrar_en_almacen(analizador.almacen, item, clave)
+            yield item
+        return
+    
+    bloques_en_curso = bloques_en_curso or 2 * procesos
+    rutas = iter(rutas)
+    
+    # Las rutas se registran en el almacén desde este proceso, en el
+    # orden de entrada, para que ``reevaluar`` las entregue igual
+    if isinstance(almacen, str):
+        try:
+            from .almacen import AlmacenDocumentos
+        except ImportError:
+            from almacen import AlmacenDocumentos
+        almacen = AlmacenDocumentos(almacen)
+    
+    def entregar(futuro):
+        for item, clave in futuro.result():
+            _registrar_en_almacen(almacen, item, clave)
+            yield item
+    
+    with ProcessPoolExecutor(max_workers=procesos,
+                             initializer=_iniciar_trabajador,
+                             initargs=(perfil, cache, lexico, almacen,
+                                       parametros)) as executor:
+        en_curso = deque()
+        while True:
+            bloque = list(itertools.islice(rutas, tamano_bloque))
+            if not bloque:
+                break
+            # Entregar en orden lo ya terminado y esperar si la cola está llena
+            while en_curso and (len(en_curso) >= bloques_en_curso
+                                or en_curso[0].done()):
+                yield from entregar(en_curso.popleft())
+            en_curso.append(executor.submit(_procesar_bloque, bloque))
+        
+        while en_curso:
+            yield from entregar(en_curso.popleft())
+
+
+def resumir_corpus(rutas, agrupar=None, procesos=None, tamano_bloque=4,
+                   perfil='completo', analizador=None, cache=None,
+                   lexico=None, bloques_en_curso=None, almacen=None,
+                   parametros=None):
+    """
+    Analiza un corpus y devuelve solo su resumen estadístico.
+    
+    Cada proceso trabajador resume su bloque de archivos y entrega un
+    ResumenAgrupado parcial, que se combina con el resto en el orden en
+    que terminan los bloques. Ni los procesos ni el proceso principal
+    guardan los resultados individuales.
+    
+    Args:
+        rutas: Rutas a los archivos; lista o iterable
+        agrupar: Función ruta → grupo, definida a nivel de módulo para
+            poder enviarla a los procesos (por ejemplo,
+            ``functools.partial(grupo_por_directorio, nivel=2)``)
+        procesos, tamano_bloque, perfil, analizador, cache, lexico,
+        bloques_en_curso, almacen, parametros: Como en ``analizar_corpus``
+    
+    Returns:
+        ResumenAgrupado: Resumen total y por grupo del corpus
+    """
+    if procesos is None:
+        procesos = os.cpu_count() or 1
+    if isinstance(rutas, (list, tuple)):
+        procesos = min(procesos, len(rutas))
+    procesos = max(1, procesos)
+    
+    resumen = ResumenAgrupado()
+    
+    if procesos == 1:
+        for item in analizar_corpus(rutas, procesos=1, perfil=perfil,
+                                    analizador=analizador, cache=cache,
+                                    lexico=lexico, almacen=almacen,
+                                    parametros=parametros):
+            resumen.agregar(item, agrupar(item['ruta']) if agrupar else None)
+        return resumen
+    
+    bloques_en_curso = bloques_en_curso or 2 * procesos
+    rutas = iter(rutas)
+    
+    with ProcessPoolExecutor(max_workers=procesos,
+                             initializer=_iniciar_trabajador,
+                             initargs=(perfil, cache, lexico, almacen,
+                                       parametros)) as executor:
+        en_curso = set()
+        while True:
+            bloque = list(itertools.islice(rutas, tamano_bloque))
+            if not bloque:
+                break
+            # La combinación es conmutativa: se suma el primer bloque que termine
+            while len(en_curso) >= bloques_en_curso:
+                terminados, en_curso = wait(en_curso, return_when=FIRST_COMPLETED)
+                for futuro in terminados:
+                    resumen.combinar(futuro.result())
+            en_curso.add(executor.submit(_resumir_bloque, bloque, agrupar))
+        
+        for futuro in en_curso:
+            resumen.combinar(futuro.result())
+    
+    return resumen
+
+
+def _iniciar_trabajador(perfil, cache, lexico, almacen=None, parametros=None):
+    """Carga el analizador en el proceso trabajador, sin mensajes."""
+    global _analizador
+    _analizador = AnalizadorLexileChile(perfil=perfil, cache=cache,
+                                        lexico=lexico, almacen=almacen,
+                                        parametros=parametros, verbose=False)
+    _analizador.nlp
+
+
+def _procesar_ruta(ruta, analizador=None):
+    """
+    Carga y analiza un archivo, capturando cualquier error.
+    
+    Args:
+        ruta: Ruta del archivo
+        analizador: Analizador a usar (por defecto, el del proceso trabajador)
+    
+    Returns:
+        tuple: (item, clave); clave es la del documento en el almacén
+            del analizador, o None si no hay almacén o hubo un error
+    """
+    analizador = analizador or _analizador
+    item = {'nombre': os.path.basename(ruta), 'ruta': ruta}
+    clave = None
+    try:
+        texto = cargar_documento(ruta, cache=analizador.cache)
+        item['resultado'] = analizador.analizar(texto)
+        if analizador.almacen is not None and 'error' not in item['resultado']:
+            clave = analizador._clave_almacen(texto.strip())
+    except Exception as e:
+        item['error'] = str(e)
+    return item, clave
+
+
+def _registrar_en_almacen(almacen, item, clave):
+    """Registra la ruta de un item en el almacén, con su documento o su error."""
+    if almacen is None:
+        return
+    if clave is not None:
+        almacen.asociar(item['ruta'], clave)
+    elif 'error' in item:
+        almacen.asociar(item['ruta'], error={'error': item['error']})
+    else:
+        almacen.asociar(item['ruta'], error={'resultado': item['resultado']})
+
+
+def _procesar_bloque(rutas):
+    """Procesa un bloque de archivos en el proceso trabajador."""
+    return [_procesar_ruta(ruta) for ruta in rutas]
+
+
+def _resumir_bloque(rutas, agrupar):
+    """Procesa un bloque de archivos y devuelve solo su resumen parcial."""
+    resumen = ResumenAgrupado()
+    for ruta in rutas:
+        item, clave = _procesar_ruta(ruta)
+        _registrar_en_almacen(_analizador.almacen, item, clave)
+        resumen.agregar(item, agrupar(ruta) if agrupar else None)
+    return resumen
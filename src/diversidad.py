@@ -0,0 +1,276 @@
+"""
+Conteo de lemas distintos para la diversidad léxica
+Los lemas se internan como identificadores enteros de 64 bits
+(``lexico.hash_palabra``) y se cuentan en arreglos compactos o,
+en modo aproximado, con un bosquejo HyperLogLog de memoria fija
+"""
+
+import math
+
+import numpy as np
+
+
+# Modos de conteo de lemas distintos
+#
+# 'exacta': arreglo ordenado de identificadores uint64, 8 bytes por lema
+#     distinto (un set de enteros de Python usa del orden de 60-70).
+#     El único error posible es que dos lemas compartan hash de 64 bits:
+#     con n lemas distintos se esperan n² / 2**65 colisiones, es decir,
+#     ninguna en la práctica (3e-8 para un millón de lemas).
+#
+# 'aproximada': HyperLogLog con 2**PRECISION_HLL registros de un byte,
+#     memoria constante (16 KiB con la precisión por defecto) sin
+#     importar el largo del texto o del corpus. El error estándar
+#     relativo del número de lemas distintos es 1.04 / sqrt(2**precision):
+#     0,81 % con precisión 14, de modo que cerca del 95 % de las
+#     estimaciones quedan dentro de ±1,6 %. El estimador de Ertl (2017)
+#     mantiene esa cota también con pocos lemas, sin cambio de fórmula.
+MODOS_DIVERSIDAD = ('exacta', 'aproximada')
+
+# Identificadores acumulados sin ordenar antes de compactar el conjunto exacto
+TAMANO_PENDIENTE_LEMAS = 2 ** 16
+
+# Precisión por defecto de HyperLogLog (bits usados para elegir el registro)
+PRECISION_HLL = 14
+
+
+def crear_contador(modo='exacta'):
+    """
+    Crea un contador de lemas distintos.
+    
+    Args:
+        modo: 'exacta' (ConjuntoLemas) o 'aproximada' (HyperLogLog)
+    
+    Returns:
+        ConjuntoLemas o HyperLogLog
+    """
+    if modo == 'exacta':
+        return ConjuntoLemas()
+    if modo == 'aproximada':
+        return HyperLogLog()
+    raise ValueError(
+        f"Modo de diversidad desconocido: {modo}. "
+        f"Opciones: {', '.join(MODOS_DIVERSIDAD)}"
+    )
+
+
+class ConjuntoLemas:
+    """
+    Conjunto exacto de identificadores de lemas en un arreglo uint64.
+    
+    Los identificadores nuevos se acumulan y se fusionan con el arreglo
+    ordenado (``np.unique``) al consultar el tamaño o cuando superan
+    TAMANO_PENDIENTE_LEMAS, para no ordenar en cada agregado.
+    """
+    
+    def __init__(self):
+        self._ids = np.zeros(0, dtype=np.uint64)
+        self._pendientes = []
+        self._num_pendientes = 0
+    
+    def agregar(self, ids):
+        """
+        Agrega identificadores de lemas (con o sin repetidos).
+        
+        Args:
+            ids: Arreglo de identificadores (uint64)
+        """
+        ids = np.asarray(ids, dtype=np.uint64)
+        self._pendientes.append(ids)
+        self._num_pendientes += len(ids)
+        if self._num_pendientes > TAMANO_PENDIENTE_LEMAS:
+            self._compactar()
+    
+    def combinar(self, otro):
+        """
+        Une los lemas de otro ConjuntoLemas a este.
+        
+        Args:
+            otro: Instancia de ConjuntoLemas
+        
+        Returns:
+            ConjuntoLemas: Esta misma instancia, ya combinada
+        """
+        if not isinstance(otro, ConjuntoLemas):
+            raise TypeError("Solo se puede combinar con otro ConjuntoLemas")
+        self.agregar(otro.ids)
+        return self
+    
+    @property
+    def ids(self):
+        """Identificadores distintos, ordenados (uint64)."""
+        self._compactar()
+        return self._ids
+    
+    def _compactar(self):
+        """Fusiona los identificadores pendientes con el arreglo ordenado."""
+        if self._pendientes:
+            self._ids = np.unique(np.concatenate([self._ids, *self._pendientes]))
+            self._pendientes = []
+            self._num_pendientes = 0
+    
+    def __len__(self):
+        return len(self.ids)
+
+
+class ConteoLemas:
+    """
+    Lemas distintos de un texto armado por partes que se pueden quitar.
+    
+    Cuenta en cuántas partes aparece cada lema: al quitar una parte, sus
+    lemas se descuentan y solo desaparecen los que no quedan en ninguna
+    otra. El costo de agregar o quitar depende de la parte y no del
+    texto completo (ver AnalisisIncremental).
+    """
+    
+    def __init__(self):
+        self._partes = {}
+    
+    def agregar(self, ids, veces=1):
+        """
+        Agrega los lemas de una parte.
+        
+        Args:
+            ids: Identificadores distintos de la parte (ConjuntoLemas.ids)
+            veces: Número de copias de la parte
+        """
+        partes = self._partes
+        for id_lema in np.asarray(ids, dtype=np.uint64).tolist():
+            partes[id_lema] = partes.get(id_lema, 0) + veces
+    
+    def quitar(self, ids, veces=1):
+        """
+        Quita los lemas de una parte agregada antes.
+        
+        Args:
+            ids: Los mismos identificadores con que se agregó la parte
+            veces: Número de copias de la parte
+        """
+        partes = self._partes
+        for id_lema in np.asarray(ids, dtype=np.uint64).tolist():
+            restantes = partes[id_lema] - veces
+            if restantes:
+                partes[id_lema] = restantes
+            else:
+                del partes[id_lema]
+    
+    def __len__(self):
+        return len(self._partes)
+
+
+def _largo_en_bits(valores):
+    """Número de bits significativos de cada valor uint64 (0 para el cero)."""
+    # Se separa en mitades de 32 bits, que float64 representa sin redondeo
+    altos = (valores >> np.uint64(32)).astype(np.float64)
+    bajos = (valores & np.uint64(0xFFFFFFFF)).astype(np.float64)
+    return np.where(altos > 0, 32 + np.frexp(altos)[1], np.frexp(bajos)[1])
+
+
+def _sigma(x):
+    """Función sigma del estimador de Ertl (corrección de registros vacíos)."""
+    if x == 1:
+        return math.inf
+    y = 1.0
+    z = x
+    while True:
+        x *= x
+        anterior = z
+        z += x * y
+        y += y
+        if z == anterior:
+            return z
+
+
+def _tau(x):
+    """Función tau del estimador de Ertl (corrección de registros saturados)."""
+    if x == 0 or x == 1:
+        return 0.0
+    y = 1.0
+    z = 1 - x
+    while True:
+        x = math.sqrt(x)
+        anterior = z
+        y *= 0.5
+        z -= (1 - x) ** 2 * y
+        if z == anterior:
+            return z / 3
+
+
+class HyperLogLog:
+    """
+    Bosquejo HyperLogLog para estimar el número de lemas distintos.
+    
+    Usa directamente los identificadores de 64 bits de los lemas como
+    hash: los primeros ``precision`` bits eligen el registro y el resto
+    aporta la posición del primer bit en uno. Dos bosquejos de la misma
+    precisión se combinan con el máximo registro a registro, de modo que
+    la unión es asociativa y conmutativa. Ver MODOS_DIVERSIDAD para las
+    cotas de error.
+    
+    Attributes:
+        precision: Bits usados para elegir el registro
+        registros: Arreglo de 2**precision registros (uint8)
+    """
+    
+    def __init__(self, precision=PRECISION_HLL):
+        if not 4 <= precision <= 18:
+            raise ValueError("La precisión de HyperLogLog debe estar entre 4 y 18")
+        self.precision = precision
+        self.registros = np.zeros(2 ** precision, dtype=np.uint8)
+    
+    def agregar(self, ids):
+        """
+        Agrega identificadores de lemas (con o sin repetidos).
+        
+        Args:
+            ids: Arreglo de identificadores (uint64)
+        """
+        ids = np.asarray(ids, dtype=np.uint64)
+        if len(ids) == 0:
+            return
+        
+        bits_resto = 64 - self.precision
+        indices = (ids >> np.uint64(bits_resto)).astype(np.intp)
+        resto = ids & np.uint64((1 << bits_resto) - 1)
+        posicion = (bits_resto + 1 - _largo_en_bits(resto)).astype(np.uint8)
+        np.maximum.at(self.registros, indices, posicion)
+    
+    def combinar(self, otro):
+        """
+        Une otro bosquejo de la misma precisión a este.
+        
+        Args:
+            otro: Instancia de HyperLogLog
+        
+        Returns:
+            HyperLogLog: Esta misma instancia, ya combinada
+        """
+        if not isinstance(otro, HyperLogLog) or otro.precision != self.precision:
+            raise TypeError("Solo se puede combinar con un HyperLogLog de la misma precisión")
+        np.maximum(self.registros, otro.registros, out=self.registros)
+        return self
+    
+    def estimar(self):
+        """
+        Estima el número de lemas distintos.
+        
+        Usa el estimador mejorado de Ertl (2017), sin sesgo apreciable
+        en todo el rango, incluso con pocos lemas, donde el estimador
+        original de HyperLogLog necesita corrección.
+        
+        Returns:
+            float: Estimación del número de lemas distintos
+        """
+        m = len(self.registros)
+        q = 64 - self.precision
+        conteos = np.bincount(self.registros, minlength=q + 2).astype(np.float64)
+        
+        z = m * _tau(1 - conteos[q + 1] / m)
+        for k in range(q, 0, -1):
+            z = 0.5 * (z + conteos[k])
+        z += m * _sigma(conteos[0] / m)
+        
+        return float(m * m / (2 * math.log(2) * z))
+    
+    def __len__(self):
+        return int(round(self.estimar()))
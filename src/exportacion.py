@@ -0,0 +1,320 @@
+"""
+Exportación masiva de resultados
+Escribe resultados de corpus en JSONL, CSV o Parquet por bloques,
+sin mantener todos los resultados en memoria
+"""
+
+import csv
+import json
+import os
+
+
+# Columnas del esquema plano: datos del resultado y 'estadisticas' desanidado
+COLUMNAS = [
+    'nombre', 'ruta',
+    'lexile', 'rango', 'grado', 'nivel', 'edad', 'confianza',
+    'palabras', 'oraciones', 'palabras_por_oracion', 'silabas_por_palabra',
+    'palabras_raras_pct', 'palabras_complejas_pct', 'diversidad_lexica',
+    'error'
+]
+
+FORMATOS = ('jsonl', 'csv', 'parquet')
+
+_EXTENSIONES = {'.jsonl': 'jsonl', '.ndjson': 'jsonl', '.csv': 'csv',
+                '.parquet': 'parquet'}
+
+
+def formato_desde_ruta(ruta):
+    """
+    Deduce el formato de exportación a partir de la extensión.
+    
+    Args:
+        ruta (str): Ruta del archivo de salida
+    
+    Returns:
+        str: 'jsonl', 'csv', 'parquet' o None si la extensión no se reconoce
+    """
+    return _EXTENSIONES.get(os.path.splitext(ruta)[1].lower())
+
+
+def aplanar_resultado(resultado, nombre=None, ruta=None):
+    """
+    Convierte un resultado de ``analizar`` en una fila plana.
+    
+    Args:
+        resultado (dict): Resultado del análisis (puede contener 'error')
+        nombre (str): Nombre del documento
+        ruta (str): Ruta del documento
+    
+    Returns:
+        dict: Fila con todas las columnas de COLUMNAS (None si falta el dato)
+    """
+    fila = dict.fromkeys(COLUMNAS)
+    fila['nombre'] = nombre
+    fila['ruta'] = ruta
+    for clave, valor in resultado.items():
+        if clave == 'estadisticas':
+            fila.update((k, v) for k, v in valor.items() if k in fila)
+        elif clave in fila:
+            fila[clave] = valor
+    return fila
+
+
+class EscritorResultados:
+    """
+    Escritor por bloques de resultados en JSONL, CSV o Parquet.
+    
+    Las filas se acumulan en un búfer de ``tamano_bloque`` y se vuelcan
+    al archivo cuando se llena, de modo que la memoria usada no depende
+    del número total de resultados. Parquet requiere pyarrow (opcional).
+    
+    Con ``anexar=True`` las filas se agregan a un archivo existente;
+    ``rutas_escritas`` permite reanudar una ejecución interrumpida
+    saltando los documentos ya exportados. Una línea incompleta al
+    final de un JSONL o CSV (de una ejecución cortada a mitad de una
+    escritura) se descarta antes de agregar.
+    
+    Parquet no se puede reanudar: el archivo se escribe aparte y solo
+    reemplaza al de destino al cerrar sin errores, de modo que una
+    ejecución cortada deja el destino como estaba y pierde todas sus
+    filas. Anexar a un Parquet reescribe el archivo completo.
+    
+    Uso:
+        with EscritorResultados('corpus.csv') as escritor:
+            for item in analizar_corpus(rutas):
+                escritor.escribir(item.get('resultado', item), item['nombre'], item['ruta'])
+    """
+    
+    def __init__(self, ruta, formato=None, tamano_bloque=1000, anexar=False):
+        """
+        Abre el archivo de salida.
+        
+        Args:
+            ruta (str): Ruta del archivo de salida
+            formato (str): 'jsonl', 'csv' o 'parquet' (por defecto, según
+                la extensión de ``ruta``)
+            tamano_bloque (int): Filas acumuladas antes de escribir
+            anexar (bool): Agregar al archivo si ya existe, en vez de
+                reemplazarlo
+        """
+        formato = formato or formato_desde_ruta(ruta)
+        if formato not in FORMATOS:
+            raise ValueError(f"Formato no soportado: {formato}. "
+                             f"Usar uno de: {', '.join(FORMATOS)}")
+        
+        self.ruta = ruta
+        self.formato = formato
+        self.tamano_bloque = tamano_bloque
+        self.filas_escritas = 0
+        self._bufer = []
+        
+        existe = anexar and os.path.exists(ruta) and os.path.getsize(ruta) > 0
+        
+        if formato == 'parquet':
+            self._abrir_parquet(existe)
+        else:
+            if existe:
+                _recortar_linea_incompleta(ruta)
+            self._archivo = open(ruta, 'a' if existe else 'w',
+                                 encoding='utf-8', newline='')
+            if formato == 'csv':
+                self._csv = csv.DictWriter(self._archivo, fieldnames=COLUMNAS)
+                if not existe:
+                    self._csv.writeheader()
+    
+    def _abrir_parquet(self, existe):
+        """Abre un ParquetWriter, copiando antes los grupos de filas existentes."""
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError(
+                "La exportación a Parquet requiere pyarrow. "
+                "Instalar con: pip install pyarrow"
+            )
+        
+        self._pa = pa
+        self._esquema = pa.schema([
+            ('nombre', pa.string()), ('ruta', pa.string()),
+            ('lexile', pa.int64()), ('rango', pa.string()),
+            ('grado', pa.string()), ('nivel', pa.string()),
+            ('edad', pa.string()), ('confianza', pa.string()),
+            ('palabras', pa.int64()), ('oraciones', pa.int64()),
+            ('palabras_por_oracion', pa.float64()),
+            ('silabas_por_palabra', pa.float64()),
+            ('palabras_raras_pct', pa.float64()),
+            ('palabras_complejas_pct', pa.float64()),
+            ('diversidad_lexica', pa.float64()),
+            ('error', pa.string()),
+        ])
+        
+        # Parquet solo es legible después de escribir el pie del archivo:
+        # se escribe siempre un archivo temporal que reemplaza al destino
+        # al cerrar. Tampoco admite agregar filas a un archivo cerrado, así
+        # que para anexar se copian antes los grupos de filas existentes.
+        self._ruta_escritura = self.ruta + '.tmp'
+        self._parquet = pq.ParquetWriter(self._ruta_escritura, self._esquema)
+        if existe:
+            anterior = pq.ParquetFile(self.ruta)
+            for i in range(anterior.num_row_groups):
+                self._parquet.write_table(
+                    anterior.read_row_group(i).cast(self._esquema)
+                )
+    
+    def escribir(self, resultado, nombre=None, ruta=None):
+        """
+        Agrega un resultado al búfer y lo vuelca si está lleno.
+        
+        Args:
+            resultado (dict): Resultado de ``analizar``
+            nombre (str): Nombre del documento
+            ruta (str): Ruta del documento
+        """
+        self._bufer.append(aplanar_resultado(resultado, nombre, ruta))
+        if len(self._bufer) >= self.tamano_bloque:
+            self.vaciar()
+    
+    def vaciar(self):
+        """Escribe en el archivo las filas acumuladas en el búfer."""
+        if not self._bufer:
+            return
+        
+        if self.formato == 'jsonl':
+            self._archivo.writelines(
+                json.dumps(fila, ensure_ascii=False) + '\n' for fila in self._bufer
+            )
+        elif self.formato == 'csv':
+            self._csv.writerows(self._bufer)
+        else:
+            self._parquet.write_table(
+                self._pa.Table.from_pylist(self._bufer, schema=self._esquema)
+            )
+        
+        if self.formato != 'parquet':
+            self._archivo.flush()
+        
+        self.filas_escritas += len(self._bufer)
+        self._bufer = []
+    
+    def cerrar(self):
+        """Vacía el búfer y cierra el archivo."""
+        self.vaciar()
+        if self.formato == 'parquet':
+            self._parquet.close()
+            os.replace(self._ruta_escritura, self.ruta)
+        else:
+            self._archivo.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, tipo, *exc):
+        if tipo is not None and self.formato == 'parquet':
+            # El temporal quedó a medias: se descarta sin tocar el destino
+            self._parquet.close()
+            os.remove(self._ruta_escritura)
+        else:
+            self.cerrar()
+
+
+def _lineas_completas(archivo):
+    """Recorre las líneas de un archivo de texto, omitiendo una última línea sin salto."""
+    for linea in archivo:
+        if linea.endswith('\n'):
+            yield linea
+
+
+def _recortar_linea_incompleta(ruta):
+    """Trunca un archivo de texto después de su último salto de línea."""
+    with open(ruta, 'rb+') as f:
+        f.seek(0, os.SEEK_END)
+        fin = f.tell()
+        posicion = fin
+        while posicion > 0:
+            inicio = max(0, posicion - 4096)
+            f.seek(inicio)
+            bloque = f.read(posicion - inicio)
+            salto = bloque.rfind(b'\n')
+            if salto >= 0:
+                posicion = inicio + salto + 1
+                break
+            posicion = inicio
+        if posicion < fin:
+            f.truncate(posicion)
+
+
+def rutas_escritas(ruta, formato=None):
+    """
+    Lee las rutas de documentos ya exportados en un archivo de resultados.
+    
+    El archivo se recorre por partes (línea a línea o por grupo de filas),
+    sin cargarlo completo en memoria. Una última línea incompleta (de una
+    escritura interrumpida) no cuenta como exportada.
+    
+    Args:
+        ruta (str): Archivo de resultados existente
+        formato (str): Formato del archivo (por defecto, según la extensión)
+    
+    Returns:
+        set: Rutas presentes en la columna 'ruta' (vacío si el archivo no existe)
+    """
+    if not os.path.exists(ruta) or os.path.getsize(ruta) == 0:
+        return set()
+    
+    formato = formato or formato_desde_ruta(ruta)
+    rutas = set()
+    
+    if formato == 'jsonl':
+        with open(ruta, 'r', encoding='utf-8') as f:
+            for linea in _lineas_completas(f):
+                if linea.strip():
+                    rutas.add(json.loads(linea).get('ruta'))
+    elif formato == 'csv':
+        with open(ruta, 'r', encoding='utf-8', newline='') as f:
+            rutas.update(fila['ruta'] for fila in csv.DictReader(_lineas_completas(f)))
+    elif formato == 'parquet':
+        import pyarrow.parquet as pq
+        archivo = pq.ParquetFile(ruta)
+        for i in range(archivo.num_row_groups):
+            rutas.update(archivo.read_row_group(i, columns=['ruta'])
+                         .column('ruta').to_pylist())
+    else:
+        raise ValueError(f"Formato no soportado: {formato}")
+    
+    rutas.discard(None)
+    return rutas
+
+
+def exportar_resultados(items, ruta_salida, formato=None, tamano_bloque=1000,
+                        anexar=False, omitir=None):
+    """
+    Exporta en streaming los resultados de ``analizar_corpus``.
+    
+    Con ``anexar=True`` se reanuda una exportación previa: los documentos
+    cuya ruta ya está en el archivo se omiten. Para no analizarlos de
+    nuevo, filtrar las rutas con ``rutas_escritas`` antes de llamar a
+    ``analizar_corpus``.
+    
+    Args:
+        items: Iterable de dicts con 'nombre', 'ruta' y 'resultado' o 'error'
+        ruta_salida (str): Archivo de salida
+        formato (str): 'jsonl', 'csv' o 'parquet' (por defecto, según la extensión)
+        tamano_bloque (int): Filas acumuladas antes de escribir
+        anexar (bool): Agregar al archivo existente y saltar rutas ya escritas
+        omitir (set): Rutas ya escritas, si se leyeron antes con
+            ``rutas_escritas`` (por defecto, con ``anexar`` se leen aquí)
+    
+    Returns:
+        int: Número de filas escritas en esta ejecución
+    """
+    if omitir is None:
+        omitir = rutas_escritas(ruta_salida, formato) if anexar else set()
+    
+    with EscritorResultados(ruta_salida, formato, tamano_bloque, anexar) as escritor:
+        for item in items:
+            if item.get('ruta') in omitir:
+                continue
+            resultado = item.get('resultado') or {'error': item.get('error')}
+            escritor.escribir(resultado, item.get('nombre'), item.get('ruta'))
+    
+    return escritor.filas_escritas
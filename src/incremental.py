@@ -0,0 +1,116 @@
+"""
+Análisis incremental para textos en edición
+Reanaliza con spaCy solo los párrafos que cambiaron entre versiones
+"""
+
+import hashlib
+from collections import Counter
+
+try:
+    from .analizador_lexile import AgregadosTexto, _parrafos
+    from .diversidad import ConteoLemas
+except ImportError:
+    from analizador_lexile import AgregadosTexto, _parrafos
+    from diversidad import ConteoLemas
+
+
+class AnalisisIncremental:
+    """
+    Análisis de un texto que se edita párrafo a párrafo.
+    
+    Guarda los agregados de cada párrafo, identificados por el hash de
+    su contenido, y un total corriente de todo el texto. En cada
+    ``actualizar`` solo los párrafos nuevos o modificados pasan por
+    spaCy, y al total se le restan los párrafos que salieron y se le
+    suman los que entraron (los lemas distintos se llevan con
+    ConteoLemas). El trabajo depende del tamaño de la edición; de los
+    párrafos sin cambios solo se calcula el hash.
+    
+    ``analizar`` también pasa cada párrafo por spaCy por separado, así
+    que el resultado es idéntico al de ``analizar`` sobre el texto
+    completo.
+    
+    Ejemplo:
+        incremental = AnalisisIncremental(analizador, texto)
+        resultado = incremental.actualizar(texto_editado)
+    
+    Attributes:
+        analizador: Instancia de AnalizadorLexileChile
+        resultado: Resultado del último análisis
+        parrafos_reanalizados: Párrafos procesados por spaCy en la
+            última actualización
+    """
+    
+    def __init__(self, analizador, texto=None):
+        """
+        Inicializa el análisis incremental.
+        
+        Args:
+            analizador: Instancia de AnalizadorLexileChile
+            texto: Versión inicial del texto (opcional)
+        """
+        self.analizador = analizador
+        self.resultado = None
+        self.parrafos_reanalizados = 0
+        self._agregados = {}
+        self._ocurrencias = Counter()
+        self._total = AgregadosTexto()
+        self._total.lemas = ConteoLemas()
+        
+        if texto is not None:
+            self.actualizar(texto)
+    
+    def actualizar(self, texto):
+        """
+        Analiza una nueva versión del texto.
+        
+        Args:
+            texto: Texto completo, con párrafos separados por líneas en blanco
+            
+        Returns:
+            dict: Resultado del análisis, igual que ``analizar``
+        """
+        parrafos = _parrafos(texto)
+        claves = [hashlib.sha256(p.encode('utf-8')).hexdigest() for p in parrafos]
+        ocurrencias = Counter(claves)
+        
+        # Párrafos que salieron del texto (o que quedan menos veces)
+        for clave, veces in (self._ocurrencias - ocurrencias).items():
+            self._sumar(self._agregados[clave], -veces)
+            if clave not in ocurrencias:
+                del self._agregados[clave]
+        
+        # Párrafos nuevos o modificados (una vez cada uno)
+        nuevos = {
+            clave: parrafo for clave, parrafo in zip(claves, parrafos)
+            if clave not in self._agregados
+        }
+        docs = self.analizador.nlp.pipe(nuevos.values())
+        for clave, doc in zip(nuevos, docs):
+            agregados = AgregadosTexto()
+            self.analizador._agregar_doc(doc, agregados)
+            self._agregados[clave] = agregados
+        
+        # Párrafos que entraron al texto (o que quedan más veces)
+        for clave, veces in (ocurrencias - self._ocurrencias).items():
+            self._sumar(self._agregados[clave], veces)
+        
+        self._ocurrencias = ocurrencias
+        self.parrafos_reanalizados = len(nuevos)
+        
+        if not parrafos:
+            self.resultado = {'error': 'Texto vacío'}
+            return self.resultado
+        
+        self.resultado = self.analizador._resultado_desde_agregados(self._total)
+        return self.resultado
+    
+    def _sumar(self, agregados, veces):
+        """Suma (o resta, con veces negativo) un párrafo al total."""
+        for campo in AgregadosTexto.SUMAS:
+            setattr(self._total, campo,
+                    getattr(self._total, campo) + veces * getattr(agregados, campo))
+        if veces > 0:
+            self._total.lemas.agregar(agregados.lemas.ids, veces)
+        else:
+            self._total.lemas.quitar(agregados.lemas.ids, -veces)
@@ -0,0 +1,224 @@
+"""
+Instrumentación opcional del Analizador Lexile
+Temporizadores por etapa, contadores y exportadores de métricas.
+Desactivada por defecto: mientras no se active, cada punto de medición
+cuesta solo una verificación de un booleano.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+
+_activa = False
+_bloqueo = threading.Lock()
+_tiempos = {}
+_llamadas = {}
+_contadores = {}
+_exportadores = []
+
+
+def activar():
+    """Activa la instrumentación."""
+    global _activa
+    _activa = True
+
+
+def desactivar():
+    """Desactiva la instrumentación (los valores acumulados se conservan)."""
+    global _activa
+    _activa = False
+
+
+def activa():
+    """Retorna True si la instrumentación está activa."""
+    return _activa
+
+
+def reiniciar():
+    """Borra los tiempos y contadores acumulados."""
+    with _bloqueo:
+        _tiempos.clear()
+        _llamadas.clear()
+        _contadores.clear()
+
+
+def registrar_tiempo(etapa, segundos):
+    """
+    Suma un tiempo medido a una etapa.
+    
+    Args:
+        etapa: Nombre de la etapa (por ejemplo 'analizar.nlp')
+        segundos: Duración medida
+    """
+    if not _activa:
+        return
+    with _bloqueo:
+        _tiempos[etapa] = _tiempos.get(etapa, 0.0) + segundos
+        _llamadas[etapa] = _llamadas.get(etapa, 0) + 1
+
+
+def contar(nombre, cantidad=1):
+    """
+    Incrementa un contador.
+    
+    Args:
+        nombre: Nombre del contador (por ejemplo 'tokens')
+        cantidad: Valor a sumar
+    """
+    if not _activa:
+        return
+    with _bloqueo:
+        _contadores[nombre] = _contadores.get(nombre, 0) + cantidad
+
+
+@contextmanager
+def _medir_activo(etapa):
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        registrar_tiempo(etapa, time.perf_counter() - inicio)
+
+
+class _SinMedicion:
+    """Contexto vacío usado cuando la instrumentación está desactivada."""
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *excepcion):
+        return False
+
+
+_SIN_MEDICION = _SinMedicion()
+
+
+def medir(etapa):
+    """
+    Contexto que mide el tiempo de un bloque de código.
+    
+    Ejemplo:
+        with medir('pdf.extraccion'):
+            texto = _extraer_texto_pdf(ruta)
+    
+    Args:
+        etapa: Nombre de la etapa
+    """
+    if not _activa:
+        return _SIN_MEDICION
+    return _medir_activo(etapa)
+
+
+class Cronometro:
+    """
+    Mide etapas consecutivas de una misma llamada.
+    
+    Cada ``marcar`` registra el tiempo transcurrido desde la marca
+    anterior, tanto en el cronómetro como en los totales globales.
+    """
+    
+    def __init__(self, prefijo):
+        self.prefijo = prefijo
+        self.tiempos = {}
+        self._inicio = self._ultimo = time.perf_counter()
+    
+    def marcar(self, etapa):
+        """Registra el tiempo de una etapa desde la marca anterior."""
+        ahora = time.perf_counter()
+        duracion = ahora - self._ultimo
+        self._ultimo = ahora
+        self.tiempos[etapa] = self.tiempos.get(etapa, 0.0) + duracion
+        registrar_tiempo(f"{self.prefijo}.{etapa}", duracion)
+    
+    def anotar(self, resultado):
+        """
+        Agrega la sección 'tiempos' (en milisegundos) a una copia del resultado.
+        
+        Args:
+            resultado: Diccionario de resultado
+            
+        Returns:
+            dict: Copia del resultado con la sección 'tiempos'
+        """
+        tiempos = {etapa: round(s * 1000, 3) for etapa, s in self.tiempos.items()}
+        tiempos['total'] = round((self._ultimo - self._inicio) * 1000, 3)
+        return {**resultado, 'tiempos': tiempos}
+
+
+class _SinCronometro:
+    """Cronómetro vacío usado cuando la instrumentación está desactivada."""
+    
+    def marcar(self, etapa):
+        pass
+    
+    def anotar(self, resultado):
+        return resultado
+
+
+_SIN_CRONOMETRO = _SinCronometro()
+
+
+def cronometro(prefijo):
+    """
+    Crea un cronómetro, o uno vacío si la instrumentación está desactivada.
+    
+    Args:
+        prefijo: Prefijo de las etapas en los totales (por ejemplo 'analizar')
+    """
+    if not _activa:
+        return _SIN_CRONOMETRO
+    return Cronometro(prefijo)
+
+
+def instantanea():
+    """
+    Retorna una copia de las métricas acumuladas.
+    
+    Returns:
+        dict: Métricas acumuladas:
+            - tiempos: {etapa: {'segundos', 'llamadas'}}
+            - contadores: {nombre: valor}
+    """
+    with _bloqueo:
+        return {
+            'tiempos': {
+                etapa: {'segundos': round(segundos, 6), 'llamadas': _llamadas[etapa]}
+                for etapa, segundos in _tiempos.items()
+            },
+            'contadores': dict(_contadores)
+        }
+
+
+def registrar_exportador(exportador):
+    """
+    Registra una función que recibe las métricas al llamar a ``exportar``.
+    
+    Permite enviar las métricas a un sistema externo (Prometheus,
+    StatsD, un archivo de registro, etc.).
+    
+    Args:
+        exportador: Función que recibe el diccionario de ``instantanea``
+    """
+    _exportadores.append(exportador)
+
+
+def exportar():
+    """Entrega la instantánea actual a todos los exportadores registrados."""
+    datos = instantanea()
+    for exportador in _exportadores:
+        exportador(datos)
+    return datos
+
+
+def imprimir_resumen():
+    """Imprime los tiempos y contadores acumulados."""
+    datos = instantanea()
+    print("⏱️  Tiempos por etapa:")
+    for etapa, valores in sorted(datos['tiempos'].items()):
+        print(f"   • {etapa:<30} {valores['segundos'] * 1000:>10.1f} ms"
+              f"  ({valores['llamadas']} llamadas)")
+    if datos['contadores']:
+        print("🔢 Contadores:")
+        for nombre, valor in sorted(datos['contadores'].items()):
+            print(f"   • {nombre:<30} {valor:>10}")
@@ -0,0 +1,224 @@
+"""
+Léxico de frecuencias compacto para el Analizador Lexile
+Permite usar listas de frecuencia del español con cientos de miles de
+lemas, guardadas en un formato binario que se abre con memmap
+"""
+
+import functools
+import hashlib
+import struct
+
+import numpy as np
+
+
+# Encabezado del formato binario: firma, versión y número de entradas
+FIRMA_LEXICO = b'LEXCL'
+VERSION_FORMATO = 1
+_ENCABEZADO = struct.Struct('<5sBxxQ')
+
+# Máximo de palabras distintas cuyo hash se recuerda
+TAMANO_MEMO_HASH = 2 ** 18
+
+
+@functools.lru_cache(maxsize=TAMANO_MEMO_HASH)
+def hash_palabra(palabra):
+    """
+    Calcula el hash de 64 bits de una palabra.
+    
+    Es estable entre procesos y ejecuciones (a diferencia de ``hash``).
+    
+    Args:
+        palabra: Palabra en minúsculas
+        
+    Returns:
+        int: Hash de la palabra
+    """
+    resumen = hashlib.blake2b(palabra.encode('utf-8'), digest_size=8)
+    return int.from_bytes(resumen.digest(), 'little')
+
+
+def hashes_palabras(palabras):
+    """
+    Calcula el hash de 64 bits de cada palabra de una lista.
+    
+    Args:
+        palabras: Lista de palabras en minúsculas
+        
+    Returns:
+        np.ndarray: Hash de cada palabra (uint64)
+    """
+    return np.fromiter(map(hash_palabra, palabras), dtype=np.uint64,
+                       count=len(palabras))
+
+
+class LexicoFrecuencias:
+    """
+    Léxico de rankings de frecuencia indexado por hash de palabra.
+    
+    Guarda dos arreglos paralelos: los hashes de 64 bits de las palabras,
+    ordenados, y el ranking de cada una. Las búsquedas usan búsqueda
+    binaria vectorizada con ``np.searchsorted``. Cargado desde archivo,
+    los arreglos se abren con memmap, de modo que varios procesos
+    comparten la misma memoria física.
+    
+    La probabilidad de que dos palabras compartan hash es despreciable
+    (del orden de 1e-8 para un millón de lemas).
+    
+    Attributes:
+        hashes: Arreglo ordenado de hashes (uint64)
+        rangos: Ranking de cada hash (uint32)
+        firma: Resumen del contenido, usado en las claves de caché
+    """
+    
+    def __init__(self, hashes, rangos):
+        """
+        Inicializa el léxico a partir de arreglos ya ordenados.
+        
+        Args:
+            hashes: Arreglo ordenado de hashes (uint64)
+            rangos: Ranking de cada hash (uint32)
+        """
+        self.hashes = hashes
+        self.rangos = rangos
+        resumen = hashlib.blake2b(digest_size=8)
+        resumen.update(np.ascontiguousarray(hashes).tobytes())
+        resumen.update(np.ascontiguousarray(rangos).tobytes())
+        self.firma = resumen.hexdigest()
+    
+    @classmethod
+    def desde_diccionario(cls, frecuencias):
+        """
+        Construye un léxico en memoria desde un diccionario.
+        
+        Args:
+            frecuencias: Diccionario {"palabra": ranking}
+            
+        Returns:
+            LexicoFrecuencias: Léxico construido
+        """
+        hashes = np.fromiter(
+            (hash_palabra(p.lower()) for p in frecuencias),
+            dtype=np.uint64, count=len(frecuencias)
+        )
+        rangos = np.fromiter(frecuencias.values(), dtype=np.uint32,
+                             count=len(frecuencias))
+        orden = np.argsort(hashes, kind='stable')
+        return cls(hashes[orden], rangos[orden])
+    
+    @classmethod
+    def cargar(cls, ruta):
+        """
+        Abre un léxico binario creado con ``convertir_tsv``.
+        
+        Args:
+            ruta: Ruta al archivo del léxico
+            
+        Returns:
+            LexicoFrecuencias: Léxico respaldado por memmap
+            
+        Raises:
+            ValueError: Si el archivo no tiene el formato esperado
+        """
+        with open(ruta, 'rb') as f:
+            encabezado = f.read(_ENCABEZADO.size)
+        
+        if len(encabezado) < _ENCABEZADO.size:
+            raise ValueError(f"Archivo de léxico inválido: {ruta}")
+        firma, version, total = _ENCABEZADO.unpack(encabezado)
+        if firma != FIRMA_LEXICO or version != VERSION_FORMATO:
+            raise ValueError(f"Archivo de léxico inválido: {ruta}")
+        
+        inicio = _ENCABEZADO.size
+        hashes = np.memmap(ruta, dtype='<u8', mode='r',
+                           offset=inicio, shape=(total,))
+        rangos = np.memmap(ruta, dtype='<u4', mode='r',
+                           offset=inicio + 8 * total, shape=(total,))
+        return cls(hashes, rangos)
+    
+    def buscar(self, palabras):
+        """
+        Busca el ranking de muchas palabras en una sola operación.
+        
+        Args:
+            palabras: Lista de palabras en minúsculas
+            
+        Returns:
+            np.ndarray: Ranking de cada palabra, o 0 si no está en el léxico
+        """
+        return self.buscar_hashes(hashes_palabras(palabras))
+    
+    def buscar_hashes(self, consultas):
+        """
+        Busca el ranking de muchas palabras ya convertidas a hash.
+        
+        Args:
+            consultas: Arreglo de hashes (uint64), ver ``hashes_palabras``
+            
+        Returns:
+            np.ndarray: Ranking de cada palabra, o 0 si no está en el léxico
+        """
+        if len(consultas) == 0 or len(self.hashes) == 0:
+            return np.zeros(len(consultas), dtype=np.int64)
+        
+        posiciones = np.searchsorted(self.hashes, consultas)
+        posiciones = np.minimum(posiciones, len(self.hashes) - 1)
+        encontradas = self.hashes[posiciones] == consultas
+        
+        return np.where(encontradas, self.rangos[posiciones], 0).astype(np.int64)
+    
+    def __len__(self):
+        return len(self.hashes)
+    
+    def __contains__(self, palabra):
+        return self.buscar([palabra])[0] > 0
+    
+    def __getitem__(self, palabra):
+        rango = self.buscar([palabra])[0]
+        if rango == 0:
+            raise KeyError(palabra)
+        return int(rango)
+
+
+def convertir_tsv(ruta_tsv, ruta_lexico, columna=0):
+    """
+    Convierte una lista de frecuencias en TSV al formato binario del léxico.
+    
+    Se espera un lema por línea, ordenados de más a menos frecuente; el
+    ranking de cada lema es su posición en el archivo (desde 1). Las
+    líneas vacías y las que comienzan con '#' se ignoran, y si un lema
+    se repite se conserva su primera aparición.
+    
+    Args:
+        ruta_tsv: Ruta al archivo TSV
+        ruta_lexico: Ruta del archivo binario a crear
+        columna: Columna del TSV que contiene el lema
+        
+    Returns:
+        int: Número de lemas guardados
+    """
+    vistos = set()
+    hashes = []
+    
+    with open(ruta_tsv, 'r', encoding='utf-8') as f:
+        for linea in f:
+            linea = linea.rstrip('\n')
+            if not linea.strip() or linea.startswith('#'):
+                continue
+            
+            lema = linea.split('\t')[columna].strip().lower()
+            valor = hash_palabra(lema)
+            if valor in vistos:
+                continue
+            vistos.add(valor)
+            hashes.append(valor)
+    
+    hashes = np.array(hashes, dtype='<u8')
+    rangos = np.arange(1, len(hashes) + 1, dtype='<u4')
+    orden = np.argsort(hashes, kind='stable')
+    
+    with open(ruta_lexico, 'wb') as f:
+        f.write(_ENCABEZADO.pack(FIRMA_LEXICO, VERSION_FORMATO, len(hashes)))
+        f.write(hashes[orden].tobytes())
+        f.write(rangos[orden].tobytes())
+    
+    return len(hashes)
@@ -0,0 +1,152 @@
+"""
+Recorrido de directorios y patrones glob
+Entrega los archivos a medida que los encuentra, sin construir la
+lista completa, para alimentar el análisis de corpus grandes
+"""
+
+import glob
+import os
+import queue
+import threading
+
+
+# Extensiones que cargar_documento sabe leer
+EXTENSIONES_SOPORTADAS = ('.pdf', '.txt', '.md')
+
+# Rutas encoladas por adelantado, como máximo, al recorrer en segundo plano
+TAMANO_COLA_RECORRIDO = 1000
+
+_FIN = object()
+
+
+def _es_patron(origen):
+    """Indica si el origen es un patrón glob y no una ruta literal."""
+    return glob.has_magic(origen)
+
+
+def _recorrer_directorio(directorio):
+    """
+    Recorre un directorio en profundidad, entregando entradas de archivos.
+
+    Los archivos salen en el orden de ``os.scandir`` apenas se leen; solo
+    se guardan (y ordenan, para recorrerlos en orden alfabético) los
+    subdirectorios pendientes.
+    """
+    pendientes = [directorio]
+    while pendientes:
+        actual = pendientes.pop()
+        subdirectorios = []
+        try:
+            with os.scandir(actual) as entradas:
+                for entrada in entradas:
+                    try:
+                        if entrada.is_dir(follow_symlinks=False):
+                            subdirectorios.append(entrada.path)
+                        elif entrada.is_file():
+                            yield entrada
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+        pendientes.extend(sorted(subdirectorios, reverse=True))
+
+
+def recorrer_archivos(origenes, extensiones=EXTENSIONES_SOPORTADAS,
+                      tamano_minimo=0, tamano_maximo=None):
+    """
+    Recorre directorios, patrones glob y archivos sueltos de forma perezosa.
+
+    Cada archivo se entrega apenas se encuentra, en el orden en que el
+    sistema de archivos lo lista. La memoria usada no depende del número
+    de archivos, sino de los subdirectorios pendientes de recorrer (que
+    crecen con la profundidad y con el número de subdirectorios por
+    nivel).
+
+    Args:
+        origenes: Directorios, patrones glob (``corpus/**/*.pdf``) o rutas
+            de archivos; también acepta un solo string
+        extensiones: Extensiones aceptadas (None para aceptar todas)
+        tamano_minimo (int): Tamaño mínimo del archivo en bytes
+        tamano_maximo (int): Tamaño máximo del archivo en bytes (None sin límite)
+
+    Yields:
+        str: Ruta de cada archivo que pasa los filtros
+    """
+    if isinstance(origenes, str):
+        origenes = [origenes]
+    if extensiones is not None:
+        extensiones = tuple(e.lower() if e.startswith('.') else '.' + e.lower()
+                            for e in extensiones)
+
+    for origen in origenes:
+        if _es_patron(origen):
+            candidatos = (ruta for ruta in glob.iglob(origen, recursive=True)
+                          if os.path.isfile(ruta))
+        elif os.path.isdir(origen):
+            candidatos = _recorrer_directorio(origen)
+        else:
+            candidatos = [origen]
+
+        for candidato in candidatos:
+            ruta = os.fspath(candidato)
+            if extensiones is not None and not ruta.lower().endswith(extensiones):
+                continue
+            if tamano_minimo or tamano_maximo is not None:
+                try:
+                    # DirEntry guarda el resultado de stat del recorrido
+                    info = candidato.stat() if isinstance(candidato, os.DirEntry) else os.stat(ruta)
+                except OSError:
+                    continue
+                if info.st_size < tamano_minimo:
+                    continue
+                if tamano_maximo is not None and info.st_size > tamano_maximo:
+                    continue
+            yield ruta
+
+
+def en_segundo_plano(iterable, tamano_cola=TAMANO_COLA_RECORRIDO):
+    """
+    Consume un iterable en un hilo aparte a través de una cola acotada.
+
+    Permite que el recorrido del disco avance mientras se analizan los
+    archivos ya encontrados. Si la cola se llena, el recorrido espera,
+    de modo que nunca hay más de ``tamano_cola`` rutas adelantadas.
+
+    Args:
+        iterable: Iterable a consumir (por ejemplo, ``recorrer_archivos``)
+        tamano_cola (int): Elementos adelantados como máximo
+
+    Yields:
+        Los elementos del iterable, en el mismo orden
+    """
+    cola = queue.Queue(maxsize=tamano_cola)
+    detener = threading.Event()
+
+    def producir():
+        try:
+            for elemento in iterable:
+                while not detener.is_set():
+                    try:
+                        cola.put(elemento, timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+                if detener.is_set():
+                    return
+        except Exception as e:
+            cola.put((_FIN, e))
+            return
+        cola.put((_FIN, None))
+
+    hilo = threading.Thread(target=producir, daemon=True)
+    hilo.start()
+    try:
+        while True:
+            elemento = cola.get()
+            if isinstance(elemento, tuple) and elemento and elemento[0] is _FIN:
+                if elemento[1] is not None:
+                    raise elemento[1]
+                return
+            yield elemento
+    finally:
+        detener.set()
@@ -0,0 +1,361 @@
+"""
+Resúmenes combinables de un corpus
+Acumula conteos, sumas y sumas de cuadrados de las estadísticas, un
+histograma Lexile de intervalos fijos y los documentos por grado, sin
+guardar los resultados individuales
+"""
+
+import json
+import os
+
+import numpy as np
+
+
+# Campos acumulados: el puntaje Lexile y cada campo de 'estadisticas'
+CAMPOS_RESUMEN = (
+    'lexile',
+    'palabras',
+    'oraciones',
+    'palabras_por_oracion',
+    'silabas_por_palabra',
+    'palabras_raras_pct',
+    'palabras_complejas_pct',
+    'diversidad_lexica',
+)
+
+# Intervalos fijos del histograma Lexile. Deben ser los mismos en todos
+# los resúmenes que se combinan; los puntajes fuera del rango se cuentan
+# en el primer o el último intervalo.
+ANCHO_INTERVALO_LEXILE = 50
+BORDES_LEXILE = np.arange(0, 2000 + ANCHO_INTERVALO_LEXILE, ANCHO_INTERVALO_LEXILE)
+
+
+class ResumenCorpus:
+    """
+    Resumen estadístico combinable de un conjunto de documentos.
+    
+    Guarda solo sumas: dos resúmenes se combinan sumando sus campos, de
+    modo que la combinación es asociativa y conmutativa (salvo el redondeo
+    de las sumas en punto flotante), y los resúmenes parciales de
+    distintos procesos (o ejecuciones) se pueden unir en cualquier
+    orden. La media y la desviación de cada campo se obtienen
+    de los conteos, las sumas y las sumas de cuadrados.
+    
+    Attributes:
+        documentos: Documentos con resultado válido
+        errores: Documentos que no se pudieron cargar o analizar
+        conteos: Valores acumulados por campo (int64, orden CAMPOS_RESUMEN)
+        sumas: Suma de los valores por campo (float64)
+        sumas_cuadrados: Suma de los cuadrados por campo (float64)
+        bordes: Bordes de los intervalos del histograma Lexile
+        histograma: Documentos por intervalo Lexile (int64)
+        grados: Documentos por grado ({grado: conteo})
+    """
+    
+    def __init__(self, bordes=BORDES_LEXILE):
+        self.documentos = 0
+        self.errores = 0
+        self.conteos = np.zeros(len(CAMPOS_RESUMEN), dtype=np.int64)
+        self.sumas = np.zeros(len(CAMPOS_RESUMEN), dtype=np.float64)
+        self.sumas_cuadrados = np.zeros(len(CAMPOS_RESUMEN), dtype=np.float64)
+        self.bordes = np.asarray(bordes, dtype=np.float64)
+        self.histograma = np.zeros(len(self.bordes) - 1, dtype=np.int64)
+        self.grados = {}
+    
+    def agregar(self, resultado):
+        """
+        Agrega un documento al resumen.
+        
+        Args:
+            resultado: Resultado de ``analizar`` o item de ``analizar_corpus``
+                (con 'resultado' o 'error')
+        
+        Returns:
+            ResumenCorpus: Esta misma instancia
+        """
+        if 'resultado' in resultado:
+            resultado = resultado['resultado']
+        if 'error' in resultado:
+            self.errores += 1
+            return self
+        
+        self.documentos += 1
+        estadisticas = resultado.get('estadisticas', {})
+        for i, campo in enumerate(CAMPOS_RESUMEN):
+            valor = resultado.get(campo, estadisticas.get(campo))
+            if valor is None:
+                continue
+            self.conteos[i] += 1
+            self.sumas[i] += valor
+            self.sumas_cuadrados[i] += valor * valor
+        
+        if resultado.get('lexile') is not None:
+            intervalo = np.searchsorted(self.bordes, resultado['lexile'], side='right') - 1
+            self.histograma[min(max(intervalo, 0), len(self.histograma) - 1)] += 1
+        
+        grado = resultado.get('grado')
+        if grado is not None:
+            self.grados[grado] = self.grados.get(grado, 0) + 1
+        return self
+    
+    def combinar(self, otro):
+        """
+        Suma otro resumen a este.
+        
+        Args:
+            otro: Instancia de ResumenCorpus con los mismos intervalos
+        
+        Returns:
+            ResumenCorpus: Esta misma instancia, ya combinada
+        """
+        if not isinstance(otro, ResumenCorpus):
+            raise TypeError("Solo se puede combinar con otro ResumenCorpus")
+        if not np.array_equal(self.bordes, otro.bordes):
+            raise ValueError("Los histogramas Lexile usan intervalos distintos")
+        
+        self.documentos += otro.documentos
+        self.errores += otro.errores
+        self.conteos += otro.conteos
+        self.sumas += otro.sumas
+        self.sumas_cuadrados += otro.sumas_cuadrados
+        self.histograma += otro.histograma
+        for grado, conteo in otro.grados.items():
+            self.grados[grado] = self.grados.get(grado, 0) + conteo
+        return self
+    
+    def media(self, campo):
+        """Media de un campo (None si no hay valores)."""
+        i = CAMPOS_RESUMEN.index(campo)
+        if self.conteos[i] == 0:
+            return None
+        return float(self.sumas[i] / self.conteos[i])
+    
+    def desviacion(self, campo):
+        """Desviación estándar poblacional de un campo (None si no hay valores)."""
+        i = CAMPOS_RESUMEN.index(campo)
+        if self.conteos[i] == 0:
+            return None
+        media = self.sumas[i] / self.conteos[i]
+        varianza = self.sumas_cuadrados[i] / self.conteos[i] - media ** 2
+        return float(np.sqrt(max(0.0, varianza)))
+    
+    def estadisticas(self):
+        """
+        Calcula la media y la desviación de cada campo.
+        
+        Returns:
+            dict: {campo: {'n': conteo, 'media': ..., 'desviacion': ...}}
+        """
+        return {
+            campo: {
+                'n': int(self.conteos[i]),
+                'media': self.media(campo),
+                'desviacion': self.desviacion(campo)
+            }
+            for i, campo in enumerate(CAMPOS_RESUMEN)
+        }
+    
+    def a_dict(self):
+        """
+        Convierte el resumen en un diccionario serializable a JSON.
+        
+        Contiene las sumas (para combinarlo después con ``desde_dict``)
+        y las medias y desviaciones ya calculadas.
+        
+        Returns:
+            dict: Resumen serializable
+        """
+        return {
+            'documentos': self.documentos,
+            'errores': self.errores,
+            'conteos': dict(zip(CAMPOS_RESUMEN, self.conteos.tolist())),
+            'sumas': dict(zip(CAMPOS_RESUMEN, self.sumas.tolist())),
+            'sumas_cuadrados': dict(zip(CAMPOS_RESUMEN, self.sumas_cuadrados.tolist())),
+            'bordes_lexile': self.bordes.tolist(),
+            'histograma_lexile': self.histograma.tolist(),
+            'grados': dict(self.grados),
+            'estadisticas': self.estadisticas()
+        }
+    
+    @classmethod
+    def desde_dict(cls, datos):
+        """
+        Reconstruye un resumen guardado con ``a_dict``.
+        
+        Args:
+            datos: Diccionario de ``a_dict``
+        
+        Returns:
+            ResumenCorpus: Resumen reconstruido
+        """
+        resumen = cls(bordes=datos['bordes_lexile'])
+        resumen.documentos = datos['documentos']
+        resumen.errores = datos['errores']
+        for i, campo in enumerate(CAMPOS_RESUMEN):
+            resumen.conteos[i] = datos['conteos'].get(campo, 0)
+            resumen.sumas[i] = datos['sumas'].get(campo, 0.0)
+            resumen.sumas_cuadrados[i] = datos['sumas_cuadrados'].get(campo, 0.0)
+        resumen.histograma[:] = datos['histograma_lexile']
+        resumen.grados = dict(datos['grados'])
+        return resumen
+
+
+class ResumenAgrupado:
+    """
+    Resumen total de un corpus más un ResumenCorpus por grupo.
+    
+    Los grupos son etiquetas libres (curso, asignatura, editorial...);
+    el grupo de cada documento lo decide quien lo agrega, por ejemplo
+    con ``grupo_por_directorio``. La combinación es asociativa y
+    conmutativa, como la de ResumenCorpus.
+    
+    Attributes:
+        total: ResumenCorpus de todos los documentos
+        grupos: Resumen de cada grupo ({grupo: ResumenCorpus})
+    """
+    
+    def __init__(self, bordes=BORDES_LEXILE):
+        self.bordes = bordes
+        self.total = ResumenCorpus(bordes)
+        self.grupos = {}
+    
+    def agregar(self, resultado, grupo=None):
+        """
+        Agrega un documento al total y, si tiene, a su grupo.
+        
+        Args:
+            resultado: Resultado de ``analizar`` o item de ``analizar_corpus``
+            grupo: Etiqueta del grupo del documento (None sin grupo)
+        
+        Returns:
+            ResumenAgrupado: Esta misma instancia
+        """
+        self.total.agregar(resultado)
+        if grupo is not None:
+            if grupo not in self.grupos:
+                self.grupos[grupo] = ResumenCorpus(self.bordes)
+            self.grupos[grupo].agregar(resultado)
+        return self
+    
+    def combinar(self, otro):
+        """
+        Suma otro resumen agrupado a este, grupo a grupo.
+        
+        Args:
+            otro: Instancia de ResumenAgrupado
+        
+        Returns:
+            ResumenAgrupado: Esta misma instancia, ya combinada
+        """
+        if not isinstance(otro, ResumenAgrupado):
+            raise TypeError("Solo se puede combinar con otro ResumenAgrupado")
+        self.total.combinar(otro.total)
+        for grupo, resumen in otro.grupos.items():
+            if grupo not in self.grupos:
+                self.grupos[grupo] = ResumenCorpus(self.bordes)
+            self.grupos[grupo].combinar(resumen)
+        return self
+    
+    def a_dict(self):
+        """Convierte el resumen en un diccionario serializable a JSON."""
+        return {
+            'total': self.total.a_dict(),
+            'grupos': {grupo: resumen.a_dict()
+                       for grupo, resumen in sorted(self.grupos.items())}
+        }
+    
+    @classmethod
+    def desde_dict(cls, datos):
+        """Reconstruye un resumen agrupado guardado con ``a_dict``."""
+        total = ResumenCorpus.desde_dict(datos['total'])
+        agrupado = cls(bordes=total.bordes)
+        agrupado.total = total
+        agrupado.grupos = {grupo: ResumenCorpus.desde_dict(resumen)
+                           for grupo, resumen in datos['grupos'].items()}
+        return agrupado
+
+
+def grupo_por_directorio(ruta, nivel=1):
+    """
+    Etiqueta de grupo a partir de un directorio de la ruta.
+    
+    Con un archivo organizado como ``editorial/asignatura/curso/texto.pdf``,
+    el nivel 1 agrupa por curso, el 2 por asignatura y el 3 por editorial.
+    
+    Args:
+        ruta: Ruta del archivo
+        nivel (int): Directorios a subir desde el archivo
+    
+    Returns:
+        str: Nombre del directorio, o None si la ruta no tiene ese nivel
+    """
+    if not ruta:
+        return None
+    partes = os.path.normpath(ruta).split(os.sep)[:-1]
+    if len(partes) < nivel or not partes[-nivel]:
+        return None
+    return partes[-nivel]
+
+
+def acumular(items, resumen, agrupar=None):
+    """
+    Agrega cada item a un resumen mientras lo deja pasar.
+    
+    Permite resumir un corpus a la vez que se exportan sus resultados.
+    
+    Args:
+        items: Items de ``analizar_corpus`` (o similar)
+        resumen: Instancia de ResumenAgrupado
+        agrupar: Función ruta → grupo (None para no agrupar)
+    
+    Yields:
+        dict: Los mismos items, sin cambios
+    """
+    for item in items:
+        grupo = agrupar(item.get('ruta')) if agrupar else None
+        resumen.agregar(item, grupo)
+        yield item
+
+
+def guardar_resumen(resumen, ruta):
+    """
+    Guarda un resumen (ResumenCorpus o ResumenAgrupado) en JSON.
+    
+    Args:
+        resumen: Resumen a guardar
+        ruta: Archivo de salida
+    """
+    with open(ruta, 'w', encoding='utf-8') as f:
+        json.dump(resumen.a_dict(), f, ensure_ascii=False, indent=2)
+    print(f"✓ Resumen guardado en: {ruta}")
+
+
+def imprimir_resumen(resumen):
+    """
+    Imprime el resumen de un corpus y, si tiene, el de cada grupo.
+    
+    Args:
+        resumen: Instancia de ResumenAgrupado
+    """
+    print(f"{'Grupo':<30} {'Docs':>6} {'Lexile':>8} {'Desv.':>7} {'Palabras':>10}")
+    print("-" * 70)
+    
+    filas = sorted(resumen.grupos.items()) + [('TOTAL', resumen.total)]
+    for nombre, grupo in filas:
+        media = grupo.media('lexile')
+        desviacion = grupo.desviacion('lexile')
+        palabras = int(grupo.sumas[CAMPOS_RESUMEN.index('palabras')])
+        if media is None:
+            print(f"{nombre:<30} {grupo.documentos:>6} {'-':>8} {'-':>7} {palabras:>10}")
+        else:
+            print(f"{nombre:<30} {grupo.documentos:>6} {media:>7.0f}L "
+                  f"{desviacion:>7.1f} {palabras:>10}")
+    
+    total = resumen.total
+    if total.grados:
+        print(f"\n🎓 Documentos por grado:")
+        for grado, conteo in sorted(total.grados.items(), key=lambda g: -g[1]):
+            print(f"   • {grado}: {conteo}")
+    if total.errores:
+        print(f"\n⚠️  Documentos con error: {total.errores}")
+    print()
@@ -0,0 +1,377 @@
+"""
+Servicio HTTP/JSON del Analizador Lexile
+Mantiene analizadores con el modelo ya cargado y agrupa las solicitudes
+concurrentes en lotes para ``nlp.pipe``
+"""
+
+import json
+import queue
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+try:
+    from .analizador_lexile import AnalizadorLexileChile
+except ImportError:
+    from analizador_lexile import AnalizadorLexileChile
+
+
+# Tamaño máximo del cuerpo de una solicitud (bytes); uno mayor recibe 413
+MAX_CUERPO = 10 * 1024 * 1024
+
+# Máximo de textos en una solicitud a /lote; más textos reciben 413
+MAX_TEXTOS_LOTE = 1000
+
+
+class ServicioAnalisis:
+    """
+    Cola de análisis atendida por uno o más analizadores precargados.
+    
+    Cada analizador es atendido por su propio hilo. Un hilo toma la
+    primera solicitud de la cola y espera hasta ``espera_lote`` segundos
+    por más solicitudes (hasta ``max_lote`` textos) para analizarlas
+    juntas con ``analizar_lote``.
+    
+    Los textos se analizan en sublotes de hasta ``max_lote``. Antes de
+    cada sublote se descartan los textos de las solicitudes cuyo plazo
+    (``timeout``) ya venció, de modo que una solicitud que recibió un
+    504 deja de ocupar al analizador en el siguiente sublote; el
+    sublote en curso no se interrumpe.
+    
+    Los hilos comparten el GIL, así que varios analizadores en el mismo
+    proceso no analizan en paralelo; para aprovechar varios núcleos se
+    usan instancias de AnalizadorEnProceso, como hace ``servir``.
+    
+    Attributes:
+        analizadores: Instancias de AnalizadorLexileChile en uso
+        max_lote: Máximo de textos por lote
+        espera_lote: Tiempo máximo de espera para completar un lote (segundos)
+        timeout: Tiempo máximo de espera de una solicitud (segundos)
+    """
+    
+    def __init__(self, analizadores, max_lote=32, espera_lote=0.005, timeout=10.0):
+        """
+        Inicializa el servicio e inicia los hilos de análisis.
+        
+        Args:
+            analizadores: Lista de instancias de AnalizadorLexileChile
+            max_lote: Máximo de textos por lote
+            espera_lote: Tiempo máximo de espera para completar un lote
+            timeout: Tiempo máximo de espera de una solicitud
+        """
+        self.analizadores = analizadores
+        self.max_lote = max_lote
+        self.espera_lote = espera_lote
+        self.timeout = timeout
+        self._cola = queue.Queue()
+        self._hilos = [
+            threading.Thread(target=self._atender, args=(analizador,), daemon=True)
+            for analizador in analizadores
+        ]
+        for hilo in self._hilos:
+            hilo.start()
+    
+    def enviar(self, textos, plazo=None):
+        """
+        Encola textos para analizar.
+        
+        Args:
+            textos: Lista de textos
+            plazo: Instante (``time.monotonic``) después del cual ya no
+                vale la pena analizarlos; por defecto, sin plazo
+            
+        Returns:
+            Future: Entrega la lista de resultados, en el mismo orden,
+                o TimeoutError si el plazo venció antes de terminar
+        """
+        futuro = Future()
+        self._cola.put((list(textos), futuro, plazo or float('inf')))
+        return futuro
+    
+    def analizar(self, textos):
+        """
+        Analiza textos esperando como máximo ``timeout`` segundos.
+        
+        Args:
+            textos: Lista de textos
+            
+        Returns:
+            list: Resultados de cada texto
+            
+        Raises:
+            TimeoutError: Si el análisis no termina a tiempo
+        """
+        futuro = self.enviar(textos, time.monotonic() + self.timeout)
+        try:
+            return futuro.result(timeout=self.timeout)
+        except TimeoutError:
+            futuro.cancel()
+            raise
+    
+    def _atender(self, analizador):
+        """Toma solicitudes de la cola y las analiza en lotes."""
+        while True:
+            solicitudes = [self._cola.get()]
+            total = len(solicitudes[0][0])
+            limite = time.monotonic() + self.espera_lote
+            
+            while total < self.max_lote:
+                restante = limite - time.monotonic()
+                if restante <= 0:
+                    break
+                try:
+                    solicitud = self._cola.get(timeout=restante)
+                except queue.Empty:
+                    break
+                solicitudes.append(solicitud)
+                total += len(solicitud[0])
+            
+            # Descartar las solicitudes cuyo plazo ya venció
+            solicitudes = [
+                solicitud for solicitud in solicitudes
+                if solicitud[1].set_running_or_notify_cancel()
+            ]
+            if solicitudes:
+                self._analizar_solicitudes(analizador, solicitudes)
+    
+    def _analizar_solicitudes(self, analizador, solicitudes):
+        """Analiza solicitudes en sublotes y entrega sus resultados."""
+        resultados = [[] for _ in solicitudes]
+        textos = [(i, texto) for i, (textos_sol, _, _) in enumerate(solicitudes)
+                  for texto in textos_sol]
+        
+        for inicio in range(0, len(textos), self.max_lote):
+            ahora = time.monotonic()
+            sublote = [(i, texto) for i, texto in textos[inicio:inicio + self.max_lote]
+                       if solicitudes[i][2] > ahora]
+            if not sublote:
+                continue
+            try:
+                analizados = analizador.analizar_lote(
+                    [texto for _, texto in sublote], batch_size=self.max_lote
+                )
+                for (i, _), resultado in zip(sublote, analizados):
+                    resultados[i].append(resultado)
+            except Exception as e:
+                for _, futuro, _ in solicitudes:
+                    futuro.set_exception(e)
+                return
+        
+        for (textos_sol, futuro, _), resultados_sol in zip(solicitudes, resultados):
+            if len(resultados_sol) == len(textos_sol):
+                futuro.set_result(resultados_sol)
+            else:
+                futuro.set_exception(TimeoutError("Plazo vencido durante el análisis"))
+
+
+class AnalizadorEnProceso:
+    """
+    Analizador que corre en un proceso propio, con el modelo ya cargado.
+    
+    Ofrece el mismo ``analizar_lote`` que AnalizadorLexileChile, de modo
+    que ServicioAnalisis puede usarlo en lugar de un analizador local y
+    cada lote se analiza fuera del GIL del proceso del servidor.
+    """
+    
+    def __init__(self, **opciones_analizador):
+        """
+        Inicia el proceso y carga en él el modelo de spaCy.
+        
+        Args:
+            **opciones_analizador: Argumentos para AnalizadorLexileChile
+        """
+        self._executor = ProcessPoolExecutor(
+            max_workers=1,
+            initializer=_iniciar_proceso,
+            initargs=(opciones_analizador,)
+        )
+        # Esperar a que el modelo esté cargado antes de aceptar solicitudes
+        self._executor.submit(_cargar_modelo_proceso).result()
+    
+    def analizar_lote(self, textos, batch_size=32):
+        """Analiza una lista de textos en el proceso del analizador."""
+        return self._executor.submit(_analizar_lote_proceso, list(textos),
+                                     batch_size).result()
+    
+    def cerrar(self):
+        """Detiene el proceso del analizador."""
+        self._executor.shutdown()
+
+
+# Analizador del proceso de AnalizadorEnProceso
+_analizador_proceso = None
+
+
+def _iniciar_proceso(opciones_analizador):
+    """Crea el analizador del proceso, sin mensajes."""
+    global _analizador_proceso
+    _analizador_proceso = AnalizadorLexileChile(**opciones_analizador, verbose=False)
+
+
+def _cargar_modelo_proceso():
+    """Carga el modelo de spaCy del proceso."""
+    _analizador_proceso.nlp
+
+
+def _analizar_lote_proceso(textos, batch_size):
+    """Analiza un lote de textos con el analizador del proceso."""
+    return list(_analizador_proceso.analizar_lote(textos, batch_size=batch_size))
+
+
+class _ServidorHTTP(ThreadingHTTPServer):
+    """Servidor HTTP con una cola de conexiones amplia para ráfagas."""
+    
+    daemon_threads = True
+    request_queue_size = 256
+
+
+class _ManejadorAnalisis(BaseHTTPRequestHandler):
+    """Atiende las solicitudes HTTP del servicio."""
+    
+    servicio = None
+    max_cuerpo = MAX_CUERPO
+    max_textos = MAX_TEXTOS_LOTE
+    
+    def do_GET(self):
+        if self.path == '/salud':
+            self._responder(200, {'estado': 'ok'})
+        else:
+            self._responder(404, {'error': 'Ruta no encontrada'})
+    
+    def do_POST(self):
+        try:
+            largo = int(self.headers.get('Content-Length', 0))
+        except ValueError:
+            largo = -1
+        if largo < 0:
+            self._responder(400, {'error': 'Content-Length inválido'})
+            return
+        if largo > self.max_cuerpo:
+            self._responder(413, {'error': f'El cuerpo supera {self.max_cuerpo} bytes'})
+            return
+        try:
+            datos = json.loads(self.rfile.read(largo) or b'{}')
+        except (ValueError, UnicodeDecodeError):
+            self._responder(400, {'error': 'JSON inválido'})
+            return
+        
+        if self.path not in ('/analizar', '/lote'):
+            self._responder(404, {'error': 'Ruta no encontrada'})
+            return
+        if not isinstance(datos, dict):
+            self._responder(400, {'error': 'El cuerpo debe ser un objeto JSON'})
+            return
+        
+        if self.path == '/analizar' and isinstance(datos.get('texto'), str):
+            textos = [datos['texto']]
+        elif self.path == '/lote' and isinstance(datos.get('textos'), list):
+            textos = datos['textos']
+            if len(textos) > self.max_textos:
+                self._responder(413, {'error': f'El lote supera {self.max_textos} textos'})
+                return
+            if not all(isinstance(texto, str) for texto in textos):
+                self._responder(400, {'error': 'Todos los textos deben ser strings'})
+                return
+        else:
+            self._responder(400, {'error': 'Faltan los textos a analizar'})
+            return
+        
+        try:
+            resultados = self.servicio.analizar(textos)
+        except TimeoutError:
+            self._responder(504, {'error': 'Tiempo de espera agotado'})
+            return
+        except Exception as e:
+            self._responder(500, {'error': str(e)})
+            return
+        
+        if self.path == '/analizar':
+            self._responder(200, resultados[0])
+        else:
+            self._responder(200, {'resultados': resultados})
+    
+    def _responder(self, codigo, datos):
+        cuerpo = json.dumps(datos, ensure_ascii=False).encode('utf-8')
+        self.send_response(codigo)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(cuerpo)))
+        self.end_headers()
+        self.wfile.write(cuerpo)
+    
+    def log_message(self, formato, *args):
+        # Sin registro por solicitud, para no afectar la latencia
+        pass
+
+
+def crear_servidor(servicio, host='127.0.0.1', puerto=8000,
+                   max_cuerpo=MAX_CUERPO, max_textos=MAX_TEXTOS_LOTE):
+    """
+    Crea el servidor HTTP del servicio de análisis.
+    
+    Rutas disponibles:
+        - GET /salud: Estado del servicio
+        - POST /analizar: {"texto": "..."} → resultado de ``analizar``
+        - POST /lote: {"textos": [...]} → {"resultados": [...]}
+    
+    Una solicitud con un cuerpo de más de ``max_cuerpo`` bytes, o un
+    lote de más de ``max_textos`` textos, recibe 413 sin analizarse.
+    
+    Args:
+        servicio: Instancia de ServicioAnalisis
+        host: Dirección en la que escuchar
+        puerto: Puerto en el que escuchar
+        max_cuerpo: Tamaño máximo del cuerpo de una solicitud (bytes)
+        max_textos: Máximo de textos en una solicitud a /lote
+        
+    Returns:
+        ThreadingHTTPServer: Servidor listo para ``serve_forever``
+    """
+    manejador = type('ManejadorAnalisis', (_ManejadorAnalisis,), {
+        'servicio': servicio, 'max_cuerpo': max_cuerpo, 'max_textos': max_textos
+    })
+    return _ServidorHTTP((host, puerto), manejador)
+
+
+def servir(host='127.0.0.1', puerto=8000, trabajadores=1, timeout=10.0,
+           max_lote=32, max_cuerpo=MAX_CUERPO, max_textos=MAX_TEXTOS_LOTE,
+           **opciones_analizador):
+    """
+    Inicia el servicio de análisis y atiende solicitudes hasta Ctrl+C.
+    
+    Args:
+        host: Dirección en la que escuchar
+        puerto: Puerto en el que escuchar
+        trabajadores: Número de analizadores precargados. Con más de uno,
+            cada analizador corre en su propio proceso (AnalizadorEnProceso)
+            para analizar en paralelo; con uno, en el proceso del servidor.
+        timeout: Tiempo máximo de espera de una solicitud (segundos)
+        max_lote: Máximo de textos por lote
+        max_cuerpo: Tamaño máximo del cuerpo de una solicitud (bytes)
+        max_textos: Máximo de textos en una solicitud a /lote
+        **opciones_analizador: Argumentos para AnalizadorLexileChile
+    """
+    # Los modelos se cargan antes de aceptar solicitudes
+    if trabajadores > 1:
+        analizadores = [AnalizadorEnProceso(**opciones_analizador)
+                        for _ in range(trabajadores)]
+    else:
+        analizadores = [AnalizadorLexileChile(**opciones_analizador)]
+        analizadores[0].nlp
+    
+    servicio = ServicioAnalisis(analizadores, max_lote=max_lote, timeout=timeout)
+    servidor = crear_servidor(servicio, host, puerto, max_cuerpo, max_textos)
+    
+    print(f"🌐 Servicio escuchando en http://{host}:{puerto}")
+    print("   Rutas: GET /salud, POST /analizar, POST /lote")
+    print("   Presiona Ctrl+C para detener\n")
+    
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        print("\n✓ Servicio detenido")
+    finally:
+        servidor.server_close()
+        for analizador in analizadores:
+            if isinstance(analizador, AnalizadorEnProceso):
+                analizador.cerrar()
@@ -0,0 +1,295 @@
+"""
+Trabajos de corpus reanudables
+Registra en un diario SQLite los documentos ya analizados, para que
+una ejecución interrumpida continúe donde quedó
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from collections import deque
+
+try:
+    from .analizador_lexile import AnalizadorLexileChile
+    from .corpus import analizar_corpus
+except ImportError:
+    from analizador_lexile import AnalizadorLexileChile
+    from corpus import analizar_corpus
+
+
+# Bytes leídos por vez al calcular el hash de un archivo
+TAMANO_LECTURA_HASH = 1024 * 1024
+
+
+def hash_archivo(ruta):
+    """
+    Calcula el hash SHA-256 del contenido de un archivo.
+    
+    Args:
+        ruta: Ruta al archivo
+    
+    Returns:
+        str: Hash en hexadecimal
+    """
+    resumen = hashlib.sha256()
+    with open(ruta, 'rb') as f:
+        for bloque in iter(lambda: f.read(TAMANO_LECTURA_HASH), b''):
+            resumen.update(bloque)
+    return resumen.hexdigest()
+
+
+class DiarioTrabajo:
+    """
+    Diario de avance de un trabajo de corpus respaldado por SQLite.
+    
+    Cada documento se registra con su ruta, el hash de su contenido y
+    la configuración del analizador que lo procesó. Un documento
+    terminado sin error no se vuelve a analizar mientras no cambien su
+    contenido ni la configuración; los que fallaron se reintentan.
+    
+    Attributes:
+        ruta: Archivo de la base de datos del diario
+        configuracion: Firma de la configuración del analizador
+            (ver ``AnalizadorLexileChile._firma_configuracion``)
+    """
+    
+    def __init__(self, ruta, configuracion=''):
+        """
+        Abre (o crea) el diario.
+        
+        Args:
+            ruta: Archivo de la base de datos del diario
+            configuracion: Firma de la configuración del analizador de
+                esta ejecución; los resultados de otra configuración no
+                se reutilizan
+        """
+        self.ruta = ruta
+        self.configuracion = configuracion
+        directorio = os.path.dirname(os.path.abspath(ruta))
+        os.makedirs(directorio, exist_ok=True)
+        self.conexion = sqlite3.connect(ruta, timeout=30)
+        self.conexion.execute(
+            "CREATE TABLE IF NOT EXISTS documentos ("
+            " ruta TEXT PRIMARY KEY,"
+            " hash TEXT NOT NULL,"
+            " estado TEXT NOT NULL,"
+            " resultado TEXT,"
+            " error TEXT,"
+            " intentos INTEGER NOT NULL DEFAULT 0,"
+            " actualizado REAL NOT NULL,"
+            " configuracion TEXT)"
+        )
+        # Diarios creados antes de registrar la configuración
+        columnas = {fila[1] for fila in self.conexion.execute("PRAGMA table_info(documentos)")}
+        if 'configuracion' not in columnas:
+            self.conexion.execute("ALTER TABLE documentos ADD COLUMN configuracion TEXT")
+        self.conexion.commit()
+    
+    def completado(self, ruta, hash_contenido):
+        """
+        Busca el resultado de un documento ya terminado.
+        
+        Args:
+            ruta: Ruta del documento
+            hash_contenido: Hash actual del contenido
+        
+        Returns:
+            dict: Resultado guardado, o None si el documento no está
+                terminado, falló, cambió desde entonces o se analizó con
+                otra configuración
+        """
+        fila = self.conexion.execute(
+            "SELECT resultado FROM documentos"
+            " WHERE ruta = ? AND hash = ? AND estado = 'ok' AND configuracion = ?",
+            (os.path.abspath(ruta), hash_contenido, self.configuracion)
+        ).fetchone()
+        return json.loads(fila[0]) if fila else None
+    
+    def registrar(self, ruta, hash_contenido, resultado=None, error=None):
+        """
+        Registra el resultado (o el error) de un documento.
+        
+        Args:
+            ruta: Ruta del documento
+            hash_contenido: Hash del contenido analizado
+            resultado: Resultado de ``analizar``
+            error: Mensaje de error si el análisis falló
+        """
+        estado = 'error' if error else 'ok'
+        valor = None if error else json.dumps(resultado, ensure_ascii=False)
+        self.conexion.execute(
+            "INSERT INTO documentos"
+            " (ruta, hash, estado, resultado, error, intentos, actualizado,"
+            " configuracion)"
+            " VALUES (?, ?, ?, ?, ?, 1, ?, ?)"
+            " ON CONFLICT(ruta) DO UPDATE SET"
+            " hash = excluded.hash, estado = excluded.estado,"
+            " resultado = excluded.resultado, error = excluded.error,"
+            " intentos = documentos.intentos + 1,"
+            " actualizado = excluded.actualizado,"
+            " configuracion = excluded.configuracion",
+            (os.path.abspath(ruta), hash_contenido, estado, valor, error,
+             time.time(), self.configuracion)
+        )
+        self.conexion.commit()
+    
+    def resumen(self):
+        """
+        Cuenta los documentos del diario por estado.
+        
+        Returns:
+            dict: Número de documentos por estado ('ok', 'error')
+        """
+        return dict(self.conexion.execute(
+            "SELECT estado, COUNT(*) FROM documentos GROUP BY estado"
+        ).fetchall())
+    
+    def cerrar(self):
+        """Cierra la conexión a la base de datos."""
+        self.conexion.close()
+
+
+class Progreso:
+    """
+    Indicador de avance con tasa y tiempo restante estimado.
+    
+    La tasa se calcula con los documentos analizados en esta ejecución,
+    sin contar los que se saltaron por estar terminados.
+    """
+    
+    def __init__(self, total, intervalo=2.0):
+        """
+        Args:
+            total: Número total de documentos (None si no se conoce)
+            intervalo: Segundos mínimos entre dos líneas de avance
+        """
+        self.total = total
+        self.intervalo = intervalo
+        self.hechos = 0
+        self.saltados = 0
+        self.errores = 0
+        self._inicio = time.monotonic()
+        self._ultimo = 0.0
+    
+    def avanzar(self, saltado=False, error=False):
+        """Cuenta un documento y muestra el avance si pasó el intervalo."""
+        self.hechos += 1
+        self.saltados += saltado
+        self.errores += error
+        ahora = time.monotonic()
+        if ahora - self._ultimo >= self.intervalo or self.hechos == self.total:
+            self._ultimo = ahora
+            self.mostrar()
+    
+    def mostrar(self):
+        """Imprime una línea con el avance, la tasa y el tiempo restante."""
+        transcurrido = time.monotonic() - self._inicio
+        analizados = self.hechos - self.saltados
+        tasa = analizados / transcurrido if transcurrido > 0 else 0.0
+        
+        if self.total is None:
+            print(f"⏳ {self.hechos} documentos | {tasa:.2f} docs/s | "
+                  f"saltados {self.saltados} | errores {self.errores}")
+            return
+        
+        restantes = self.total - self.hechos
+        if tasa > 0:
+            eta = time.strftime('%H:%M:%S', time.gmtime(restantes / tasa))
+        else:
+            eta = '--:--:--'
+        
+        porcentaje = self.hechos / self.total * 100 if self.total else 100.0
+        print(f"⏳ {self.hechos}/{self.total} ({porcentaje:.1f}%) | "
+              f"{tasa:.2f} docs/s | ETA {eta} | "
+              f"saltados {self.saltados} | errores {self.errores}")
+
+
+def ejecutar_trabajo(rutas, diario, progreso=True, **opciones_corpus):
+    """
+    Analiza un corpus registrando el avance en un diario reanudable.
+    
+    Los documentos terminados en una ejecución anterior (misma ruta,
+    mismo contenido y misma configuración del analizador: perfil,
+    modelo, léxico y parámetros) se entregan desde el diario sin
+    analizarlos; los demás se analizan de nuevo. Cada resultado se
+    registra apenas llega, de modo que una interrupción pierde a lo
+    sumo los documentos en curso.
+    
+    Args:
+        rutas: Rutas a los archivos; lista o iterable (con un iterable
+            el avance no muestra porcentaje ni tiempo restante)
+        diario: Instancia de DiarioTrabajo o ruta a su archivo; su
+            configuración se reemplaza por la de esta ejecución
+        progreso (bool): Mostrar avance, tasa y tiempo restante
+        **opciones_corpus: Opciones de ``analizar_corpus`` (procesos,
+            perfil, cache, lexico, ...)
+    
+    Yields:
+        dict: Un item por archivo, como ``analizar_corpus``; los
+            recuperados del diario llevan además 'reanudado': True y
+            pueden adelantarse a los documentos en análisis
+    """
+    analizador = opciones_corpus.get('analizador') or AnalizadorLexileChile(
+        perfil=opciones_corpus.get('perfil', 'completo'),
+        lexico=opciones_corpus.get('lexico'),
+        parametros=opciones_corpus.get('parametros'), verbose=False
+    )
+    if not isinstance(diario, DiarioTrabajo):
+        diario = DiarioTrabajo(diario)
+    diario.configuracion = analizador._firma_configuracion()
+    
+    total = len(rutas) if isinstance(rutas, (list, tuple)) else None
+    indicador = Progreso(total) if progreso else None
+    
+    # Los documentos terminados o ilegibles se apartan al filtrar las
+    # rutas y se entregan entre los resultados del análisis, de modo
+    # que las rutas se consumen de forma perezosa. Una misma ruta puede
+    # repetirse: sus hashes se guardan en orden y los resultados llegan
+    # en el mismo orden de entrada.
+    pendientes = {}
+    listos = deque()
+    
+    def filtrar():
+        for ruta in rutas:
+            try:
+                hash_contenido = hash_archivo(ruta)
+            except OSError as e:
+                listos.append(({'nombre': os.path.basename(ruta), 'ruta': ruta,
+                                'error': str(e)}, False))
+                continue
+            
+            resultado = diario.completado(ruta, hash_contenido)
+            if resultado is None:
+                pendientes.setdefault(ruta, deque()).append(hash_contenido)
+                yield ruta
+            else:
+                listos.append(({'nombre': os.path.basename(ruta), 'ruta': ruta,
+                                'resultado': resultado, 'reanudado': True}, True))
+    
+    def entregar_listos():
+        while listos:
+            item, saltado = listos.popleft()
+            if indicador:
+                indicador.avanzar(saltado=saltado, error=not saltado)
+            yield item
+    
+    for item in analizar_corpus(filtrar(), **opciones_corpus):
+        yield from entregar_listos()
+        ruta = item['ruta']
+        error = item.get('error')
+        hashes = pendientes[ruta]
+        hash_contenido = hashes.popleft()
+        if not hashes:
+            del pendientes[ruta]
+        diario.registrar(ruta, hash_contenido,
+                         resultado=item.get('resultado'), error=error)
+        if indicador:
+            indicador.avanzar(error=bool(error))
+        yield item
+    
+    yield from entregar_listos()
+    
+    if indicador and indicador.total is None:
+        indicador.mostrar()
@@ -3,12 +3,49 @@ Utilidades para el Analizador Lexile
 Funciones auxiliares para cargar y procesar documentos
 """
 
-import PyPDF2
-import pdfplumber
+import contextlib
+import functools
+import importlib.metadata
+import math
 import os
+from concurrent.futures import ProcessPoolExecutor
 
+try:
+    from . import instrumentacion
+except ImportError:
+    import instrumentacion
 
-def cargar_documento(ruta):
+
+# Versión del código de extracción de texto de los PDF. Debe incrementarse
+# al cambiar cómo se extrae el texto, para invalidar los textos en caché.
+VERSION_EXTRACCION = '1'
+
+# Paquetes de los que depende el texto extraído de un PDF
+PAQUETES_EXTRACCION = ('pdfplumber', 'pdfminer.six', 'PyPDF2')
+
+
+@functools.lru_cache(maxsize=None)
+def version_extractor():
+    """
+    Versión de la extracción de texto de los PDF.
+    
+    Combina VERSION_EXTRACCION con las versiones instaladas de
+    PAQUETES_EXTRACCION, de modo que actualizar cualquiera de ellos
+    invalida los textos guardados en caché.
+    
+    Returns:
+        str: Versión, por ejemplo '1/pdfplumber-0.11.0/pdfminer.six-.../PyPDF2-3.0.1'
+    """
+    versiones = [VERSION_EXTRACCION]
+    for paquete in PAQUETES_EXTRACCION:
+        try:
+            versiones.append(f"{paquete}-{importlib.metadata.version(paquete)}")
+        except importlib.metadata.PackageNotFoundError:
+            versiones.append(f"{paquete}-")
+    return '/'.join(versiones)
+
+
+def cargar_documento(ruta, cache=None, procesos_pdf=1):
     """
     Carga cualquier documento automáticamente (PDF o TXT).
     
@@ -17,6 +54,10 @@ def cargar_documento(ruta):
     
     Args:
         ruta (str): Ruta al archivo (PDF, TXT, MD, etc.)
+        cache: Instancia opcional de CacheResultados; el texto de los
+            PDF se reutiliza si el archivo no ha cambiado
+        procesos_pdf (int): Procesos usados para extraer las páginas
+            de un PDF en paralelo
         
     Returns:
         str: Texto extraído del documento
@@ -28,54 +69,229 @@ def cargar_documento(ruta):
     if not os.path.exists(ruta):
         raise FileNotFoundError(f"El archivo no existe: {ruta}")
     
+    instrumentacion.contar('documentos_cargados')
+    
     # Detectar extensión
-    if ruta.lower().endswith('.pdf'):
-        return _extraer_texto_pdf(ruta)
-    else:
-        return _leer_texto(ruta)
+    with instrumentacion.medir('cargar_documento'):
+        if ruta.lower().endswith('.pdf'):
+            return _extraer_texto_pdf_con_cache(ruta, cache, procesos_pdf)
+        else:
+            return _leer_texto(ruta)
 
 
-def _extraer_texto_pdf(ruta):
+def _extraer_texto_pdf_con_cache(ruta, cache, procesos=1):
+    """
+    Extrae texto de un PDF, reutilizando la caché si está disponible.
+    
+    La clave de caché depende de la ruta, la fecha de modificación y
+    el tamaño del archivo, y de la versión del extractor
+    (``version_extractor``).
+    
+    Args:
+        ruta (str): Ruta al archivo PDF
+        cache: Instancia de CacheResultados o None
+        procesos (int): Procesos usados para extraer las páginas
+        
+    Returns:
+        str: Texto extraído del PDF
+    """
+    if cache is None:
+        return _extraer_texto_pdf(ruta, procesos)
+    
+    clave = cache.clave_archivo(ruta, version_extractor())
+    texto = cache.obtener(clave)
+    if texto is None:
+        texto = _extraer_texto_pdf(ruta, procesos)
+        cache.guardar(clave, texto)
+    
+    return texto
+
+
+def _extraer_texto_pdf(ruta, procesos=1):
     """
     Extrae texto de un archivo PDF.
     
     Intenta primero con pdfplumber (más preciso), y si falla,
-    usa PyPDF2 como respaldo.
+    usa PyPDF2 como respaldo, página por página.
+    
+    Con más de un proceso, las páginas se reparten en rangos entre
+    procesos que abren el archivo por separado, y los textos se unen
+    en el orden original.
     
     Args:
         ruta (str): Ruta al archivo PDF
+        procesos (int): Número de procesos para la extracción
         
     Returns:
         str: Texto extraído del PDF
     """
-    texto = ""
+    with instrumentacion.medir('pdf.extraccion'):
+        return _extraer_texto_pdf_paralelo(ruta, procesos)
+
+
+def _extraer_texto_pdf_paralelo(ruta, procesos):
+    """Reparte la extracción de un PDF en rangos de páginas entre procesos."""
+    if procesos <= 1:
+        return _extraer_rango_pdf(ruta, 0, None)
+    
+    total = _contar_paginas_pdf(ruta)
+    procesos = min(procesos, total)
+    if procesos <= 1:
+        return _extraer_rango_pdf(ruta, 0, None)
+    
+    # Rangos más pequeños que el número de procesos para equilibrar
+    # la carga cuando algunas páginas son más lentas que otras
+    tamano_rango = max(1, math.ceil(total / (procesos * 4)))
+    inicios = range(0, total, tamano_rango)
+    
+    # Las páginas se cuentan aquí porque los procesos tienen sus propios contadores
+    instrumentacion.contar('paginas', total)
+    
+    with ProcessPoolExecutor(max_workers=procesos) as executor:
+        textos = executor.map(
+            _extraer_rango_pdf,
+            [ruta] * len(inicios),
+            inicios,
+            [inicio + tamano_rango for inicio in inicios]
+        )
+        return "".join(textos)
+
+
+def _extraer_rango_pdf(ruta, inicio, fin):
+    """Extrae y une el texto de un rango de páginas de un PDF."""
+    return "".join(
+        texto_pagina + "\n"
+        for texto_pagina in extraer_paginas_pdf(ruta, inicio, fin)
+        if texto_pagina
+    )
+
+
+def _contar_paginas_pdf(ruta):
+    """Cuenta las páginas de un PDF, con PyPDF2 como respaldo."""
+    import PyPDF2
+    import pdfplumber
     
-    # Intentar con pdfplumber primero
     try:
         with pdfplumber.open(ruta) as pdf:
-            for pagina in pdf.pages:
-                texto_pagina = pagina.extract_text()
-                if texto_pagina:
-                    texto += texto_pagina + "\n"
+            return len(pdf.pages)
+    except Exception:
+        try:
+            with open(ruta, 'rb') as file:
+                return len(PyPDF2.PdfReader(file).pages)
+        except Exception as e:
+            raise Exception(f"Error al leer PDF: {e}")
+
+
+def extraer_paginas_pdf(ruta, inicio=0, fin=None):
+    """
+    Extrae el texto de un PDF página por página.
+    
+    Es un generador: cada página se procesa recién cuando se pide, por
+    lo que la memoria no crece con el largo del PDF y las primeras
+    páginas están disponibles antes de leer el archivo completo.
+    
+    Cada página se extrae con pdfplumber y, si falla o no entrega
+    texto, con PyPDF2 como respaldo.
+    
+    Args:
+        ruta (str): Ruta al archivo PDF
+        inicio (int): Índice de la primera página (desde 0)
+        fin (int): Índice siguiente a la última página (por defecto, hasta el final)
         
-        if texto.strip():
-            return texto
-    except Exception as e:
-        print(f"⚠️  pdfplumber falló: {e}")
-        print("   Intentando con PyPDF2...")
+    Yields:
+        str: Texto de cada página (vacío si no tiene texto extraíble)
+        
+    Raises:
+        Exception: Si ninguna de las dos bibliotecas puede abrir el PDF
+    """
+    # Las bibliotecas de PDF se importan solo cuando se necesitan
+    import PyPDF2
+    import pdfplumber
     
-    # Respaldo con PyPDF2
-    try:
-        with open(ruta, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            for pagina in pdf_reader.pages:
-                texto_pagina = pagina.extract_text()
-                if texto_pagina:
-                    texto += texto_pagina + "\n"
-        
-        return texto
-    except Exception as e:
-        raise Exception(f"Error al leer PDF: {e}")
+    with contextlib.ExitStack() as pila:
+        try:
+            paginas = pila.enter_context(pdfplumber.open(ruta)).pages
+        except Exception as e:
+            print(f"⚠️  pdfplumber falló: {e}")
+            print("   Intentando con PyPDF2...")
+            paginas = None
+        
+        respaldo = None
+        error_respaldo = None
+        
+        def paginas_respaldo():
+            # Si PyPDF2 no pudo abrir el archivo, no se reintenta en
+            # cada página: se repite el mismo error
+            nonlocal respaldo, error_respaldo
+            if error_respaldo is not None:
+                raise error_respaldo
+            if respaldo is None:
+                try:
+                    archivo = open(ruta, 'rb')
+                    try:
+                        respaldo = PyPDF2.PdfReader(archivo).pages
+                    except Exception:
+                        archivo.close()
+                        raise
+                    pila.enter_context(archivo)
+                except Exception as e:
+                    error_respaldo = Exception(f"Error al leer PDF: {e}")
+                    raise error_respaldo
+            return respaldo
+        
+        total = len(paginas) if paginas is not None else len(paginas_respaldo())
+        fin = total if fin is None else min(fin, total)
+        
+        for indice in range(inicio, fin):
+            texto_pagina = None
+            
+            if paginas is not None:
+                pagina = paginas[indice]
+                try:
+                    texto_pagina = pagina.extract_text()
+                except Exception:
+                    texto_pagina = None
+                finally:
+                    # Liberar los objetos de la página ya procesada
+                    if hasattr(pagina, 'close'):
+                        pagina.close()
+            
+            if not texto_pagina:
+                try:
+                    texto_pagina = paginas_respaldo()[indice].extract_text()
+                except Exception:
+                    if paginas is None:
+                        raise
+                    texto_pagina = None
+            
+            instrumentacion.contar('paginas')
+            yield texto_pagina or ""
+
+
+def analizar_pdf_por_paginas(ruta_pdf, analizador, inicio=0, fin=None,
+                             tamano_bloque=100000, diversidad='exacta'):
+    """
+    Analiza un rango de páginas de un PDF sin cargarlo completo en memoria.
+    
+    Las páginas se extraen una a una y se entregan directamente a
+    ``analizador.analizar_streaming``.
+    
+    Args:
+        ruta_pdf (str): Ruta al archivo PDF
+        analizador: Instancia de AnalizadorLexileChile
+        inicio (int): Índice de la primera página (desde 0)
+        fin (int): Índice siguiente a la última página (por defecto, hasta el final)
+        tamano_bloque (int): Tamaño máximo de cada bloque en caracteres
+        diversidad (str): Conteo de lemas distintos, 'exacta' o 'aproximada'
+        
+    Returns:
+        dict: Resultado del análisis
+    """
+    paginas = extraer_paginas_pdf(ruta_pdf, inicio, fin)
+    return analizador.analizar_streaming(
+        (texto_pagina + "\n" for texto_pagina in paginas if texto_pagina),
+        tamano_bloque=tamano_bloque, diversidad=diversidad
+    )
 
 
 def _leer_texto(ruta):
@@ -97,7 +313,7 @@ def _leer_texto(ruta):
             return f.read()
 
 
-def analizar_pdf(ruta_pdf, analizador):
+def analizar_pdf(ruta_pdf, analizador, procesos=1):
     """
     Analiza un archivo PDF completo.
     
@@ -107,6 +323,7 @@ def analizar_pdf(ruta_pdf, analizador):
     Args:
         ruta_pdf (str): Ruta al archivo PDF
         analizador: Instancia de AnalizadorLexileChile
+        procesos (int): Procesos usados para extraer las páginas
         
     Returns:
         dict: Resultados del análisis o None si hay error
@@ -115,7 +332,9 @@ def analizar_pdf(ruta_pdf, analizador):
     print("=" * 70)
     
     try:
-        texto_completo = _extraer_texto_pdf(ruta_pdf)
+        texto_completo = _extraer_texto_pdf_con_cache(
+            ruta_pdf, analizador.cache, procesos
+        )
     except Exception as e:
         print(f"❌ Error al extraer texto del PDF: {e}")
         print("\n💡 Posibles soluciones:")
@@ -148,13 +367,17 @@ def analizar_pdf(ruta_pdf, analizador):
     return resultado
 
 
-def comparar_textos(textos_dict, analizador):
+def comparar_textos(textos_dict, analizador, batch_size=64, n_process=1):
     """
     Compara múltiples textos y muestra una tabla comparativa.
     
+    Los textos se analizan en lote con ``analizador.analizar_lote``.
+    
     Args:
         textos_dict (dict): Diccionario {"nombre": "texto"}
         analizador: Instancia de AnalizadorLexileChile
+        batch_size (int): Cantidad de párrafos por lote enviado a spaCy
+        n_process (int): Número de procesos que usa spaCy
         
     Returns:
         list: Lista de resultados ordenados por nivel Lexile
@@ -166,8 +389,10 @@ def comparar_textos(textos_dict, analizador):
     
     resultados = []
     
-    for nombre, texto in textos_dict.items():
-        resultado = analizador.analizar(texto)
+    analisis = analizador.analizar_lote(
+        textos_dict.values(), batch_size=batch_size, n_process=n_process
+    )
+    for nombre, resultado in zip(textos_dict.keys(), analisis):
         if 'error' not in resultado:
             resultados.append({
                 'nombre': nombre,
@@ -177,7 +402,18 @@ def comparar_textos(textos_dict, analizador):
                 'oraciones': resultado['estadisticas']['oraciones']
             })
     
-    # Imprimir tabla comparativa
+    imprimir_tabla_comparativa(resultados)
+    return resultados
+
+
+def imprimir_tabla_comparativa(resultados):
+    """
+    Imprime una tabla comparativa ordenada por nivel Lexile.
+    
+    Args:
+        resultados (list): Lista de diccionarios con las claves
+            nombre, lexile, grado y palabras
+    """
     print(f"{'Nombre':<30} {'Lexile':>8} {'Grado':<25} {'Palabras':>8}")
     print("-" * 70)
     
@@ -185,7 +421,6 @@ def comparar_textos(textos_dict, analizador):
         print(f"{r['nombre']:<30} {r['lexile']:>6}L  {r['grado']:<25} {r['palabras']:>8}")
     
     print()
-    return resultados
 
 
 def cargar_multiples_documentos(rutas_dict):
@@ -210,6 +445,31 @@ def cargar_multiples_documentos(rutas_dict):
     return documentos
 
 
+def analizar_multiples_documentos(rutas_dict, analizador, batch_size=64,
+                                  n_process=1):
+    """
+    Carga múltiples documentos y los analiza en lote.
+    
+    Los documentos se cargan con ``cargar_multiples_documentos`` y se
+    analizan juntos con ``analizador.analizar_lote``.
+    
+    Args:
+        rutas_dict (dict): Diccionario {"nombre": "ruta/al/archivo"}
+        analizador: Instancia de AnalizadorLexileChile
+        batch_size (int): Cantidad de párrafos por lote enviado a spaCy
+        n_process (int): Número de procesos que usa spaCy
+        
+    Returns:
+        dict: Diccionario {"nombre": resultado} con los documentos que
+            se pudieron cargar
+    """
+    documentos = cargar_multiples_documentos(rutas_dict)
+    analisis = analizador.analizar_lote(
+        documentos.values(), batch_size=batch_size, n_process=n_process
+    )
+    return dict(zip(documentos.keys(), analisis))
+
+
 def guardar_resultado(resultado, ruta_salida):
     """
     Guarda el resultado del análisis en un archivo de texto.
@@ -0,0 +1,199 @@
+"""
+Perfil de dificultad por ventanas deslizantes
+Calcula el nivel Lexile y las estadísticas sobre ventanas de N oraciones
+para ver dónde se concentra la dificultad de una lectura larga
+"""
+
+import csv
+
+import numpy as np
+
+try:
+    from .analizador_lexile import NIVELES_CHILE, calcular_lexile_lote, clasificar_niveles_lote
+except ImportError:
+    from analizador_lexile import NIVELES_CHILE, calcular_lexile_lote, clasificar_niveles_lote
+
+
+# Columnas del perfil, en orden
+CAMPOS_PERFIL = [
+    ('inicio', np.int64),
+    ('fin', np.int64),
+    ('lexile', np.float64),
+    ('nivel', np.int64),
+    ('palabras', np.int64),
+    ('oraciones', np.int64),
+    ('palabras_por_oracion', np.float64),
+    ('silabas_por_palabra', np.float64),
+    ('palabras_raras_pct', np.float64),
+    ('palabras_complejas_pct', np.float64),
+    ('diversidad_lexica', np.float64),
+]
+
+
+def _acumulado(valores):
+    """Suma acumulada con un cero inicial."""
+    acumulado = np.zeros(len(valores) + 1, dtype=np.int64)
+    np.cumsum(valores, out=acumulado[1:])
+    return acumulado
+
+
+def perfil_dificultad(analizador, texto, oraciones_por_ventana=10, paso=5):
+    """
+    Calcula el perfil de dificultad de un texto por ventanas de oraciones.
+    
+    El texto pasa una sola vez por spaCy. Las sumas por oración se
+    acumulan (sumas prefijas), de modo que las métricas de todas las
+    ventanas se obtienen con operaciones sobre arreglos y se puntúan en
+    una sola llamada a ``calcular_lexile_lote`` y
+    ``clasificar_niveles_lote``. Los lemas distintos de cada ventana se
+    actualizan desde la anterior con las palabras que entran y salen.
+    
+    Una ventana que cubre todo el texto entrega los mismos valores que
+    ``analizar``.
+    
+    Args:
+        analizador: Instancia de AnalizadorLexileChile
+        texto: Texto a analizar
+        oraciones_por_ventana: Oraciones en cada ventana (N)
+        paso: Oraciones entre el inicio de dos ventanas (S)
+        
+    Returns:
+        np.ndarray: Arreglo estructurado con una fila por ventana y los
+            campos de CAMPOS_PERFIL. 'inicio' y 'fin' son índices de
+            oración (fin exclusivo); la última ventana se alinea al final
+            del texto. 'nivel' es el índice en NIVELES_CHILE. Las
+            ventanas sin palabras tienen NaN en las métricas y nivel -1.
+    """
+    if oraciones_por_ventana < 1 or paso < 1:
+        raise ValueError("oraciones_por_ventana y paso deben ser al menos 1")
+    
+    caracteristicas = analizador._caracteristicas_nlp(texto.strip())
+    num_oraciones = caracteristicas.num_oraciones
+    oracion = caracteristicas.oracion
+    
+    # Sumas por oración y sus acumulados
+    longitudes = np.bincount(oracion, minlength=num_oraciones)
+    por_oracion = lambda pesos: np.bincount(
+        oracion, weights=pesos, minlength=num_oraciones
+    ).astype(np.int64)
+    
+    acum_palabras = _acumulado(longitudes)
+    acum_cuadrados = _acumulado(longitudes * longitudes)
+    acum_rankings = _acumulado(por_oracion(caracteristicas.ranking))
+    acum_raras = _acumulado(por_oracion(caracteristicas.rara))
+    acum_silabas = _acumulado(por_oracion(caracteristicas.silabas))
+    acum_complejas = _acumulado(por_oracion(caracteristicas.silabas >= 3))
+    
+    # Diversidad: cada ventana se obtiene de la anterior. Al agregar una
+    # palabra, su lema es nuevo si la aparición anterior quedó antes del
+    # inicio; al quitarla, el lema sale si la siguiente queda después del
+    # fin. El trabajo por ventana depende del paso y no de su largo.
+    _, ids_lema = np.unique(caracteristicas.lema, return_inverse=True)
+    anterior = np.full(len(ids_lema), -1, dtype=np.int64)
+    siguiente = np.full(len(ids_lema), len(ids_lema), dtype=np.int64)
+    orden = np.lexsort((np.arange(len(ids_lema)), ids_lema))
+    mismo_lema = ids_lema[orden[1:]] == ids_lema[orden[:-1]]
+    anterior[orden[1:][mismo_lema]] = orden[:-1][mismo_lema]
+    siguiente[orden[:-1][mismo_lema]] = orden[1:][mismo_lema]
+    
+    inicios = np.arange(0, max(1, num_oraciones - oraciones_por_ventana + 1), paso)
+    ultimo_inicio = num_oraciones - oraciones_por_ventana
+    if ultimo_inicio > inicios[-1]:
+        # Última ventana alineada al final para cubrir las oraciones restantes
+        inicios = np.append(inicios, ultimo_inicio)
+    fines = np.minimum(inicios + oraciones_por_ventana, num_oraciones)
+    
+    perfil = np.zeros(len(inicios), dtype=CAMPOS_PERFIL)
+    perfil['inicio'] = inicios
+    perfil['fin'] = fines
+    perfil['oraciones'] = fines - inicios
+    palabras = acum_palabras[fines] - acum_palabras[inicios]
+    perfil['palabras'] = palabras
+    
+    unicos = np.zeros(len(inicios), dtype=np.int64)
+    primera = ultima = distintos = 0
+    for i, (nueva_primera, nueva_ultima) in enumerate(zip(acum_palabras[inicios].tolist(),
+                                                          acum_palabras[fines].tolist())):
+        distintos += np.count_nonzero(anterior[ultima:nueva_ultima] < primera)
+        distintos -= np.count_nonzero(siguiente[primera:nueva_primera] >= nueva_ultima)
+        primera, ultima = nueva_primera, nueva_ultima
+        unicos[i] = distintos
+    
+    perfil['lexile'] = np.nan
+    perfil['nivel'] = -1
+    for campo, _ in CAMPOS_PERFIL[6:]:
+        perfil[campo] = np.nan
+    
+    validas = np.flatnonzero(palabras > 0)
+    if len(validas) == 0:
+        return perfil
+    
+    # Las métricas de todas las ventanas se calculan y puntúan juntas
+    inicio, fin = inicios[validas], fines[validas]
+    n_oraciones = fin - inicio
+    n_palabras = palabras[validas]
+    diferencia = lambda acumulado: acumulado[fin] - acumulado[inicio]
+    
+    long_promedio = n_palabras / n_oraciones
+    varianza = diferencia(acum_cuadrados) / n_oraciones - long_promedio ** 2
+    long_desv = np.sqrt(np.maximum(0.0, varianza))
+    freq_promedio = diferencia(acum_rankings) / n_palabras
+    pct_raras = diferencia(acum_raras) / n_palabras * 100
+    sil_promedio = diferencia(acum_silabas) / n_palabras
+    ratio_complejas = diferencia(acum_complejas) / n_palabras
+    
+    lexiles = calcular_lexile_lote(long_promedio, long_desv, freq_promedio,
+                                   sil_promedio, ratio_complejas, pct_raras,
+                                   analizador.coeficientes)
+    perfil['lexile'][validas] = np.round(lexiles)
+    perfil['nivel'][validas] = clasificar_niveles_lote(lexiles, analizador.limites_niveles)
+    
+    # Redondeos iguales a los de ``analizar``: el de NumPy para las
+    # palabras por oración y round() de Python para el resto
+    redondear = lambda valores, decimales: [round(v, decimales) for v in valores.tolist()]
+    perfil['palabras_por_oracion'][validas] = np.round(long_promedio, 1)
+    perfil['silabas_por_palabra'][validas] = redondear(sil_promedio, 2)
+    perfil['palabras_raras_pct'][validas] = redondear(pct_raras, 1)
+    perfil['palabras_complejas_pct'][validas] = redondear(ratio_complejas * 100, 1)
+    perfil['diversidad_lexica'][validas] = redondear(unicos[validas] / n_palabras, 3)
+    
+    return perfil
+
+
+def guardar_perfil_csv(perfil, ruta_salida):
+    """
+    Guarda un perfil de dificultad en formato CSV.
+    
+    Args:
+        perfil: Arreglo retornado por ``perfil_dificultad``
+        ruta_salida: Ruta del archivo CSV
+    """
+    with open(ruta_salida, 'w', encoding='utf-8', newline='') as f:
+        escritor = csv.writer(f)
+        escritor.writerow(perfil.dtype.names)
+        escritor.writerows(fila.tolist() for fila in perfil)
+    
+    print(f"\n✓ Perfil guardado en: {ruta_salida}")
+
+
+def imprimir_perfil(perfil):
+    """
+    Imprime un perfil de dificultad como tabla compacta.
+    
+    Args:
+        perfil: Arreglo retornado por ``perfil_dificultad``
+    """
+    print(f"\n{'Oraciones':<14} {'Lexile':<10} {'Palabras':<10} {'Pal/Or':<8} {'Raras %':<8}")
+    print("-" * 54)
+    
+    for fila in perfil:
+        rango = f"{fila['inicio'] + 1}-{fila['fin']}"
+        lexile = '-' if np.isnan(fila['lexile']) else f"{fila['lexile']:.0f}L"
+        print(f"{rango:<14} {lexile:<10} {fila['palabras']:<10} "
+              f"{fila['palabras_por_oracion']:<8} {fila['palabras_raras_pct']:<8}")
+    
+    if len(perfil) and not np.all(np.isnan(perfil['lexile'])):
+        mas_dificil = perfil[np.nanargmax(perfil['lexile'])]
+        grado = NIVELES_CHILE[mas_dificil['nivel']]['grado']
+        print(f"\n🔺 Tramo más difícil: oraciones {mas_dificil['inicio'] + 1}-"
+              f"{mas_dificil['fin']} ({mas_dificil['lexile']:.0f}L, {grado})")
@@ -0,0 +1,24 @@
+"""
+Configuración de pytest: agrega src al path, como main.py
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+
+@pytest.fixture(scope='session')
+def analizador():
+    """Analizador con el perfil completo; se omite si falta el modelo de spaCy."""
+    pytest.importorskip('spacy')
+    from analizador_lexile import AnalizadorLexileChile
+    
+    analizador = AnalizadorLexileChile(verbose=False)
+    try:
+        analizador.nlp
+    except OSError:
+        pytest.skip("Modelo de spaCy no instalado (python -m spacy download es_core_news_sm)")
+    return analizador
@@ -0,0 +1,71 @@
+"""
+Reevaluación del corpus desde el almacén, sin spaCy
+"""
+
+from almacen import AlmacenDocumentos, reevaluar
+from analizador_lexile import PARAMETROS_LEXILE, AnalizadorLexileChile
+from corpus import analizar_corpus
+
+
+def _con_almacen(analizador, ruta_almacen, parametros=None):
+    """Analizador que comparte el modelo ya cargado."""
+    nuevo = AnalizadorLexileChile(almacen=ruta_almacen, parametros=parametros,
+                                  verbose=False)
+    nuevo._nlp = analizador.nlp
+    return nuevo
+
+
+def test_reevaluar_igual_al_analisis_original(analizador, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'textos').mkdir()
+    (tmp_path / 'textos' / 'a.txt').write_text(
+        "El perro corre por el parque.\n\nLuego descansa bajo un árbol.", encoding='utf-8')
+    (tmp_path / 'textos' / 'b.txt').write_text(
+        "La fotosíntesis transforma la energía lumínica en energía química.",
+        encoding='utf-8')
+    (tmp_path / 'textos' / 'vacio.txt').write_text("   \n", encoding='utf-8')
+    # Rutas relativas y fuera de orden alfabético, con un archivo inexistente
+    rutas = ['textos/b.txt', 'textos/no_existe.txt', 'textos/vacio.txt', 'textos/a.txt']
+    
+    con_almacen = _con_almacen(analizador, 'almacen.db')
+    originales = list(analizar_corpus(rutas, procesos=1, analizador=con_almacen))
+    assert any('error' in item for item in originales)
+    assert any('error' in item.get('resultado', {}) for item in originales)
+    
+    reevaluados = list(reevaluar('almacen.db', con_almacen))
+    assert reevaluados == originales
+
+
+def test_reevaluar_con_otros_parametros(analizador, tmp_path):
+    textos = {'a.txt': "El perro corre por el parque.", 'b.txt': "El gato duerme."}
+    rutas = []
+    for nombre, texto in textos.items():
+        (tmp_path / nombre).write_text(texto, encoding='utf-8')
+        rutas.append(str(tmp_path / nombre))
+    ruta_almacen = str(tmp_path / 'almacen.db')
+    list(analizar_corpus(rutas, procesos=1, analizador=_con_almacen(analizador, ruta_almacen)))
+    
+    parametros = {
+        'version': 'prueba',
+        'coeficientes': dict(PARAMETROS_LEXILE, base=PARAMETROS_LEXILE['base'] + 50),
+        'limites_niveles': analizador.limites_niveles.tolist(),
+    }
+    otro = AnalizadorLexileChile(parametros=parametros, verbose=False)
+    otro._nlp = analizador.nlp
+    reevaluados = list(reevaluar(ruta_almacen, otro))
+    assert [item['resultado'] for item in reevaluados] == [
+        otro.analizar(texto) for texto in textos.values()
+    ]
+
+
+def test_archivo_modificado_no_deja_documentos_huerfanos(analizador, tmp_path):
+    ruta = tmp_path / 'a.txt'
+    ruta_almacen = str(tmp_path / 'almacen.db')
+    con_almacen = _con_almacen(analizador, ruta_almacen)
+    for texto in ["El perro corre.", "El perro corre mucho."]:
+        ruta.write_text(texto, encoding='utf-8')
+        list(analizar_corpus([str(ruta)], procesos=1, analizador=con_almacen))
+    
+    assert len(AlmacenDocumentos(ruta_almacen)) == 1
+    (item,) = reevaluar(ruta_almacen, con_almacen)
+    assert item['resultado'] == analizador.analizar("El perro corre mucho.")
@@ -0,0 +1,68 @@
+"""
+Calibración: ajuste, restricciones y archivo de parámetros
+"""
+
+import numpy as np
+
+from analizador_lexile import (
+    AnalizadorLexileChile, PARAMETROS_LEXILE, calcular_lexile_lote,
+    cargar_parametros, clasificar_niveles_lote
+)
+from calibracion import (
+    COEFICIENTES_LINEALES, COEFICIENTES_NO_NEGATIVOS, _matriz_diseno,
+    _minimos_cuadrados, calibrar, evaluar, guardar_parametros
+)
+
+
+def _metricas(cantidad, semilla=0):
+    """Matriz de métricas sintética, con las columnas de COLUMNAS_METRICAS."""
+    generador = np.random.default_rng(semilla)
+    return np.column_stack([
+        generador.uniform(4, 30, cantidad),
+        generador.uniform(0, 10, cantidad),
+        generador.uniform(1, 4, cantidad),
+        generador.uniform(1.5, 2.6, cantidad),
+        generador.uniform(0, 0.4, cantidad),
+        generador.uniform(0, 40, cantidad),
+    ])
+
+
+def test_minimos_cuadrados_sin_factores_negativos():
+    metricas = _metricas(200)
+    coeficientes = dict(PARAMETROS_LEXILE)
+    matriz = _matriz_diseno(metricas, coeficientes)
+    # Un objetivo que baja con la frecuencia empuja el factor a negativo
+    objetivo = 500 + 10 * metricas[:, 0] - 300 * metricas[:, 2]
+    
+    solucion = _minimos_cuadrados(matriz, objetivo)
+    coeficientes.update(zip(COEFICIENTES_LINEALES, solucion.tolist()))
+    assert all(coeficientes[nombre] >= 0 for nombre in COEFICIENTES_NO_NEGATIVOS)
+    
+    # Con factores no negativos la matriz reproduce la fórmula
+    lexile = np.clip(matriz @ solucion, coeficientes['lexile_minimo'],
+                     coeficientes['lexile_maximo'])
+    assert np.allclose(lexile, calcular_lexile_lote(*metricas.T, coeficientes))
+
+
+def test_calibrar_y_cargar_parametros(tmp_path):
+    metricas = _metricas(300)
+    etiquetas = clasificar_niveles_lote(calcular_lexile_lote(*metricas.T, PARAMETROS_LEXILE))
+    metricas[0] = np.nan
+    
+    calibracion = calibrar(metricas, etiquetas, procesos=1)
+    assert calibracion['documentos'] == 299
+    assert calibracion['exactitud'] > 0.7
+    
+    ruta = str(tmp_path / 'parametros.json')
+    guardar_parametros(calibracion, ruta, version='prueba')
+    parametros = cargar_parametros(ruta)
+    assert parametros['coeficientes'] == calibracion['coeficientes']
+    assert parametros['limites_niveles'] == calibracion['limites_niveles']
+    
+    # El analizador con el archivo clasifica como lo midió la calibración
+    analizador = AnalizadorLexileChile(parametros=ruta, verbose=False)
+    error_medio, exactitud, _ = evaluar(analizador.coeficientes, metricas[1:],
+                                        etiquetas[1:], analizador.limites_niveles)
+    assert error_medio == calibracion['error_medio']
+    assert exactitud == calibracion['exactitud']
+    assert analizador.version_parametros.startswith('prueba+')
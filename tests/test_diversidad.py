@@ -0,0 +1,70 @@
+"""
+Cotas de error de HyperLogLog y conteo de lemas por partes
+"""
+
+import math
+
+import numpy as np
+
+from diversidad import ConjuntoLemas, ConteoLemas, HyperLogLog
+
+
+def _ids(generador, cantidad):
+    return generador.integers(0, 2 ** 64, size=cantidad, dtype=np.uint64)
+
+
+def test_hyperloglog_dentro_de_la_cota_de_error():
+    generador = np.random.default_rng(0)
+    for cantidad in [1, 10, 100, 1000, 10000, 100000]:
+        hll = HyperLogLog()
+        ids = _ids(generador, cantidad)
+        # Con repetidos, para que no basten los identificadores agregados
+        hll.agregar(np.concatenate([ids, ids[:cantidad // 2]]))
+        error_estandar = 1.04 / math.sqrt(len(hll.registros))
+        assert abs(hll.estimar() - cantidad) <= max(1, 4 * error_estandar * cantidad)
+
+
+def test_hyperloglog_error_estandar_relativo():
+    generador = np.random.default_rng(1)
+    precision, cantidad = 10, 5000
+    errores = []
+    for _ in range(60):
+        hll = HyperLogLog(precision)
+        hll.agregar(_ids(generador, cantidad))
+        errores.append(hll.estimar() / cantidad - 1)
+    
+    error_estandar = 1.04 / math.sqrt(2 ** precision)
+    assert abs(np.mean(errores)) < error_estandar
+    assert np.sqrt(np.mean(np.square(errores))) < 1.5 * error_estandar
+
+
+def test_hyperloglog_combinar_igual_a_la_union():
+    generador = np.random.default_rng(2)
+    a, b = _ids(generador, 3000), _ids(generador, 3000)
+    separados, union = HyperLogLog(), HyperLogLog()
+    separados.agregar(a)
+    otro = HyperLogLog()
+    otro.agregar(b)
+    separados.combinar(otro)
+    union.agregar(np.concatenate([a, b]))
+    assert np.array_equal(separados.registros, union.registros)
+
+
+def test_conteo_lemas_al_agregar_y_quitar_partes():
+    partes = [np.array([1, 2, 3]), np.array([3, 4]), np.array([4, 5, 1])]
+    conjuntos = []
+    for parte in partes:
+        conjunto = ConjuntoLemas()
+        conjunto.agregar(parte)
+        conjuntos.append(conjunto)
+    
+    conteo = ConteoLemas()
+    for conjunto in conjuntos:
+        conteo.agregar(conjunto.ids)
+    assert len(conteo) == 5
+    
+    conteo.quitar(conjuntos[0].ids)
+    assert len(conteo) == 4
+    conteo.agregar(conjuntos[1].ids, veces=2)
+    conteo.quitar(conjuntos[1].ids, veces=3)
+    assert len(conteo) == 3
@@ -0,0 +1,191 @@
+"""
+Equivalencias entre los cálculos vectorizados y los de un texto
+"""
+
+import numpy as np
+import pytest
+
+from analizador_lexile import (
+    AgregadosTexto, AnalizadorLexileChile, CaracteristicasTexto,
+    LIMITES_NIVELES_CHILE, NIVELES_CHILE, calcular_lexile_lote,
+    clasificar_niveles_lote, comparar_perfiles
+)
+from incremental import AnalisisIncremental
+from ventanas import perfil_dificultad
+
+
+TEXTOS = [
+    "El perro corre por el parque. El gato salta sobre la cerca.",
+    "Mi mamá me ama. Yo amo a mi mamá. Vamos a la playa todos los días.",
+    "La fotosíntesis es un proceso bioquímico fundamental mediante el cual "
+    "las plantas convierten la energía lumínica en energía química. Este "
+    "mecanismo permite la síntesis de compuestos orgánicos a partir de "
+    "sustancias inorgánicas.",
+    "La epistemología contemporánea cuestiona los fundamentos "
+    "metodológicos del conocimiento científico, particularmente en lo "
+    "relativo a la verificabilidad empírica de las proposiciones teóricas "
+    "y su relación con los paradigmas dominantes de cada época histórica.",
+    "",
+    "Había una vez un niño que vivía cerca del mar. Todas las mañanas "
+    "caminaba por la orilla buscando conchas de colores.\n\nUn día encontró "
+    "una botella con un mensaje adentro. El mensaje decía que alguien "
+    "necesitaba ayuda en una isla lejana.",
+]
+
+
+def _lexile_original(long_prom, long_desv, freq_prom, sil_prom,
+                     ratio_complejas, pct_raras):
+    """Fórmula Lexile original, escrita texto a texto."""
+    if long_prom <= 5:
+        comp_longitud = 0
+    elif long_prom <= 10:
+        comp_longitud = (long_prom - 5) * 80
+    elif long_prom <= 20:
+        comp_longitud = 400 + (long_prom - 10) * 50
+    else:
+        comp_longitud = 900 + (long_prom - 20) * 30
+    
+    comp_frecuencia = max(0, (freq_prom - 1.5) * 200)
+    comp_raras = pct_raras * 2 if long_prom > 8 else pct_raras * 0.5
+    comp_silabas = max(0, (sil_prom - 1.8) * 150)
+    comp_complejas = ratio_complejas * 100
+    comp_variabilidad = long_desv * 8
+    
+    lexile = (100 + comp_longitud + comp_frecuencia + comp_raras +
+              comp_silabas + comp_complejas + comp_variabilidad)
+    return max(50, min(1600, lexile))
+
+
+def _nivel_original(lexile):
+    """Clasificación original por umbrales, como índice de NIVELES_CHILE."""
+    for indice, limite in enumerate([300, 500, 700, 900, 1050, 1200]):
+        if lexile < limite:
+            return indice
+    return len(NIVELES_CHILE) - 1
+
+
+def _metricas_aleatorias(cantidad=5000, semilla=0):
+    """Métricas aleatorias, más los cortes de longitud y de palabras raras."""
+    rng = np.random.default_rng(semilla)
+    long_prom = np.concatenate([rng.uniform(0, 40, cantidad),
+                                [5.0, 8.0, 10.0, 20.0, 5.0001, 19.9999]])
+    n = len(long_prom)
+    return (
+        long_prom,
+        rng.uniform(0, 15, n),
+        rng.uniform(1, 2000, n),
+        rng.uniform(1, 3.5, n),
+        rng.uniform(0, 1, n),
+        rng.uniform(0, 100, n),
+    )
+
+
+def test_calcular_lexile_lote_igual_a_formula_original():
+    metricas = _metricas_aleatorias()
+    lote = calcular_lexile_lote(*metricas)
+    esperado = np.array([_lexile_original(*fila) for fila in zip(*metricas)])
+    assert np.array_equal(lote, esperado)
+
+
+def test_calcular_lexile_escalar_igual_a_lote():
+    analizador = AnalizadorLexileChile(verbose=False)
+    metricas = _metricas_aleatorias(cantidad=500, semilla=1)
+    lote = calcular_lexile_lote(*metricas)
+    for i, fila in enumerate(zip(*metricas)):
+        assert analizador._calcular_lexile(*fila) == lote[i]
+
+
+def test_clasificar_niveles_lote_igual_a_umbrales_originales():
+    bordes = np.concatenate([LIMITES_NIVELES_CHILE,
+                             np.nextafter(LIMITES_NIVELES_CHILE, -np.inf)])
+    lexile = np.concatenate([np.linspace(0, 1700, 3401), bordes, [50, 1600]])
+    niveles = clasificar_niveles_lote(lexile)
+    assert niveles.tolist() == [_nivel_original(valor) for valor in lexile]
+
+
+def test_clasificar_nivel_escalar_igual_a_lote():
+    analizador = AnalizadorLexileChile(verbose=False)
+    for lexile in [50, 299.5, 300, 699.99, 700, 1050, 1199, 1200, 1600]:
+        indice = int(clasificar_niveles_lote(lexile))
+        assert analizador._clasificar_nivel_chile(lexile) == NIVELES_CHILE[indice]
+
+
+def test_analizar_lote_igual_a_analizar(analizador):
+    esperados = [analizador.analizar(texto) for texto in TEXTOS]
+    assert list(analizador.analizar_lote(TEXTOS, batch_size=2)) == esperados
+
+
+def test_actualizar_igual_a_analizar(analizador):
+    parrafos = [texto for texto in TEXTOS if texto]
+    versiones = [
+        parrafos,
+        parrafos[:2] + ["El perro duerme. El gato no."] + parrafos[3:],
+        parrafos[:1] + parrafos,
+        list(reversed(parrafos)),
+        parrafos[1:2],
+        [],
+        parrafos[2:],
+    ]
+    incremental = AnalisisIncremental(analizador)
+    for version in versiones:
+        texto = "\n\n".join(version)
+        assert incremental.actualizar(texto) == analizador.analizar(texto)
+    
+    editados = parrafos[2:-1] + ["Un párrafo nuevo y corto."]
+    incremental.actualizar("\n\n".join(editados))
+    assert incremental.parrafos_reanalizados == 1
+
+
+def test_analizar_streaming_igual_a_analizar(analizador):
+    texto = "\n\n".join(texto for texto in TEXTOS if texto)
+    esperado = analizador.analizar(texto)
+    assert analizador.analizar_streaming(texto) == esperado
+    
+    # Fragmentos (como páginas) que cortan párrafos, oraciones y palabras
+    cortes = range(0, len(texto), 37)
+    fragmentos = [texto[inicio:inicio + 37] for inicio in cortes]
+    assert analizador.analizar_streaming(fragmentos, tamano_bloque=len(texto)) == esperado
+    assert analizador.analizar_streaming("  \n\n ") == analizador.analizar("  \n\n ")
+
+
+def _ventana(caracteristicas, inicio, fin):
+    """Características de las oraciones [inicio, fin) de un texto."""
+    palabras = (caracteristicas.oracion >= inicio) & (caracteristicas.oracion < fin)
+    return CaracteristicasTexto(
+        oracion=caracteristicas.oracion[palabras] - inicio,
+        ranking=caracteristicas.ranking[palabras],
+        rara=caracteristicas.rara[palabras],
+        silabas=caracteristicas.silabas[palabras],
+        lema=caracteristicas.lema[palabras],
+        num_oraciones=fin - inicio
+    )
+
+
+def test_perfil_dificultad_igual_a_analizar(analizador):
+    texto = "\n\n".join(texto for texto in TEXTOS if texto)
+    completo = perfil_dificultad(analizador, texto, oraciones_por_ventana=1000)
+    esperado = analizador.analizar(texto)
+    assert len(completo) == 1
+    assert completo['lexile'][0] == esperado['lexile']
+    assert NIVELES_CHILE[completo['nivel'][0]]['grado'] == esperado['grado']
+    for campo, valor in esperado['estadisticas'].items():
+        assert completo[campo][0] == valor, campo
+    
+    # Cada ventana puntúa igual que sus oraciones analizadas aparte
+    caracteristicas = analizador._caracteristicas_nlp(texto)
+    for fila in perfil_dificultad(analizador, texto, oraciones_por_ventana=3, paso=2):
+        agregados = AgregadosTexto().agregar(
+            _ventana(caracteristicas, fila['inicio'], fila['fin'])
+        )
+        resultado = analizador._resultado_desde_agregados(agregados)
+        if 'error' in resultado:
+            assert np.isnan(fila['lexile'])
+            continue
+        assert fila['lexile'] == resultado['lexile']
+        for campo, valor in resultado['estadisticas'].items():
+            assert fila[campo] == valor, campo
+
+
+def test_perfil_ligero_dentro_de_tolerancia(analizador):
+    comparacion = comparar_perfiles([texto for texto in TEXTOS if texto])
+    assert comparacion['dentro_tolerancia'], comparacion['diferencias']
@@ -0,0 +1,89 @@
+"""
+Exportación reanudable: --anexar, líneas cortadas y Parquet temporal
+"""
+
+import csv
+import json
+import os
+import sys
+
+import pytest
+
+from exportacion import exportar_resultados, rutas_escritas
+
+
+def _item(ruta, lexile):
+    return {
+        'nombre': os.path.basename(ruta), 'ruta': ruta,
+        'resultado': {'lexile': lexile, 'grado': '5° Básico',
+                      'estadisticas': {'palabras': 10, 'oraciones': 2}},
+    }
+
+
+def _filas(ruta, formato):
+    if formato == 'jsonl':
+        with open(ruta, encoding='utf-8') as f:
+            return [json.loads(linea) for linea in f]
+    if formato == 'csv':
+        with open(ruta, encoding='utf-8', newline='') as f:
+            return list(csv.DictReader(f))
+    import pyarrow.parquet as pq
+    return pq.read_table(ruta).to_pylist()
+
+
+@pytest.mark.parametrize('formato', ['jsonl', 'csv'])
+def test_anexar_reanuda_tras_una_linea_cortada(tmp_path, formato):
+    ruta = str(tmp_path / f'resultados.{formato}')
+    exportar_resultados([_item('a.txt', 400), _item('b.txt', 500)], ruta)
+    
+    # Una ejecución cortada a mitad de una escritura deja una línea sin salto
+    with open(ruta, 'a', encoding='utf-8') as f:
+        f.write('{"nombre": "c.txt", "ru' if formato == 'jsonl' else 'c.txt,c.t')
+    assert rutas_escritas(ruta) == {'a.txt', 'b.txt'}
+    
+    items = [_item('a.txt', 400), _item('b.txt', 500), _item('c.txt', 600)]
+    assert exportar_resultados(items, ruta, anexar=True) == 1
+    filas = _filas(ruta, formato)
+    assert [fila['ruta'] for fila in filas] == ['a.txt', 'b.txt', 'c.txt']
+    assert str(filas[-1]['lexile']) == '600'
+    
+    # Las rutas ya leídas se pueden pasar para no leer el archivo otra vez
+    assert exportar_resultados(items, ruta, anexar=True, omitir={'a.txt', 'b.txt'}) == 1
+    assert len(_filas(ruta, formato)) == 4
+
+
+def test_parquet_con_error_deja_el_destino_intacto(tmp_path):
+    pytest.importorskip('pyarrow')
+    ruta = str(tmp_path / 'resultados.parquet')
+    exportar_resultados([_item('a.txt', 400)], ruta)
+    
+    def items():
+        yield _item('b.txt', 500)
+        raise RuntimeError('corte')
+    
+    with pytest.raises(RuntimeError):
+        exportar_resultados(items(), ruta, anexar=True, tamano_bloque=1)
+    assert not os.path.exists(ruta + '.tmp')
+    assert [fila['ruta'] for fila in _filas(ruta, 'parquet')] == ['a.txt']
+    
+    items = [_item('a.txt', 400), _item('b.txt', 500)]
+    assert exportar_resultados(items, ruta, anexar=True) == 1
+    assert [fila['ruta'] for fila in _filas(ruta, 'parquet')] == ['a.txt', 'b.txt']
+
+
+def test_main_anexar_no_repite_documentos(analizador, tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(os.path.join(os.path.dirname(__file__), '..'))
+    import main
+    
+    monkeypatch.chdir(tmp_path)
+    for nombre in ['a.txt', 'b.txt', 'c.txt']:
+        (tmp_path / nombre).write_text("El perro corre. El gato salta.", encoding='utf-8')
+    
+    def ejecutar(*argumentos):
+        monkeypatch.setattr(sys, 'argv', ['main.py', '--sin-cache', *argumentos])
+        main.main()
+    
+    ejecutar('--comparar', 'a.txt', 'b.txt', '--output', 'salida.jsonl')
+    ejecutar('--comparar', 'a.txt', 'b.txt', 'c.txt', '--output', 'salida.jsonl', '--anexar')
+    filas = _filas('salida.jsonl', 'jsonl')
+    assert [fila['ruta'] for fila in filas] == ['a.txt', 'b.txt', 'c.txt']
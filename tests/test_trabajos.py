@@ -0,0 +1,83 @@
+"""
+Reanudación de trabajos de corpus con el diario
+"""
+
+import json
+
+from analizador_lexile import PARAMETROS_LEXILE, AnalizadorLexileChile
+from trabajos import DiarioTrabajo, ejecutar_trabajo
+
+
+def _escribir(directorio, textos):
+    rutas = []
+    for nombre, texto in textos.items():
+        ruta = directorio / nombre
+        ruta.write_text(texto, encoding='utf-8')
+        rutas.append(str(ruta))
+    return rutas
+
+
+def _ejecutar(rutas, ruta_diario, analizador):
+    diario = DiarioTrabajo(ruta_diario)
+    try:
+        return list(ejecutar_trabajo(rutas, diario, progreso=False,
+                                     procesos=1, analizador=analizador))
+    finally:
+        diario.cerrar()
+
+
+def test_reanudar_entrega_los_mismos_resultados(analizador, tmp_path):
+    rutas = _escribir(tmp_path, {
+        'a.txt': "El perro corre por el parque.\n\nLuego descansa.",
+        'b.txt': "La fotosíntesis transforma la energía lumínica en química.",
+        'vacio.txt': "",
+    })
+    rutas.append(str(tmp_path / 'no_existe.txt'))
+    ruta_diario = str(tmp_path / 'diario.db')
+    
+    primera = _ejecutar(rutas, ruta_diario, analizador)
+    assert not any(item.get('reanudado') for item in primera)
+    
+    segunda = _ejecutar(rutas, ruta_diario, analizador)
+    por_ruta = {item['ruta']: item for item in segunda}
+    assert sorted(por_ruta) == sorted(rutas)
+    for item in primera:
+        reanudado = por_ruta[item['ruta']]
+        if 'error' in item:
+            # Los archivos que no se pudieron leer se reintentan
+            assert not reanudado.get('reanudado')
+            continue
+        assert reanudado['reanudado']
+        assert reanudado['resultado'] == json.loads(json.dumps(item['resultado']))
+
+
+def test_reanudar_reanaliza_archivos_modificados(analizador, tmp_path):
+    rutas = _escribir(tmp_path, {'a.txt': "El perro corre.", 'b.txt': "El gato salta."})
+    ruta_diario = str(tmp_path / 'diario.db')
+    _ejecutar(rutas, ruta_diario, analizador)
+    
+    _escribir(tmp_path, {'b.txt': "El gato salta sobre la mesa de la cocina."})
+    items = {item['ruta']: item for item in _ejecutar(rutas, ruta_diario, analizador)}
+    assert items[rutas[0]]['reanudado']
+    assert not items[rutas[1]].get('reanudado')
+    assert items[rutas[1]]['resultado'] == analizador.analizar(
+        "El gato salta sobre la mesa de la cocina.")
+
+
+def test_reanudar_con_otra_configuracion_reanaliza_todo(analizador, tmp_path):
+    rutas = _escribir(tmp_path, {'a.txt': "El perro corre.", 'b.txt': "El gato salta."})
+    ruta_diario = str(tmp_path / 'diario.db')
+    _ejecutar(rutas, ruta_diario, analizador)
+    
+    parametros = {
+        'version': 'prueba',
+        'coeficientes': dict(PARAMETROS_LEXILE, base=PARAMETROS_LEXILE['base'] + 50),
+        'limites_niveles': analizador.limites_niveles.tolist(),
+    }
+    otro = AnalizadorLexileChile(parametros=parametros, verbose=False)
+    otro._nlp = analizador.nlp
+    items = _ejecutar(rutas, ruta_diario, otro)
+    assert not any(item.get('reanudado') for item in items)
+    assert [item['resultado'] for item in items] == [
+        otro.analizar("El perro corre."), otro.analizar("El gato salta.")
+    ]